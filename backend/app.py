@@ -1,14 +1,30 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from core.database import engine, Base
-from modules.testing_request.routes import router as testing_router
-from modules.design_request.routes import router as design_router
-from modules.calibration_request.routes import router as calibration_router
-from modules.certification_request.routes import router as certification_router
-from modules.debugging_request.routes import router as debugging_router
-from modules.simulation_request.routes import router as simulation_router
+from core.config import get_settings
+from core.database import engine, async_engine, async_read_engine
+from core.metrics import MetricsMiddleware
+from core.query_budget import QueryBudgetMiddleware
+from core.uploads import RequestSizeLimitMiddleware
+from migrations import ensure_schema
+from modules.service_engine import routers as service_routers
+from modules.request_index.routes import router as request_index_router
+from modules.product_search.routes import router as product_search_router
+from modules.export.routes import router as export_router
+from modules.internal.routes import router as internal_router, metrics_router
 
-app = FastAPI(title="Compliance Services Platform - All Modules")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close pooled async connections (each aiosqlite connection owns a thread)
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+app = FastAPI(title="Compliance Services Platform - All Modules", lifespan=lifespan)
+
+# Added before CORS so it runs inside it and browsers can read its 413
+app.add_middleware(RequestSizeLimitMiddleware)
 
 # ✅ ADD CORS (THIS FIXES EVERYTHING)
 app.add_middleware(
@@ -19,12 +35,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-Base.metadata.create_all(bind=engine)
+# One query against schema_migrations; new databases are created, pending
+# migrations applied (or refused with AUTO_MIGRATE=off) under a lock, so
+# workers starting together do not race
+ensure_schema(engine, auto_migrate=get_settings().AUTO_MIGRATE)
 
 # Include all service routers
-app.include_router(testing_router)
-app.include_router(design_router)
-app.include_router(calibration_router)
-app.include_router(certification_router)
-app.include_router(debugging_router)
-app.include_router(simulation_router)
+for service_router in service_routers:
+    app.include_router(service_router)
+app.include_router(request_index_router)
+app.include_router(product_search_router)
+app.include_router(export_router)
+app.include_router(internal_router)
+app.add_middleware(QueryBudgetMiddleware)
+if get_settings().METRICS:
+    app.include_router(metrics_router)
+    # Outermost, so the time includes CORS and the other middleware
+    app.add_middleware(MetricsMiddleware, router=app.router)
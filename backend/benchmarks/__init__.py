@@ -0,0 +1,22 @@
+"""
+Benchmark scripts for the backend.
+
+Run from the backend/ directory, e.g.:
+    python -m benchmarks.full_request_queries
+
+Every benchmark points DATABASE_URL at a throwaway SQLite file and
+UPLOAD_DIR at a throwaway directory before importing the app, so it never
+touches database/app.db or the real document store.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+
+def use_temp_database():
+    """Point the app at a fresh temporary SQLite database and upload directory; returns the database path"""
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_"))
+    db_path = tmp_dir / "bench.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["UPLOAD_DIR"] = str(tmp_dir / "upload")
+    return db_path
@@ -0,0 +1,154 @@
+"""
+Benchmark: concurrent wizard saves through sync (threadpool) vs async routes.
+
+Every simulated user starts a request, saves product, requirements and
+standards, then fetches /full. The "sync" app serves the same services the
+old way (def handlers on a blocking Session, one threadpool worker per
+in-flight request); the "async" app is the real router, running on
+AsyncSession. Requests go through httpx's in-process ASGI transport, so
+the numbers measure the app, not the network.
+
+Usage (from backend/):
+    python -m benchmarks.async_routes [--users 300] [--service testing]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+import httpx  # noqa: E402
+from fastapi import APIRouter, Depends, FastAPI  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from core.database import engine, async_engine, Base, get_db  # noqa: E402
+from modules.service_engine import get_service, build_router, schemas  # noqa: E402
+
+PRODUCT = {
+    "eut_name": "Smart Meter", "eut_quantity": "2", "manufacturer": "Acme Labs",
+    "model_no": "SM-100", "serial_no": "SN000001", "supply_voltage": "230V",
+    "operating_frequency": "50Hz", "current": "5A", "weight": "1kg",
+    "dimensions": {"length": "100", "width": "50", "height": "20"},
+    "power_ports": "1", "signal_lines": "2", "software_name": None,
+    "software_version": None, "industry": ["Electronics"], "industry_other": None,
+    "preferred_date": None, "notes": None,
+}
+REQUIREMENTS = {"test_type": "final", "selected_tests": ["EMC Testing"]}
+STANDARDS = {"regions": ["India"], "standards": ["EN 55032 (Emissions)"]}
+
+
+def sync_app(service):
+    """The pre-async handlers: def routes on a blocking Session"""
+    prefix = f"/{service.key}-request"
+    router = APIRouter(prefix=prefix)
+
+    @router.post("/")
+    def start(db: Session = Depends(get_db)):
+        return service.create(db)
+
+    @router.post("/{request_id}/product")
+    def product(request_id: int, payload: schemas.ProductDetailsSchema, db: Session = Depends(get_db)):
+        service.save_product_details(db, request_id, payload)
+        return {"status": "saved"}
+
+    @router.post("/{request_id}/requirements")
+    def requirements(request_id: int, payload: schemas.RequirementsSchema, db: Session = Depends(get_db)):
+        service.save_requirements(db, request_id, payload)
+        return {"status": "saved"}
+
+    @router.post("/{request_id}/standards")
+    def standards(request_id: int, payload: schemas.StandardsSchema, db: Session = Depends(get_db)):
+        service.save_standards(db, request_id, payload)
+        return {"status": "saved"}
+
+    @router.get("/{request_id}/full")
+    def full(request_id: int, db: Session = Depends(get_db)):
+        return service.get_full(db, request_id)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def async_app(service):
+    app = FastAPI()
+    app.include_router(build_router(service))
+    return app
+
+
+async def wizard_session(client, prefix, latencies, errors):
+    async def call(method, path, **kwargs):
+        start = time.perf_counter()
+        response = await client.request(method, prefix + path, **kwargs)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+        return response
+
+    response = await call("POST", "/")
+    if response.status_code != 200:
+        return
+    request_id = response.json()["id"]
+    await call("POST", f"/{request_id}/product", json=PRODUCT)
+    await call("POST", f"/{request_id}/requirements", json=REQUIREMENTS)
+    await call("POST", f"/{request_id}/standards", json=STANDARDS)
+    await call("GET", f"/{request_id}/full")
+
+
+async def run(app, prefix, users):
+    latencies, errors = [], []
+    peak_threads = threading.active_count()
+    done = asyncio.Event()
+
+    async def watch_threads():
+        nonlocal peak_threads
+        while not done.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.005)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        watcher = asyncio.create_task(watch_threads())
+        start = time.perf_counter()
+        await asyncio.gather(*(wizard_session(client, prefix, latencies, errors) for _ in range(users)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await watcher
+    # aiosqlite connections belong to this event loop; close their threads
+    await async_engine.dispose()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": len(errors),
+        "threads": peak_threads,  # threadpool workers, or one per aiosqlite connection
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=300, help="concurrent wizard sessions")
+    parser.add_argument("--service", default="testing", help="service to exercise")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    service = get_service(args.service)
+    prefix = f"/{service.key}-request"
+
+    print(f"{args.users} concurrent wizard sessions ({args.service})")
+    print(f"{'routes':<8}{'requests':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}{'threads':>9}")
+    print("=" * 65)
+    for label, app in (("sync", sync_app(service)), ("async", async_app(service))):
+        r = asyncio.run(run(app, prefix, args.users))
+        print(f"{label:<8}{r['requests']:>10}{r['rps']:>10.0f}{r['p50']:>10.1f}"
+              f"{r['p95']:>10.1f}{r['errors']:>8}{r['threads']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: submitting a request step by step vs in one /bundle call.
+
+Every simulated user starts a request and then either posts product,
+documents, requirements, standards and submit separately (five round
+trips, five transactions) or posts them together to /bundle (one round
+trip, one transaction). Requests go through httpx's in-process ASGI
+transport, so the numbers measure the app, not the network; over a real
+network each saved round trip also saves its latency.
+
+Usage (from backend/):
+    python -m benchmarks.bundle_submit [--users 200] [--service testing]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from core.database import engine, async_engine, Base  # noqa: E402
+from modules.service_engine import get_service, build_router  # noqa: E402
+from benchmarks.async_routes import PRODUCT, REQUIREMENTS, STANDARDS  # noqa: E402
+
+DOCUMENTS = [{"doc_type": "manual", "file_name": "manual.pdf"}]
+LAB_SELECTION = {"selected_labs": ["Lab A"]}
+
+
+async def steps(client, prefix, request_id):
+    for path, body in (
+        ("product", PRODUCT),
+        ("documents", {"documents": DOCUMENTS}),
+        ("requirements", REQUIREMENTS),
+        ("standards", STANDARDS),
+        ("submit", LAB_SELECTION),
+    ):
+        response = await client.post(f"{prefix}/{request_id}/{path}", json=body)
+        if response.status_code != 200:
+            return False
+    return True
+
+
+async def bundle(client, prefix, request_id):
+    response = await client.post(f"{prefix}/{request_id}/bundle", json={
+        "product_details": PRODUCT,
+        "technical_documents": DOCUMENTS,
+        "requirements": REQUIREMENTS,
+        "standards": STANDARDS,
+        "lab_selection": LAB_SELECTION,
+    })
+    return response.status_code == 200
+
+
+async def run(app, prefix, users, submit):
+    latencies, errors = [], 0
+
+    async def user(client):
+        nonlocal errors
+        response = await client.post(f"{prefix}/")
+        request_id = response.json()["id"]
+        start = time.perf_counter()
+        ok = await submit(client, prefix, request_id)
+        latencies.append(time.perf_counter() - start)
+        errors += not ok
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(user(client) for _ in range(users)))
+        elapsed = time.perf_counter() - start
+    # aiosqlite connections belong to this event loop; close their threads
+    await async_engine.dispose()
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=200, help="concurrent submissions")
+    parser.add_argument("--service", default="testing", help="service to exercise")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    service = get_service(args.service)
+    prefix = f"/{service.key}-request"
+    app = FastAPI()
+    app.include_router(build_router(service))
+
+    print(f"{args.users} concurrent submissions ({args.service})")
+    print(f"{'mode':<8}{'total s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+    print("=" * 46)
+    for label, submit in (("steps", steps), ("bundle", bundle)):
+        r = asyncio.run(run(app, prefix, args.users, submit))
+        print(f"{label:<8}{r['elapsed']:>10.2f}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
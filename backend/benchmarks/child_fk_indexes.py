@@ -0,0 +1,113 @@
+"""
+Benchmark: /full latency as the child tables grow, with and without the
+<service>_request_id indexes.
+
+Seeds one service with N requests (each with product, requirements,
+standards, lab and two documents) using Core bulk inserts, then times
+get_full for random requests with the foreign-key indexes dropped and
+recreated.
+
+Usage (from backend/):
+    python -m benchmarks.child_fk_indexes [--sizes 1000 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import insert, text  # noqa: E402
+from core.database import engine, Base, SessionLocal  # noqa: E402
+from modules.service_engine import get_service  # noqa: E402
+
+SERVICE = "testing"
+BATCH = 20000
+LOOKUPS = 200
+
+
+def child_indexes(service):
+    """(name, unique, table, column) of every child-table foreign-key index"""
+    found = []
+    for model in (service.models.product, service.models.document, service.models.requirements,
+                  service.models.standards, service.models.lab):
+        for index in model.__table__.indexes:
+            found.append((index.name, index.unique, model.__tablename__, service.fk))
+    return found
+
+
+def seed(service, start, stop):
+    models, fk = service.models, service.fk
+    with engine.begin() as conn:
+        for lo in range(start, stop, BATCH):
+            ids = range(lo + 1, min(lo + BATCH, stop) + 1)
+            conn.execute(insert(models.root), [{"id": i, "status": "submitted"} for i in ids])
+            conn.execute(insert(models.product), [
+                {fk: i, "eut_name": f"EUT {i}", "manufacturer": "Acme", "model_no": f"M-{i}"} for i in ids
+            ])
+            conn.execute(insert(models.document), [
+                {fk: i, "doc_type": doc_type, "file_name": f"{doc_type}_{i}.pdf", "file_size": 1024}
+                for i in ids for doc_type in ("datasheet", "manual")
+            ])
+            conn.execute(insert(models.requirements), [{fk: i, "test_type": "final"} for i in ids])
+            conn.execute(insert(models.standards), [{fk: i, "regions": ["India"]} for i in ids])
+            conn.execute(insert(models.lab), [{fk: i, "selected_labs": ["TUV INDIA"]} for i in ids])
+
+
+def time_full(service, size):
+    ids = [random.randint(1, size) for _ in range(LOOKUPS)]
+    db = SessionLocal()
+    start = time.perf_counter()
+    for request_id in ids:
+        service.get_full(db, request_id)
+        db.expunge_all()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed / LOOKUPS * 1000
+
+
+def set_indexes(indexes, present):
+    with engine.begin() as conn:
+        for name, unique, table, column in indexes:
+            if present:
+                conn.execute(text(
+                    f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({column})"
+                ))
+            else:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        conn.execute(text("ANALYZE"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="requests in the service tables (cumulative)")
+    parser.add_argument("--skip-unindexed-above", type=int, default=100000,
+                        help="do not time unindexed lookups above this size")
+    args = parser.parse_args()
+
+    service = get_service(SERVICE)
+    Base.metadata.create_all(bind=engine)
+    indexes = child_indexes(service)
+
+    print(f"/full latency for {SERVICE} ({LOOKUPS} random lookups)")
+    print(f"{'requests':>10}{'child rows':>12}{'no index ms':>13}{'indexed ms':>12}")
+    print("=" * 47)
+    seeded = 0
+    for size in sorted(args.sizes):
+        set_indexes(indexes, present=True)
+        seed(service, seeded, size)
+        seeded = size
+
+        indexed_ms = time_full(service, size)
+        if size <= args.skip_unindexed_above:
+            set_indexes(indexes, present=False)
+            unindexed = f"{time_full(service, size):>13.3f}"
+        else:
+            unindexed = f"{'skipped':>13}"
+        print(f"{size:>10}{size * 6:>12}{unindexed}{indexed_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
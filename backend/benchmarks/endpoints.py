@@ -0,0 +1,212 @@
+"""
+Benchmark: latency of every service endpoint, in-process, at several table sizes.
+
+For each service and table size the suite times create, each wizard
+step, a document upload, submit and /full (on a cache miss and a hit)
+through the real app (middleware included) with TestClient. Every timed
+call works on its own fresh request, so the timings are independent.
+The tables are topped up to each size with bulk-imported requests.
+
+Results can be written as JSON and compared against an earlier run:
+
+    python -m benchmarks.endpoints --output before.json
+    (change the code)
+    python -m benchmarks.endpoints --output after.json --compare before.json
+
+Usage (from backend/):
+    python -m benchmarks.endpoints [--sizes 0,1000,10000] [--iterations 30]
+                                   [--services testing,calibration] [--output FILE]
+                                   [--compare FILE]
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+import sqlalchemy  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from app import app  # noqa: E402
+from core.cache import full_cache  # noqa: E402
+from core.database import SessionLocal  # noqa: E402
+from modules.service_engine import SERVICE_TYPES, get_service  # noqa: E402
+from modules.service_engine.schemas import ImportRowSchema  # noqa: E402
+from benchmarks.async_routes import PRODUCT, REQUIREMENTS, STANDARDS  # noqa: E402
+
+DOCUMENTS = {"documents": [{"doc_type": "manual", "file_name": "manual.pdf"}]}
+LAB_SELECTION = {"selected_labs": ["TUV INDIA"], "region": {"country": "India"}}
+CONFIRMATION = {"approve_plan": True, "understand_tests": True}
+APPROVAL = {"confirm_accurate": True, "confirm_approve": True, "confirm_understand": True}
+
+# (operation, method, path after /{service}-request/{id}, JSON body)
+STEPS = [
+    ("product", "POST", "product", PRODUCT),
+    ("documents", "POST", "documents", DOCUMENTS),
+    ("requirements", "POST", "requirements", REQUIREMENTS),
+    ("standards", "POST", "standards", STANDARDS),
+    ("lab_selection_draft", "POST", "lab-selection/draft", LAB_SELECTION),
+    ("submit", "POST", "submit", LAB_SELECTION),
+]
+CONFIRMATION_STEPS = [
+    ("confirmation", "POST", "confirmation", CONFIRMATION),
+    ("approval", "POST", "approval", APPROVAL),
+]
+
+SEED_BATCH = 1000
+
+
+def seed(service, count):
+    """Add `count` complete requests with the bulk import path"""
+    row = ImportRowSchema.model_validate({
+        "product_details": PRODUCT,
+        "requirements": REQUIREMENTS,
+        "standards": STANDARDS,
+        "lab_selection": LAB_SELECTION,
+    })
+    db = SessionLocal()
+    try:
+        for start in range(0, count, SEED_BATCH):
+            service.import_batch(db, [row] * min(SEED_BATCH, count - start))
+            db.commit()
+    finally:
+        db.close()
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "iterations": len(samples),
+        "min_ms": samples[0] * 1000,
+        "median_ms": statistics.median(samples) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p95_ms": samples[max(int(len(samples) * 0.95) - 1, 0)] * 1000,
+        "stdev_ms": statistics.stdev(samples) * 1000 if len(samples) > 1 else 0.0,
+    }
+
+
+def timed(client, method, url, **kwargs):
+    start = time.perf_counter()
+    response = client.request(method, url, **kwargs)
+    elapsed = time.perf_counter() - start
+    if response.status_code != 200:
+        raise RuntimeError(f"{method} {url} -> {response.status_code}: {response.text[:200]}")
+    return elapsed
+
+
+def bench_service(client, key, iterations):
+    """{operation: [seconds]} for one service at the current table size"""
+    prefix = f"/{key}-request"
+    steps = STEPS + (CONFIRMATION_STEPS if get_service(key).models.confirmation else [])
+    samples = {name: [] for name in ["create", *(step[0] for step in steps), "upload", "full_miss", "full_hit"]}
+
+    for i in range(iterations):
+        start = time.perf_counter()
+        response = client.post(f"{prefix}/")
+        samples["create"].append(time.perf_counter() - start)
+        request_id = response.json()["id"]
+        url = f"{prefix}/{request_id}"
+
+        for name, method, path, body in steps:
+            samples[name].append(timed(client, method, f"{url}/{path}", json=body))
+
+        samples["upload"].append(timed(
+            client, "POST", f"{url}/upload-documents",
+            files=[("files", ("report.txt", f"{key} {request_id} {i}".encode()))],
+            data={"doc_types": ["report"]}
+        ))
+
+        if full_cache is not None:
+            full_cache.invalidate((key, request_id))
+        samples["full_miss"].append(timed(client, "GET", f"{url}/full"))
+        samples["full_hit"].append(timed(client, "GET", f"{url}/full"))
+
+    return samples
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {
+            (r["service"], r["rows"], r["operation"]): r
+            for r in json.load(f)["results"]
+        }
+    print(f"\nmedian vs {baseline_path}")
+    print(f"{'service':<15}{'rows':>8}  {'operation':<22}{'before':>10}{'after':>10}{'change':>9}")
+    for r in results:
+        before = baseline.get((r["service"], r["rows"], r["operation"]))
+        if before is None:
+            continue
+        change = (r["median_ms"] / before["median_ms"] - 1) * 100 if before["median_ms"] else 0.0
+        print(f"{r['service']:<15}{r['rows']:>8}  {r['operation']:<22}"
+              f"{before['median_ms']:>10.2f}{r['median_ms']:>10.2f}{change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="0,1000,10000", help="requests per service table, comma separated")
+    parser.add_argument("--iterations", type=int, default=30, help="timed calls per operation and size")
+    parser.add_argument("--services", default=",".join(SERVICE_TYPES), help="comma separated")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="print the change against an earlier --output file")
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    keys = [key.strip() for key in args.services.split(",")]
+
+    results = []
+    seeded = {key: 0 for key in keys}
+    with TestClient(app) as client:
+        for size in sizes:
+            for key in keys:
+                # Earlier sizes' timed requests count towards the table size
+                if size > seeded[key]:
+                    seed(get_service(key), size - seeded[key])
+                    seeded[key] = size
+                samples = bench_service(client, key, args.iterations)
+                seeded[key] += args.iterations
+                for operation, values in samples.items():
+                    results.append({"service": key, "rows": size, "operation": operation, **summarize(values)})
+
+    print(f"{'service':<15}{'rows':>8}  {'operation':<22}{'median ms':>10}{'p95 ms':>10}{'min ms':>10}")
+    print("=" * 75)
+    for r in results:
+        print(f"{r['service']:<15}{r['rows']:>8}  {r['operation']:<22}"
+              f"{r['median_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['min_ms']:>10.2f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "meta": {
+                    "revision": git_revision(),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "sqlalchemy": sqlalchemy.__version__,
+                    "platform": platform.platform(),
+                    "sizes": sizes,
+                    "iterations": args.iterations,
+                },
+                "results": results,
+            }, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: GET /{id}/full latency with and without the response cache.
+
+Seeds requests, then fetches each one several times through the real
+router (httpx in-process ASGI transport). "uncached" invalidates the key
+before every fetch, so each one takes the miss path (query + fill);
+"cached" fetches warm entries. A review page that refreshes repeatedly
+sees the cached numbers after its first load.
+
+Usage (from backend/):
+    python -m benchmarks.full_cache [--requests 200] [--rounds 5] [--service calibration]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+# One process, so the per-process cache is right; FULL_CACHE=redis://... to measure Redis
+os.environ.setdefault("FULL_CACHE", "memory")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from core.cache import full_cache  # noqa: E402
+from core.database import engine, async_engine, Base, SessionLocal  # noqa: E402
+from modules.service_engine import get_service, build_router  # noqa: E402
+from benchmarks.full_request_queries import seed  # noqa: E402
+
+
+async def run(app, service, ids, rounds, invalidate):
+    prefix = f"/{service.key}-request"
+    latencies = []
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(rounds):
+            for request_id in ids:
+                if invalidate:
+                    full_cache.invalidate((service.key, request_id))
+                start = time.perf_counter()
+                response = await client.get(f"{prefix}/{request_id}/full")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text
+    # aiosqlite connections belong to this event loop; close their threads
+    await async_engine.dispose()
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "mean": statistics.fmean(latencies) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="requests seeded")
+    parser.add_argument("--rounds", type=int, default=5, help="fetches per request")
+    parser.add_argument("--service", default="testing", help="service to exercise")
+    args = parser.parse_args()
+
+    if full_cache is None:
+        parser.error("FULL_CACHE is off")
+
+    Base.metadata.create_all(bind=engine)
+    service = get_service(args.service)
+    db = SessionLocal()
+    try:
+        ids = seed(db, service.key, args.requests)
+    finally:
+        db.close()
+
+    app = FastAPI()
+    app.include_router(build_router(service))
+
+    print(f"GET /full, {args.requests} requests x {args.rounds} rounds ({args.service}, {full_cache.metrics.backend})")
+    print(f"{'mode':<10}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    print("=" * 40)
+    for label, invalidate in (("uncached", True), ("cached", False)):
+        r = asyncio.run(run(app, service, ids, args.rounds, invalidate))
+        print(f"{label:<10}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['mean']:>10.2f}")
+    print(full_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: SQL statements and latency of the /{id}/full fetch per service.
+
+Compares the old access pattern (root row, then one SELECT per child table)
+with the eager-loaded RequestService.get_full of the service engine.
+
+Usage (from backend/):
+    python -m benchmarks.full_request_queries [--requests 200]
+"""
+import argparse
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import event  # noqa: E402
+from core.database import engine, Base, SessionLocal  # noqa: E402
+from modules.service_engine import services as SERVICES  # noqa: E402
+
+statement_count = 0
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    global statement_count
+    statement_count += 1
+
+
+def seed(db, service, count):
+    models = SERVICES[service].models
+    root, product, document = models.root, models.product, models.document
+    requirements, standards, lab = models.requirements, models.standards, models.lab
+    fk = f"{service}_request_id"
+    ids = []
+    for i in range(count):
+        req = root(status="submitted")
+        db.add(req)
+        db.flush()
+        db.add_all([
+            product(**{fk: req.id}, eut_name=f"EUT {i}", manufacturer="Acme", model_no=f"M-{i}",
+                    industry=["Electronics"]),
+            document(**{fk: req.id}, doc_type="datasheet", file_name=f"ds_{i}.pdf", file_size=1024),
+            document(**{fk: req.id}, doc_type="manual", file_name=f"manual_{i}.pdf", file_size=2048),
+            requirements(**{fk: req.id}, test_type="final", selected_tests=["EMC Testing"]),
+            standards(**{fk: req.id}, regions=["India"], standards=["EN 55032 (Emissions)"]),
+            lab(**{fk: req.id}, selected_labs=["TUV INDIA"], region={"country": "India"}),
+        ])
+        ids.append(req.id)
+    db.commit()
+    return ids
+
+
+def lazy_fetch(db, root, request_id):
+    """Old access pattern: root row first, then each child table separately"""
+    req = db.query(root).filter(root.id == request_id).first()
+    return (req.product, req.requirements, req.standards, req.lab, list(req.documents))
+
+
+def measure(fetch, ids):
+    global statement_count
+    statement_count = 0
+    start = time.perf_counter()
+    for request_id in ids:
+        db = SessionLocal()
+        try:
+            fetch(db, request_id)
+        finally:
+            db.close()
+    elapsed = time.perf_counter() - start
+    return statement_count / len(ids), elapsed / len(ids) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="requests seeded per service")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    print(f"{'service':<15}{'old queries':>12}{'new queries':>12}{'old ms':>10}{'new ms':>10}")
+    print("=" * 59)
+    for service, engine_service in SERVICES.items():
+        root, get_full = engine_service.models.root, engine_service.get_full
+        db = SessionLocal()
+        ids = seed(db, service, args.requests)
+        db.close()
+
+        old_q, old_ms = measure(lambda db, rid: lazy_fetch(db, root, rid), ids)
+        new_q, new_ms = measure(get_full, ids)
+        print(f"{service:<15}{old_q:>12.1f}{new_q:>12.1f}{old_ms:>10.3f}{new_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
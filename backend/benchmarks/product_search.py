@@ -0,0 +1,88 @@
+"""
+Benchmark: FTS5 product search vs. LIKE '%term%' scans over product tables.
+
+Usage (from backend/):
+    python -m benchmarks.product_search [--rows 100000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import insert, or_  # noqa: E402
+from core.database import engine, Base, SessionLocal  # noqa: E402
+from modules.service_engine import get_service  # noqa: E402
+from modules.product_search.search_index import PRODUCT_TABLES  # noqa: E402
+from modules.product_search.services import search_products  # noqa: E402
+
+MANUFACTURERS = ["TechCorp Industries", "Acme Labs", "Nordic Power", "Sunrise Electronics", "Voltix"]
+PRODUCTS = ["Smart Meter", "IoT Gateway", "Motor Drive", "LED Driver", "Battery Charger", "Router"]
+QUERIES = ["smart met", "techcorp", "IOT-2", "SN000012", "nordic power", "char"]
+
+
+def seed(rows):
+    per_service = rows // len(PRODUCT_TABLES)
+    with engine.begin() as conn:
+        for service_type, (model, _) in PRODUCT_TABLES.items():
+            # Parent rows first: foreign keys are enforced
+            conn.execute(insert(get_service(service_type).models.root), [
+                {"id": i + 1, "status": "submitted"} for i in range(per_service)
+            ])
+            conn.execute(insert(model), [
+                {
+                    f"{service_type}_request_id": i + 1,
+                    "eut_name": f"{random.choice(PRODUCTS)} {i}",
+                    "manufacturer": random.choice(MANUFACTURERS),
+                    "model_no": f"IOT-{random.randint(1000, 9999)}-X{i % 10}",
+                    "serial_no": f"SN{i:08d}",
+                }
+                for i in range(per_service)
+            ])
+
+
+def like_search(db, q, limit=20):
+    results = []
+    for model, _ in PRODUCT_TABLES.values():
+        query = db.query(model)
+        for term in q.split():
+            pattern = f"%{term}%"
+            query = query.filter(or_(
+                model.eut_name.ilike(pattern),
+                model.manufacturer.ilike(pattern),
+                model.model_no.ilike(pattern),
+                model.serial_no.ilike(pattern)
+            ))
+        results.extend(query.limit(limit).all())
+    return results
+
+
+def timed(fn, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="product rows across all services")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    seed(args.rows)
+
+    db = SessionLocal()
+    print(f"{'query':<16}{'FTS5 ms':>10}{'LIKE ms':>10}")
+    print("=" * 36)
+    for q in QUERIES:
+        fts_ms = timed(lambda: search_products(db, q))
+        like_ms = timed(lambda: like_search(db, q), repeat=3)
+        print(f"{q:<16}{fts_ms:>10.2f}{like_ms:>10.2f}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
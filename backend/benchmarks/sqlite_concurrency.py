@@ -0,0 +1,130 @@
+"""
+Benchmark: concurrent wizard saves and /full reads on SQLite, default vs tuned pragmas.
+
+Writer threads save product details, requirements and standards for random
+requests while reader threads fetch full requests, the way threadpool
+workers do under load. Each profile gets a fresh database file; "default"
+is SQLite as the app used to open it, "tuned" is Settings.sqlite_pragmas().
+
+Usage (from backend/):
+    python -m benchmarks.sqlite_concurrency [--writers 8] [--readers 8] [--seconds 5]
+"""
+import argparse
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks import use_temp_database
+
+use_temp_database()
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from core.config import get_settings  # noqa: E402
+from core.database import Base, install_sqlite_pragmas  # noqa: E402
+from modules.service_engine import get_service, schemas  # noqa: E402
+
+SEED_REQUESTS = 500
+
+PRODUCT = schemas.ProductDetailsSchema(
+    eut_name="Smart Meter", eut_quantity="2", manufacturer="Acme Labs", model_no="SM-100",
+    serial_no="SN000001", supply_voltage="230V", operating_frequency="50Hz", current="5A",
+    weight="1kg", dimensions={"length": "100", "width": "50", "height": "20"},
+    power_ports="1", signal_lines="2", software_name=None, software_version=None,
+    industry=["Electronics"], industry_other=None, preferred_date=None, notes=None
+)
+REQUIREMENTS = schemas.RequirementsSchema(test_type="final", selected_tests=["EMC Testing"])
+STANDARDS = schemas.StandardsSchema(regions=["India"], standards=["EN 55032 (Emissions)"])
+
+
+def make_session_factory(pragmas):
+    db_path = Path(tempfile.mkdtemp(prefix="bench_sqlite_")) / "bench.db"
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    install_sqlite_pragmas(engine, pragmas)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+
+def worker(session_factory, service, ids, deadline, is_writer, stats, lock):
+    saves = [
+        lambda db, rid: service.save_product_details(db, rid, PRODUCT),
+        lambda db, rid: service.save_requirements(db, rid, REQUIREMENTS),
+        lambda db, rid: service.save_standards(db, rid, STANDARDS),
+    ]
+    done = errors = 0
+    while time.perf_counter() < deadline:
+        db = session_factory()
+        try:
+            request_id = random.choice(ids)
+            if is_writer:
+                random.choice(saves)(db, request_id)
+            else:
+                service.get_full(db, request_id)
+            done += 1
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            db.rollback()
+            errors += 1
+        finally:
+            db.close()
+
+    key = "writes" if is_writer else "reads"
+    with lock:
+        stats[key] += done
+        stats[f"{key}_locked"] += errors
+
+
+def run(pragmas, service_type, writers, readers, seconds):
+    session_factory = make_session_factory(pragmas)
+    service = get_service(service_type)
+
+    db = session_factory()
+    ids = [service.create(db).id for _ in range(SEED_REQUESTS)]
+    db.close()
+
+    stats = {"writes": 0, "writes_locked": 0, "reads": 0, "reads_locked": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    threads = [
+        # Each writer owns its own requests, like one user per wizard
+        threading.Thread(
+            target=worker,
+            args=(session_factory, service, ids[i::writers] if i < writers else ids,
+                  deadline, i < writers, stats, lock)
+        )
+        for i in range(writers + readers)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8, help="threads saving wizard steps")
+    parser.add_argument("--readers", type=int, default=8, help="threads fetching /full")
+    parser.add_argument("--seconds", type=float, default=5, help="duration per profile")
+    parser.add_argument("--service", default="testing", help="service to exercise")
+    args = parser.parse_args()
+
+    profiles = {"default": {}, "tuned": get_settings().sqlite_pragmas()}
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g}s per profile")
+    print(f"{'profile':<10}{'writes/s':>10}{'locked':>9}{'lock %':>8}{'reads/s':>10}{'locked':>9}")
+    print("=" * 56)
+    for label, pragmas in profiles.items():
+        s = run(pragmas, args.service, args.writers, args.readers, args.seconds)
+        attempts = s["writes"] + s["writes_locked"]
+        lock_pct = s["writes_locked"] / attempts * 100 if attempts else 0
+        print(f"{label:<10}{s['writes'] / args.seconds:>10.0f}{s['writes_locked']:>9}{lock_pct:>8.1f}"
+              f"{s['reads'] / args.seconds:>10.0f}{s['reads_locked']:>9}")
+
+
+if __name__ == "__main__":
+    main()
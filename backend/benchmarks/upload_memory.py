@@ -0,0 +1,61 @@
+"""
+Benchmark: peak Python memory while storing one large upload.
+
+Compares the old `content = file.file.read()` approach with the chunked
+core.uploads.write_upload used by the upload services.
+
+Usage (from backend/):
+    python -m benchmarks.upload_memory [--size-mb 300]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from core.uploads import write_upload
+
+
+def read_whole(source, destination):
+    with open(destination, "wb") as buffer:
+        content = source.read()
+        buffer.write(content)
+    return len(content)
+
+
+def measure(label, store, source_path, destination):
+    with open(source_path, "rb") as source:
+        tracemalloc.start()
+        start = time.perf_counter()
+        store(source, destination)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{label:<16}{peak / 1024 / 1024:>12.1f}{elapsed:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=300, help="size of the simulated upload")
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_upload_"))
+    source_path = tmp_dir / "source.bin"
+    with open(source_path, "wb") as f:
+        for _ in range(args.size_mb):
+            f.write(os.urandom(1024 * 1024))
+
+    print(f"{args.size_mb} MB upload")
+    print(f"{'strategy':<16}{'peak MB':>12}{'seconds':>10}")
+    print("=" * 38)
+    measure("read()", read_whole, source_path, tmp_dir / "old.bin")
+    measure("write_upload", write_upload, source_path, tmp_dir / "new.bin")
+
+    for path in tmp_dir.iterdir():
+        path.unlink()
+    tmp_dir.rmdir()
+
+
+if __name__ == "__main__":
+    main()
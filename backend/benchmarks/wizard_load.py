@@ -0,0 +1,269 @@
+"""
+Load test: many customers filling in the request wizards at the same time.
+
+Each virtual user runs complete wizard sessions back to back: create,
+product, upload --files documents, requirements, standards,
+(confirmation and approval on services that have them,) lab-selection
+draft, submit, then the review page's GET /full. Services are picked per
+session from --mix. The report gives p50/p95/p99 latency, error rate and
+SQLite "database is locked" errors per step.
+
+By default the app runs in-process (httpx ASGI transport) on a temporary
+SQLite database; --url drives a running server instead. In-process, lock
+errors are caught from the engines even when a route turns them into a
+plain 500; against a server only the ones a route reports in its error
+body (e.g. upload-documents) can be recognised.
+
+Usage (from backend/):
+    python -m benchmarks.wizard_load [--users 50] [--sessions 200 | --duration 60]
+                                     [--mix testing=5,calibration=3,design=2]
+                                     [--files 2] [--file-kb 64] [--think-ms 0]
+                                     [--url http://localhost:8000] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+
+from benchmarks import use_temp_database
+
+# The app is imported below only for in-process runs; keep it off app.db and the
+# real upload store either way
+use_temp_database()
+
+import httpx  # noqa: E402
+from benchmarks.async_routes import PRODUCT, REQUIREMENTS, STANDARDS  # noqa: E402
+from modules.service_engine.config import SERVICES  # noqa: E402
+
+LAB_SELECTION = {"selected_labs": ["TUV INDIA"], "region": {"country": "India"}}
+CONFIRMATION = {"approve_plan": True, "understand_tests": True}
+APPROVAL = {"confirm_accurate": True, "confirm_approve": True, "confirm_understand": True}
+CONFIRMATION_SERVICES = {key for key, config in SERVICES.items() if config.get("confirmations")}
+
+STEPS = [
+    "create", "product", "upload", "requirements", "standards",
+    "confirmation", "approval", "lab_selection_draft", "submit", "review",
+]
+
+LOCKED = "database is locked"
+
+# The step being sent, so in-process lock errors are counted against it
+current_step: ContextVar[str | None] = ContextVar("current_step", default=None)
+
+
+class StepStats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.lock_errors = 0
+        self.statuses = {}
+
+    def report(self):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+
+        def percentile(p):
+            return latencies[min(int(count * p), count - 1)] * 1000 if count else None
+
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": self.errors / count if count else 0.0,
+            "lock_errors": self.lock_errors,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "statuses": self.statuses,
+        }
+
+
+class LoadRun:
+    def __init__(self, client, mix, files, file_kb, think_ms):
+        self.client = client
+        self.services = list(mix)
+        self.weights = list(mix.values())
+        self.files = files
+        self.file_kb = file_kb
+        self.think_ms = think_ms
+        self.stats = {step: StepStats() for step in STEPS}
+        self.sessions = {"completed": 0, "failed": 0}
+
+    async def call(self, step, method, url, **kwargs):
+        stats = self.stats[step]
+        token = current_step.set(step)
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            stats.latencies.append(time.perf_counter() - start)
+            stats.errors += 1
+            stats.statuses[type(e).__name__] = stats.statuses.get(type(e).__name__, 0) + 1
+            return None
+        finally:
+            current_step.reset(token)
+        stats.latencies.append(time.perf_counter() - start)
+        stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+        if response.status_code >= 400:
+            stats.errors += 1
+            if LOCKED in response.text:
+                stats.lock_errors += 1
+            return None
+        if self.think_ms:
+            await asyncio.sleep(random.uniform(0, 2 * self.think_ms) / 1000)
+        return response
+
+    async def session(self, rng):
+        service = rng.choices(self.services, self.weights)[0]
+        prefix = f"/{service}-request"
+
+        response = await self.call("create", "POST", f"{prefix}/")
+        if response is None:
+            self.sessions["failed"] += 1
+            return
+        url = f"{prefix}/{response.json()['id']}"
+
+        steps = [
+            ("product", "POST", f"{url}/product", {"json": PRODUCT}),
+            ("upload", "POST", f"{url}/upload-documents", {
+                "files": [
+                    ("files", (f"doc_{i}.bin", os.urandom(self.file_kb * 1024)))
+                    for i in range(self.files)
+                ],
+                "data": {"doc_types": ["manual"] * self.files},
+            }),
+            ("requirements", "POST", f"{url}/requirements", {"json": REQUIREMENTS}),
+            ("standards", "POST", f"{url}/standards", {"json": STANDARDS}),
+        ]
+        if service in CONFIRMATION_SERVICES:
+            steps += [
+                ("confirmation", "POST", f"{url}/confirmation", {"json": CONFIRMATION}),
+                ("approval", "POST", f"{url}/approval", {"json": APPROVAL}),
+            ]
+        steps += [
+            ("lab_selection_draft", "POST", f"{url}/lab-selection/draft", {"json": LAB_SELECTION}),
+            ("submit", "POST", f"{url}/submit", {"json": LAB_SELECTION}),
+            ("review", "GET", f"{url}/full", {}),
+        ]
+
+        ok = True
+        for step, method, step_url, kwargs in steps:
+            if step == "upload" and not self.files:
+                continue
+            ok = await self.call(step, method, step_url, **kwargs) is not None and ok
+        self.sessions["completed" if ok else "failed"] += 1
+
+    async def user(self, seed, sessions_left, deadline):
+        rng = random.Random(seed)
+        while time.monotonic() < deadline:
+            if sessions_left is not None:
+                if sessions_left[0] <= 0:
+                    return
+                sessions_left[0] -= 1
+            await self.session(rng)
+
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(","):
+        service, _, weight = part.partition("=")
+        mix[service.strip()] = float(weight or 1)
+    return mix
+
+
+def count_lock_errors(run):
+    """Count lock errors raised inside the in-process app against the current step"""
+    from sqlalchemy import event
+    from core.database import engine, async_engine
+
+    def _on_error(context):
+        step = current_step.get()
+        if step and LOCKED in str(context.original_exception):
+            run.stats[step].lock_errors += 1
+
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "handle_error", _on_error)
+
+
+async def run_load(args, mix):
+    if args.url:
+        transport = None
+        base_url = args.url.rstrip("/")
+    else:
+        from app import app
+
+        # Every step of a load test goes over the SQL time budget; keep the output to the report
+        logging.getLogger("core.query_budget").setLevel(logging.ERROR)
+        # Let route exceptions come back as 500s, like a real server
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        base_url = "http://load"
+
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=60) as client:
+        run = LoadRun(client, mix, args.files, args.file_kb, args.think_ms)
+        if not args.url:
+            count_lock_errors(run)
+
+        sessions_left = [args.sessions] if not args.duration else None
+        deadline = time.monotonic() + (args.duration or float("inf"))
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            run.user(seed, sessions_left, deadline) for seed in range(args.users)
+        ))
+        elapsed = time.perf_counter() - start
+
+    if not args.url:
+        from core.database import async_engine
+
+        # aiosqlite connections belong to this event loop; close their threads
+        await async_engine.dispose()
+    return run, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("--sessions", type=int, default=200, help="wizard sessions in total")
+    parser.add_argument("--duration", type=float, help="run for this many seconds instead of --sessions")
+    parser.add_argument("--mix", default="testing=5,calibration=3,design=2",
+                        help="service=weight pairs a session's service is drawn from")
+    parser.add_argument("--files", type=int, default=2, help="documents uploaded per session")
+    parser.add_argument("--file-kb", type=int, default=64, help="size of each document")
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause after each step")
+    parser.add_argument("--url", help="base URL of a running server (default: in-process)")
+    parser.add_argument("--output", help="write the report to this JSON file")
+    args = parser.parse_args()
+    mix = parse_mix(args.mix)
+    unknown = set(mix) - set(SERVICES)
+    if unknown:
+        parser.error(f"unknown service {', '.join(sorted(unknown))}; choose from {', '.join(SERVICES)}")
+
+    run, elapsed = asyncio.run(run_load(args, mix))
+
+    report = {step: stats.report() for step, stats in run.stats.items() if stats.latencies}
+    total = sum(r["requests"] for r in report.values())
+    print(f"{args.users} users, {sum(run.sessions.values())} sessions "
+          f"({run.sessions['failed']} failed) in {elapsed:.1f}s, {total / elapsed:.0f} req/s, "
+          f"mix {args.mix}, target {args.url or 'in-process'}")
+    print(f"{'step':<22}{'requests':>9}{'errors':>8}{'err %':>7}{'locked':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    print("=" * 81)
+    for step, r in report.items():
+        print(f"{step:<22}{r['requests']:>9}{r['errors']:>8}{r['error_rate'] * 100:>7.1f}{r['lock_errors']:>8}"
+              f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "config": {**vars(args), "mix": mix},
+                "elapsed_seconds": elapsed,
+                "requests_per_second": total / elapsed,
+                "sessions": run.sessions,
+                "steps": report,
+            }, f, indent=2, default=str)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Shared pytest fixtures and wizard step bodies. The app runs in-process on a throwaway SQLite
+database and upload directory, so tests never touch database/app.db or
+the real document store.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+TEST_DIR = Path(tempfile.mkdtemp(prefix="tests_"))
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR / 'test.db'}"
+os.environ["UPLOAD_DIR"] = str(TEST_DIR / "upload")
+# One in-process app, so the per-process /full cache is exercised
+os.environ["FULL_CACHE"] = "memory"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+# Valid bodies for the wizard steps; tests import them from here
+PRODUCT = {
+    "eut_name": "Smart Meter", "eut_quantity": "1", "manufacturer": "Acme Labs",
+    "model_no": "SM-100", "serial_no": "SN1", "supply_voltage": "230V",
+    "operating_frequency": None, "current": "5A", "weight": "1kg",
+    "dimensions": {"length": "100", "width": "50", "height": "20"},
+    "power_ports": "1", "signal_lines": "2", "software_name": None,
+    "software_version": None, "industry": ["Electronics"], "industry_other": None,
+    "preferred_date": None, "notes": None,
+}
+REQUIREMENTS = {"test_type": "final", "selected_tests": ["EMC Testing"]}
+STANDARDS = {"regions": ["India"], "standards": ["EN 55032 (Emissions)"]}
+LAB_SELECTION = {"selected_labs": ["TUV INDIA"]}
+CONFIRMATION = {"approve_plan": True, "understand_tests": True}
+APPROVAL = {"confirm_accurate": True, "confirm_approve": True, "confirm_understand": True}
+
+
+@pytest.fixture(scope="session")
+def client():
+    from app import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Fail when the block runs more SQL statements than allowed:
+
+        def test_full(client, max_queries):
+            with max_queries(3):
+                client.get("/testing-request/1/full")
+    """
+    from core.database import count_queries
+
+    @contextmanager
+    def check(limit):
+        with count_queries() as stats:
+            yield stats
+        assert stats.statements <= limit, (
+            f"{stats.statements} SQL statements, expected at most {limit}:\n"
+            + "\n".join(f"{count} x {statement}" for statement, count in stats.by_statement.items())
+        )
+
+    return check
@@ -0,0 +1,31 @@
+from typing import Dict, Iterable, List
+from pydantic import BaseModel, Field
+
+# selectinload splits IN lists at 500 ids, so keep a batch within one chunk
+MAX_BATCH_SIZE = 500
+
+
+class BatchIdsSchema(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+def batch_results(ids: Iterable[int], results: Dict[int, dict]):
+    """
+    {"results": [...], "not_found": [...]} in the order of `ids`, duplicates
+    dropped. MAX_BATCH_SIZE bounds the response, so it is built in one piece.
+    """
+    found = []
+    not_found = []
+    seen = set()
+
+    for request_id in ids:
+        if request_id in seen:
+            continue
+        seen.add(request_id)
+
+        data = results.get(request_id)
+        if data is None:
+            not_found.append(request_id)
+        else:
+            found.append(data)
+    return {"results": found, "not_found": not_found}
@@ -0,0 +1,218 @@
+"""
+Cache for GET /{service}-request/{id}/full responses.
+
+Entries are keyed by (service type, request id). update_request_index marks
+every request a session writes, and the entries are dropped once that
+session commits, so a cached response never outlives a saved step.
+
+A read that misses takes a fill token before querying and stores its
+result with it; invalidating the key in between voids the token, so a
+slow read that started before a write cannot put the old data back.
+
+Off by default. FULL_CACHE=memory keeps an LRU+TTL cache in each worker
+process and is only right with a single worker: a save invalidates the
+cache of the worker that handled it, and the others would keep serving the
+old review page for up to FULL_CACHE_TTL. With several workers use
+FULL_CACHE=redis://... so every worker sees the invalidations (needs the
+redis package).
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from core.config import get_settings
+
+# Session.info key holding the (service type, request id) pairs written
+WRITTEN_REQUESTS = "written_requests"
+
+
+class CacheMetrics:
+    def __init__(self, backend):
+        self._lock = threading.Lock()
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.stale_stores = 0  # fills dropped because the key was invalidated meanwhile
+        self.invalidations = 0
+        self.evictions = 0
+
+    def count(self, name, n=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def snapshot(self, size=None):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend,
+                "size": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "stale_stores": self.stale_stores,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+class MemoryCache:
+    """In-process LRU cache whose entries also expire after `ttl` seconds"""
+
+    def __init__(self, maxsize, ttl):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._fills = {}  # key -> token of the read allowed to store it
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.metrics = CacheMetrics("memory")
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                value = entry[1]
+            else:
+                if entry:
+                    del self._entries[key]
+                value = None
+        self.metrics.count("hits" if value is not None else "misses")
+        return value
+
+    def fill_token(self, key):
+        token = object()
+        with self._lock:
+            self._fills[key] = token
+        return token
+
+    def set(self, key, value, token):
+        with self._lock:
+            if self._fills.get(key) is not token:
+                stale = True
+            else:
+                stale = False
+                del self._fills[key]
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                evicted = 0
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    evicted += 1
+        if stale:
+            self.metrics.count("stale_stores")
+            return
+        self.metrics.count("stores")
+        if evicted:
+            self.metrics.count("evictions", evicted)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._fills.pop(key, None)
+        self.metrics.count("invalidations")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fills.clear()
+
+    def stats(self):
+        return self.metrics.snapshot(len(self._entries))
+
+
+class RedisCache:
+    """
+    The same interface on Redis: values are JSON with a TTL, and a
+    per-key version counter stands in for the fill tokens.
+    """
+
+    def __init__(self, url, ttl, prefix="full:"):
+        import redis
+
+        self._redis = redis
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.metrics = CacheMetrics("redis")
+
+    def _keys(self, key):
+        name = f"{self.prefix}{key[0]}:{key[1]}"
+        return name, f"{name}:version"
+
+    def get(self, key):
+        raw = self.client.get(self._keys(key)[0])
+        self.metrics.count("hits" if raw is not None else "misses")
+        return json.loads(raw) if raw is not None else None
+
+    def fill_token(self, key):
+        return self.client.get(self._keys(key)[1])
+
+    def set(self, key, value, token):
+        name, version = self._keys(key)
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(version)
+                if pipe.get(version) != token:
+                    self.metrics.count("stale_stores")
+                    return
+                pipe.multi()
+                pipe.set(name, json.dumps(value), ex=max(int(self.ttl), 1))
+                pipe.execute()
+            except self._redis.WatchError:
+                self.metrics.count("stale_stores")
+                return
+        self.metrics.count("stores")
+
+    def invalidate(self, key):
+        name, version = self._keys(key)
+        with self.client.pipeline() as pipe:
+            pipe.incr(version)
+            # Outlives any entry filled with the previous version
+            pipe.expire(version, max(int(self.ttl), 1) * 2)
+            pipe.delete(name)
+            pipe.execute()
+        self.metrics.count("invalidations")
+
+    def clear(self):
+        for name in self.client.scan_iter(f"{self.prefix}*"):
+            self.client.delete(name)
+
+    def stats(self):
+        return self.metrics.snapshot()
+
+
+def build_cache(settings):
+    """The FULL_CACHE backend, or None when caching is off"""
+    backend = settings.FULL_CACHE
+    if backend == "off":
+        return None
+    if backend.startswith(("redis://", "rediss://", "unix://")):
+        return RedisCache(backend, settings.FULL_CACHE_TTL)
+    if backend == "memory":
+        return MemoryCache(settings.FULL_CACHE_SIZE, settings.FULL_CACHE_TTL)
+    raise ValueError(f"FULL_CACHE must be memory, off or a redis:// URL, not '{backend}'")
+
+
+full_cache = build_cache(get_settings())
+
+
+def mark_written(db: Session, key):
+    """Invalidate `key` when this session's transaction commits"""
+    db.info.setdefault(WRITTEN_REQUESTS, set()).add(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written(session):
+    written = session.info.pop(WRITTEN_REQUESTS, ())
+    if full_cache is not None:
+        for key in written:
+            full_cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written(session):
+    session.info.pop(WRITTEN_REQUESTS, None)
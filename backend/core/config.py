@@ -1,5 +1,8 @@
 import os
 from functools import lru_cache
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
 
 class Settings:
     APP_NAME: str = "Testing Request Platform"
@@ -10,6 +13,91 @@ class Settings:
         "sqlite:///database/app.db"
     )
 
+    # Apply pending migrations at startup; turn off when deploys run
+    # `python -m migrations` once before starting the workers
+    AUTO_MIGRATE: bool = os.getenv("AUTO_MIGRATE", "on").lower() != "off"
+
+    # Optional read replica for GET routes (core/database.py); empty = use DATABASE_URL
+    DATABASE_READ_URL: str = os.getenv("DATABASE_READ_URL", "")
+    # After a write, reads of that request go to the primary for this many seconds
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+    # Where those pins are kept: "memory" (per worker process) or a redis:// URL
+    # shared by all workers. Empty = FULL_CACHE's Redis if it is one, else memory.
+    READ_YOUR_WRITES_STORE: str = os.getenv("READ_YOUR_WRITES_STORE", "")
+
+    # Cache for GET /{service}-request/{id}/full (core/cache.py): "off", a
+    # redis:// URL shared by all workers, or "memory" (per worker process; only
+    # for a single worker, as other workers would not see a save's invalidation)
+    FULL_CACHE: str = os.getenv("FULL_CACHE", "off")
+    FULL_CACHE_SIZE: int = int(os.getenv("FULL_CACHE_SIZE", "2048"))
+    # Seconds before an entry expires even if nothing invalidated it
+    FULL_CACHE_TTL: float = float(os.getenv("FULL_CACHE_TTL", "300"))
+
+    # Per-route request metrics at GET /metrics (core/metrics.py)
+    METRICS: bool = os.getenv("METRICS", "on").lower() != "off"
+
+    # Statement budget per HTTP request (core/query_budget.py); requests over
+    # a budget, or running one SELECT DB_REPEATED_STATEMENT_LIMIT times
+    # (a likely N+1), log a warning.
+    DB_QUERY_BUDGET: int = int(os.getenv("DB_QUERY_BUDGET", "25"))
+    DB_TIME_BUDGET_MS: float = float(os.getenv("DB_TIME_BUDGET_MS", "500"))
+    DB_REPEATED_STATEMENT_LIMIT: int = int(os.getenv("DB_REPEATED_STATEMENT_LIMIT", "5"))
+    # Add X-DB-Statements and X-DB-Time-Ms headers to every response; they
+    # tell any client how much SQL a request ran, so keep off in production
+    DB_QUERY_HEADERS: bool = os.getenv("DB_QUERY_HEADERS", "off").lower() == "on"
+
+    # Root of the document store: blobs/ (stored files) and sessions/
+    # (resumable uploads in progress)
+    UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", str(BACKEND_DIR / "database" / "upload"))
+    # Resumable uploads not completed within this many hours are deleted
+    UPLOAD_SESSION_TTL_HOURS: float = float(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))
+
+    # Largest single document accepted by the upload endpoints, in bytes
+    MAX_UPLOAD_SIZE: int = int(os.getenv("MAX_UPLOAD_SIZE", str(500 * 1024 * 1024)))
+    # Largest request body of any route, enforced (core/uploads.py) before
+    # multipart parsing spools it to disk. Default: one MAX_UPLOAD_SIZE document
+    # plus the form fields; raise it to take several in one upload-documents call.
+    MAX_REQUEST_SIZE: int = int(os.getenv("MAX_REQUEST_SIZE", str(MAX_UPLOAD_SIZE + 1024 * 1024)))
+
+    # Connection pool (core/pool.py). DB_POOL_CLASS=queue|null|static overrides
+    # the per-dialect default; size/overflow/timeout apply to QueuePool only.
+    DB_POOL_CLASS: str = os.getenv("DB_POOL_CLASS", "").lower()
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds to wait for a free connection before failing the request
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Replace connections older than this many seconds; -1 keeps them forever
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Test each connection on checkout so dropped server connections are replaced
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "on").lower() != "off"
+
+    # SQLite pragma profile, applied to every new connection (core/database.py).
+    # Set SQLITE_PRAGMAS=off to run on SQLite's defaults.
+    SQLITE_PRAGMAS: bool = os.getenv("SQLITE_PRAGMAS", "on").lower() != "off"
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    # Negative values are KiB, positive values are pages
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", str(-64 * 1024)))
+    SQLITE_TEMP_STORE: str = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    # Milliseconds a connection waits for a lock before "database is locked"
+    SQLITE_BUSY_TIMEOUT: int = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))
+    SQLITE_FOREIGN_KEYS: bool = os.getenv("SQLITE_FOREIGN_KEYS", "on").lower() != "off"
+
+    def sqlite_pragmas(self):
+        """Pragmas to run on each new SQLite connection, in order"""
+        if not self.SQLITE_PRAGMAS:
+            return {}
+        return {
+            "journal_mode": self.SQLITE_JOURNAL_MODE,
+            "synchronous": self.SQLITE_SYNCHRONOUS,
+            "mmap_size": self.SQLITE_MMAP_SIZE,
+            "cache_size": self.SQLITE_CACHE_SIZE,
+            "temp_store": self.SQLITE_TEMP_STORE,
+            "busy_timeout": self.SQLITE_BUSY_TIMEOUT,
+            "foreign_keys": "ON" if self.SQLITE_FOREIGN_KEYS else "OFF",
+        }
+
 @lru_cache()
 def get_settings():
     return Settings()
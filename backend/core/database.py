@@ -1,15 +1,247 @@
-from sqlalchemy import create_engine
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 from core.config import get_settings
+from core.pool import engine_options
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+REDIS_SCHEMES = ("redis://", "rediss://", "unix://")
+
+# Async drivers for the sync DATABASE_URL dialects
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """sqlite:///... -> sqlite+aiosqlite:///..., postgresql://... -> postgresql+asyncpg://..."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def install_sqlite_pragmas(engine, pragmas):
+    """
+    Run `pragmas` ({name: value}) on every new connection of a SQLite engine.
+    Works for the sync and the async (aiosqlite) engine; others are left alone.
+    """
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+class QueryStats:
+    """Statements run and seconds spent executing them during one HTTP request"""
+    __slots__ = ("statements", "seconds", "by_statement")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+        self.by_statement = {}  # SQL text -> times run
+
+    def add(self, statement, seconds):
+        self.statements += 1
+        self.seconds += seconds
+        self.by_statement[statement] = self.by_statement.get(statement, 0) + 1
+
+    def repeated_selects(self, limit):
+        """
+        [(SQL text, times run)] for SELECTs run at least `limit` times, most
+        first: the signature of an N+1 loop. Repeated writes are left out;
+        per-item INSERTs (one per uploaded file) are expected.
+        """
+        return sorted(
+            (
+                (statement, count) for statement, count in self.by_statement.items()
+                if count >= limit and statement.lstrip()[:6].upper() == "SELECT"
+            ),
+            key=lambda item: -item[1]
+        )
+
+
+# Set by the metrics middleware (core/metrics.py) for the request being served;
+# the threadpool and run_sync greenlets inherit it, so every query is counted
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def install_query_stats(engine):
+    """Add each statement's count and execution time to current_query_stats"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        # Kept on the execution context, which is discarded if the statement fails
+        context.query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.add(statement, time.perf_counter() - context.query_started)
+
+
+@contextmanager
+def count_queries():
+    """
+    Count every statement run on any engine inside the block, from any
+    thread (a TestClient serves requests on its own thread):
+
+        with count_queries() as stats:
+            client.get("/testing-request/1/full")
+        assert stats.statements <= 3
+    """
+    stats = QueryStats()
+    engines = {engine, async_engine.sync_engine, read_engine, async_read_engine.sync_engine}
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        stats.add(statement, 0.0)
+
+    for target in engines:
+        event.listen(target, "before_cursor_execute", _count)
+    try:
+        yield stats
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", _count)
+
+
+def build_engines(database_url):
+    """Sync and async engine for one database, with the pool options and pragmas from Settings"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # Each engine would open its own empty database; the schema is only created on the sync one
+        raise ValueError(
+            f"In-memory SQLite ({url}) is not supported: the sync and async engines cannot share "
+            "it. Use a database file, e.g. sqlite:////tmp/app.db"
+        )
+
+    sync_engine = create_engine(
+        database_url,
+        **engine_options(database_url, settings)
+    )
+    install_sqlite_pragmas(sync_engine, settings.sqlite_pragmas())
+    install_query_stats(sync_engine)
+
+    # Used by the async routes; waiting on the database does not hold a threadpool worker
+    async_engine = create_async_engine(
+        async_database_url(database_url),
+        **engine_options(database_url, settings, is_async=True)
+    )
+    install_sqlite_pragmas(async_engine.sync_engine, settings.sqlite_pragmas())
+    install_query_stats(async_engine.sync_engine)
+    return sync_engine, async_engine
+
+
+class PrimaryPins:
+    """
+    Read-your-writes for replica routing: keys (e.g. ("testing", 42)) written
+    in the last `seconds` are read from the primary instead of the replica.
+    Kept per process, so only right with a single worker; see RedisPrimaryPins.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self._expires = {}
+        self._lock = threading.Lock()
+
+    def pin(self, key):
+        with self._lock:
+            self._expires[key] = time.monotonic() + self.seconds
+
+    def is_pinned(self, key):
+        now = time.monotonic()
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if expires <= now:
+                del self._expires[key]
+                return False
+            return True
+
+
+class RedisPrimaryPins:
+    """
+    The same pins in Redis, so a read on any worker sees a write made
+    through any other: one key per pinned request, expiring after `seconds`.
+    """
+
+    def __init__(self, url, seconds, prefix="pin:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.seconds = seconds
+        self.prefix = prefix
+
+    def _name(self, key):
+        return self.prefix + ":".join(str(part) for part in key)
+
+    def pin(self, key):
+        self.client.set(self._name(key), 1, px=max(int(self.seconds * 1000), 1))
+
+    def is_pinned(self, key):
+        return bool(self.client.exists(self._name(key)))
+
+
+def build_primary_pins(settings):
+    """The READ_YOUR_WRITES_STORE backend"""
+    store = settings.READ_YOUR_WRITES_STORE
+    if not store and settings.FULL_CACHE.startswith(REDIS_SCHEMES):
+        store = settings.FULL_CACHE
+    if store.startswith(REDIS_SCHEMES):
+        return RedisPrimaryPins(store, settings.READ_YOUR_WRITES_SECONDS)
+    if store in ("", "memory"):
+        if settings.DATABASE_READ_URL:
+            logger.warning(
+                "Read-your-writes pins are kept per process; with several workers "
+                "set READ_YOUR_WRITES_STORE to a redis:// URL"
+            )
+        return PrimaryPins(settings.READ_YOUR_WRITES_SECONDS)
+    raise ValueError(f"READ_YOUR_WRITES_STORE must be memory or a redis:// URL, not '{store}'")
+
+
+# Primary: every write, and reads of recently written requests
+engine, async_engine = build_engines(settings.DATABASE_URL)
+
+# Replica for GET routes; without DATABASE_READ_URL reads use the primary
+if settings.DATABASE_READ_URL:
+    read_engine, async_read_engine = build_engines(settings.DATABASE_READ_URL)
+else:
+    read_engine, async_read_engine = engine, async_engine
+
+primary_pins = build_primary_pins(settings)
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 Base = declarative_base()
 
@@ -19,3 +251,30 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def read_session(pin_key=None):
+    """A session on the replica, or on the primary if `pin_key` was just written"""
+    if pin_key is not None and primary_pins.is_pinned(pin_key):
+        return SessionLocal()
+    return ReadSessionLocal()
+
+def async_read_session(pin_key=None):
+    """Async counterpart of read_session()"""
+    if pin_key is not None and primary_pins.is_pinned(pin_key):
+        return AsyncSessionLocal()
+    return AsyncReadSessionLocal()
+
+def get_read_db():
+    db = read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_read_db():
+    async with async_read_session() as db:
+        yield db
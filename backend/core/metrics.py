@@ -0,0 +1,175 @@
+"""
+Per-route HTTP metrics in Prometheus text format (GET /metrics).
+
+MetricsMiddleware is plain ASGI, so streamed responses are measured to
+their last byte. Routes are labeled by their template
+(/testing-request/{testing_request_id}/full), never by the raw path, so
+the number of series stays fixed; paths that match no route share the
+"unmatched" label.
+
+Everything is recorded from the middleware, which only runs on the event
+loop thread, so the counters need no locks. The DB time comes from
+core.database.QueryStats, which threadpool workers and greenlets add to
+for the request they serve. Each worker process keeps its own numbers.
+"""
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from core.database import QueryStats, current_query_stats
+
+# Upper bounds in seconds; +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds in bytes
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+UNMATCHED = "unmatched"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+        cumulative += self.counts[-1]
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}'
+        yield f"{name}_sum{{{labels}}} {self.sum}"
+        yield f"{name}_count{{{labels}}} {cumulative}"
+
+
+class RouteMetrics:
+    __slots__ = ("in_flight", "responses", "latency", "size", "db_seconds", "db_statements")
+
+    def __init__(self):
+        self.in_flight = 0
+        self.responses = {}  # status code -> count
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.db_seconds = 0.0
+        self.db_statements = 0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes = {}  # (method, route template) -> RouteMetrics
+
+    def route(self, method, template):
+        key = (method, template)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        return metrics
+
+    def render(self):
+        """The registry in Prometheus text exposition format"""
+        families = {
+            "http_requests_total": ("counter", "Responses sent, by status code", []),
+            "http_requests_in_flight": ("gauge", "Requests being served", []),
+            "http_request_duration_seconds": ("histogram", "Time to the last response byte", []),
+            "http_response_size_bytes": ("histogram", "Response body size", []),
+            "http_request_db_seconds_total": ("counter", "Time spent executing SQL statements", []),
+            "http_request_db_statements_total": ("counter", "SQL statements executed", []),
+        }
+        for (method, template), metrics in sorted(self.routes.items()):
+            labels = f'method="{method}",route="{_escape(template)}"'
+            for status, count in sorted(metrics.responses.items()):
+                families["http_requests_total"][2].append(
+                    f'http_requests_total{{{labels},status="{status}"}} {count}'
+                )
+            families["http_requests_in_flight"][2].append(
+                f"http_requests_in_flight{{{labels}}} {metrics.in_flight}"
+            )
+            families["http_request_duration_seconds"][2].extend(
+                metrics.latency.lines("http_request_duration_seconds", labels)
+            )
+            families["http_response_size_bytes"][2].extend(
+                metrics.size.lines("http_response_size_bytes", labels)
+            )
+            families["http_request_db_seconds_total"][2].append(
+                f"http_request_db_seconds_total{{{labels}}} {metrics.db_seconds}"
+            )
+            families["http_request_db_statements_total"][2].append(
+                f"http_request_db_statements_total{{{labels}}} {metrics.db_statements}"
+            )
+
+        lines = []
+        for name, (kind, help_text, samples) in families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """Record every HTTP request of `router` into `registry`"""
+
+    def __init__(self, app, router, registry=registry):
+        self.app = app
+        self.registry = registry
+        self._routes = [
+            (route.path_regex, getattr(route, "methods", None), route.path)
+            for route in router.routes
+            if hasattr(route, "path_regex")
+        ]
+        self.template = lru_cache(maxsize=4096)(self._template)
+
+    def _template(self, method, path):
+        """The route template `path` is served by, matched the way the router does"""
+        fallback = UNMATCHED
+        for regex, methods, template in self._routes:
+            if regex.match(path):
+                if methods is None or method in methods:
+                    return template
+                fallback = template  # answered with 405
+        return fallback
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        metrics = self.registry.route(method, self.template(method, scope["path"]))
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.latency.observe(time.perf_counter() - start)
+            metrics.in_flight -= 1
+            metrics.responses[status] = metrics.responses.get(status, 0) + 1
+            metrics.size.observe(size)
+            metrics.db_seconds += stats.seconds
+            metrics.db_statements += stats.statements
+            current_query_stats.reset(token)
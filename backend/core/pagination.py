@@ -0,0 +1,39 @@
+from sqlalchemy import and_, or_, select
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def keyset_page(query, model, after_id=None, limit=DEFAULT_PAGE_SIZE, sort_column=None):
+    """
+    Return one page of `query`, newest first, ordered by (sort_column, id).
+    sort_column defaults to model.created_at.
+
+    Instead of OFFSET, the page starts right after the row `after_id`, so the
+    database seeks straight into the (…, sort_column, id) index and the cost of
+    a page does not grow with how deep the client has paged.
+    """
+    if sort_column is None:
+        sort_column = model.created_at
+
+    if after_id is not None:
+        # Compare against the cursor row's stored value (not a re-bound
+        # Python datetime) so SQLite compares identical text representations.
+        cursor_value = select(sort_column).where(
+            model.id == after_id
+        ).scalar_subquery()
+
+        query = query.filter(or_(
+            sort_column < cursor_value,
+            and_(sort_column == cursor_value, model.id < after_id)
+        ))
+
+    rows = query.order_by(
+        sort_column.desc(),
+        model.id.desc()
+    ).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_after_id = rows[-1].id if has_more else None
+    return rows, next_after_id
@@ -0,0 +1,127 @@
+import threading
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
+
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+}
+
+
+class PoolMetrics:
+    """Counters for one engine's pool; updated on every connection checkout"""
+
+    def __init__(self, pool_class_name):
+        self._lock = threading.Lock()
+        self.pool_class_name = pool_class_name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.peak_checked_out = 0
+
+    def record(self, seconds, checked_out, timed_out=False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if checked_out is not None:
+                self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def snapshot(self, pool):
+        def gauge(name):
+            # QueuePool reports these; StaticPool and NullPool do not
+            method = getattr(pool, name, None)
+            return method() if method else None
+
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            return {
+                "pool_class": self.pool_class_name,
+                "size": gauge("size"),
+                "checked_in": gauge("checkedin"),
+                "checked_out": gauge("checkedout"),
+                # QueuePool counts overflow from -size; report connections beyond size
+                "overflow": max(gauge("overflow"), 0) if gauge("overflow") is not None else None,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": self.wait_seconds_total / waits * 1000 if waits else 0.0,
+                "wait_ms_max": self.wait_seconds_max * 1000,
+            }
+
+
+class _MeteredPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        # Time spent here is the wait for a free connection (or to open one)
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record(time.perf_counter() - start, None, timed_out=True)
+            raise
+        checkedout = getattr(self, "checkedout", None)
+        self.metrics.record(time.perf_counter() - start, checkedout() if checkedout else None)
+        return connection
+
+
+def _metered(pool_class):
+    # A fresh subclass per engine; the class attribute survives pool.recreate()
+    return type(f"Metered{pool_class.__name__}", (_MeteredPoolMixin, pool_class), {
+        "metrics": PoolMetrics(pool_class.__name__)
+    })
+
+
+def engine_options(database_url, settings, is_async=False):
+    """
+    create_engine()/create_async_engine() keyword arguments for DATABASE_URL:
+
+    - in-memory SQLite: StaticPool, so the engine's connections share its one
+      database (build_engines refuses these URLs: a second engine, such as the
+      async one, would still get a database of its own)
+    - SQLite file: QueuePool (AsyncAdaptedQueuePool for aiosqlite)
+    - server databases: QueuePool sized by DB_POOL_SIZE / DB_MAX_OVERFLOW
+
+    DB_POOL_CLASS=queue|null|static overrides the choice, e.g. "null" behind PgBouncer.
+    """
+    url = make_url(database_url)
+    is_sqlite = url.get_backend_name() == "sqlite"
+
+    if settings.DB_POOL_CLASS:
+        pool_class = POOL_CLASSES[settings.DB_POOL_CLASS]
+    elif is_sqlite and url.database in (None, "", ":memory:"):
+        pool_class = StaticPool
+    else:
+        pool_class = QueuePool
+
+    if pool_class is QueuePool and is_async:
+        pool_class = AsyncAdaptedQueuePool
+
+    options = {
+        "poolclass": _metered(pool_class),
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if issubclass(pool_class, QueuePool):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    if is_sqlite and not is_async:
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def pool_metrics(engine):
+    """Current pool gauges and counters of an engine created with engine_options()"""
+    pool = engine.pool
+    return pool.metrics.snapshot(pool)
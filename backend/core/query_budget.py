@@ -0,0 +1,84 @@
+"""
+Per-request SQL budgets.
+
+QueryBudgetMiddleware looks at the statements each HTTP request ran
+(core.database.QueryStats) and logs a warning when a request goes over
+DB_QUERY_BUDGET statements or DB_TIME_BUDGET_MS, or runs the same
+SELECT DB_REPEATED_STATEMENT_LIMIT times or more, which is what an N+1
+loop looks like. With DB_QUERY_HEADERS on, every response also carries
+X-DB-Statements and X-DB-Time-Ms headers.
+
+Routes whose statement count grows with their input by design declare
+their own budget with @query_budget(n), or @query_budget(None) for none.
+"""
+import logging
+from core.config import get_settings
+from core.database import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+def query_budget(statements):
+    """Override DB_QUERY_BUDGET for one route; None disables the checks"""
+    def decorate(endpoint):
+        endpoint.query_budget = statements
+        return endpoint
+    return decorate
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, app, settings=None):
+        settings = settings or get_settings()
+        self.app = app
+        self.headers = settings.DB_QUERY_HEADERS
+        self.budget = settings.DB_QUERY_BUDGET
+        self.time_budget = settings.DB_TIME_BUDGET_MS / 1000
+        self.repeat_limit = settings.DB_REPEATED_STATEMENT_LIMIT
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Share the metrics middleware's stats when it runs outside this one
+        stats = current_query_stats.get()
+        token = None
+        if stats is None:
+            stats = QueryStats()
+            token = current_query_stats.set(stats)
+
+        async def send_wrapper(message):
+            if self.headers and message["type"] == "http.response.start":
+                # A streamed body may run more statements after this point
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-db-statements", str(stats.statements).encode()),
+                    (b"x-db-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if token is not None:
+                current_query_stats.reset(token)
+        self.check(scope, stats)
+
+    def check(self, scope, stats):
+        route = scope.get("route")
+        budget = getattr(getattr(route, "endpoint", None), "query_budget", self.budget)
+        if budget is None:
+            return
+        name = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+        if stats.statements > budget:
+            logger.warning("%s ran %d SQL statements (budget %d)", name, stats.statements, budget)
+        if stats.seconds > self.time_budget:
+            logger.warning(
+                "%s spent %.0f ms in SQL (budget %.0f ms)",
+                name, stats.seconds * 1000, self.time_budget * 1000
+            )
+        for statement, count in stats.repeated_selects(self.repeat_limit):
+            logger.warning(
+                "%s ran the same statement %d times, likely an N+1 query: %s",
+                name, count, " ".join(statement.split())[:200]
+            )
@@ -0,0 +1,85 @@
+import hashlib
+from pathlib import Path
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from core.config import get_settings
+
+# Large enough to keep syscall overhead low, small enough to keep memory flat
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+def write_upload(source, destination: Path, max_size: int | None = None):
+    """
+    Copy a file-like object to destination in UPLOAD_CHUNK_SIZE pieces,
+    computing size and SHA-256 on the way. A partial file is removed if the
+    copy fails or exceeds max_size.
+    Returns (size_in_bytes, sha256_hex).
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(destination, "wb") as buffer:
+            while True:
+                chunk = source.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise UploadTooLargeError(
+                        f"File exceeds the maximum upload size of {max_size} bytes"
+                    )
+
+                digest.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        destination.unlink(missing_ok=True)
+        raise
+
+    return size, digest.hexdigest()
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Answer 413 to request bodies over MAX_REQUEST_SIZE: at once when
+    Content-Length says so, otherwise as soon as the streamed body passes
+    the limit, before multipart parsing has spooled it all to disk.
+    """
+
+    def __init__(self, app, max_size=None):
+        self.app = app
+        self.max_size = max_size if max_size is not None else get_settings().MAX_REQUEST_SIZE
+
+    def _too_large(self):
+        return f"Request body exceeds the maximum size of {self.max_size} bytes"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_size:
+            response = JSONResponse({"detail": self._too_large()}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    # Raised inside the route's body parsing or request.stream(),
+                    # so FastAPI turns it into the response
+                    raise HTTPException(status_code=413, detail=self._too_large())
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,297 @@
+"""
+Fill the database with synthetic requests for performance testing.
+
+Inserts --requests requests per service with their product, requirements,
+standards, lab selection, document (and, for calibration, confirmation
+and approval) rows plus the service_requests_index entries, in batches of
+multi-row Core INSERTs with one transaction per batch. Requests are
+spread over the last --days days; about one in five is a draft that
+stopped part-way through the wizard.
+
+Documents are metadata-only by default. With --files N, N dummy files are
+written to the blob store and the documents share them, the way repeat
+uploads share a blob, so downloads work too.
+
+Point DATABASE_URL at a scratch database first; rows are only ever added.
+
+Usage (from backend/):
+    python generate_test_data.py --requests 1000000
+    python generate_test_data.py --requests 50000 --services testing,design --files 200
+"""
+import argparse
+import hashlib
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import bindparam, func, insert, select, update
+from core.database import engine
+from modules.document_store.models import DocumentBlob
+from modules.document_store.services import blob_path, stored_file_path
+from modules.request_index.models import ServiceRequestIndex
+from modules.service_engine import SERVICE_TYPES, get_service
+
+BATCH_SIZE = 5000
+DRAFT_SHARE = 0.2
+
+PRODUCTS = [
+    "Smart Meter", "IoT Gateway", "Motor Controller", "Infusion Pump", "LED Driver",
+    "Battery Charger", "Telematics Unit", "Patient Monitor", "Solar Inverter",
+    "Router", "Dashcam", "Power Supply", "Thermostat", "Pressure Gauge", "Multimeter",
+]
+MANUFACTURERS = [
+    "Acme Labs", "TechCorp Industries", "Bharat Electronics", "Northwind Devices",
+    "Sunrise Power Systems", "Medisense Healthcare", "Vertex Automotive",
+    "Orion Telecom", "Lumina Lighting", "Kestrel Avionics",
+]
+INDUSTRIES = ["Automotive", "Consumer", "IoT", "Military", "Medical", "Telecom", "Lighting", "Avionics"]
+TESTS = [
+    "EMC Test", "Safety Test (Electrical & Mechanical)", "Functional Safety Test",
+    "Environmental Test", "Performance Test", "Reliability Test",
+]
+STANDARDS = [
+    "ESD immunity: IEC 61000-4-2", "Radiated RF immunity: IEC 61000-4-3",
+    "EFT/Burst immunity: IEC 61000-4-4", "Surge immunity: IEC 61000-4-5",
+    "Conducted RF immunity: IEC 61000-4-6", "EN 55032 (Emissions)",
+    "Cold Test: IEC 60068-2-1", "Dry Heat Test: IEC 60068-2-2",
+    "Damp Heat (Cyclic): IEC 60068-2-30", "Vibration (Sinusoidal): IEC 60068-2-6",
+]
+REGIONS = ["India", "Europe", "USA", "Japan", "China", "Middle East"]
+LABS = [
+    "TUV INDIA PVT. LTD., BANER, PUNE, MAHARASHTRA, INDIA",
+    "SGS INDIA PRIVATE LIMITED, BENGALURU, KARNATAKA, INDIA",
+    "ABB INDIA LIMITED- ELSP-TESTING LABORATORY",
+    "HERRMANN RESEARCH PRODUCTS AND LABORATORIES PVT",
+    "MARQUIS TECHNOLOGIES PRIVATE LIMITED",
+    "METER TESTING LABORATORY, RRVPNL",
+]
+LOCATIONS = [
+    {"country": "India", "state": "Maharashtra", "city": "Pune"},
+    {"country": "India", "state": "Karnataka", "city": "Bengaluru"},
+    {"country": "India", "state": "Rajasthan", "city": "Jaipur"},
+    {"country": "India", "state": "Delhi", "city": "New Delhi"},
+]
+DOC_TYPES = ["manual", "schematic", "datasheet", "test_report", "bom"]
+
+
+def write_blobs(count, size):
+    """Write `count` random files to the blob store; returns their DocumentBlob rows"""
+    blobs = []
+    for _ in range(count):
+        data = os.urandom(size)
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = blob_path(sha256)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        blobs.append({
+            "sha256": sha256,
+            "size": size,
+            "file_path": stored_file_path(path),
+            "ref_count": 0,
+        })
+    return blobs
+
+
+class Generator:
+    def __init__(self, rng, days, documents, blobs):
+        self.rng = rng
+        self.documents = documents
+        self.blobs = blobs
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        self.span = int(timedelta(days=days).total_seconds())
+
+    def product(self):
+        rng = self.rng
+        name = rng.choice(PRODUCTS)
+        industry = rng.sample(INDUSTRIES, rng.randint(1, 2))
+        return {
+            "eut_name": f"{name} {rng.choice(['', 'Pro ', 'Mini ', 'X'])}{rng.randint(1, 9)}".replace("  ", " "),
+            "eut_quantity": str(rng.randint(1, 10)),
+            "manufacturer": rng.choice(MANUFACTURERS),
+            "model_no": f"{name[:3].upper()}-{rng.randint(100, 9999)}",
+            "serial_no": f"SN{rng.randint(10 ** 8, 10 ** 9 - 1)}",
+            "supply_voltage": rng.choice(["230V AC", "110V AC", "12V DC", "24V DC", "5V DC"]),
+            "operating_frequency": rng.choice(["50Hz", "60Hz", "50/60Hz", None]),
+            "current": f"{rng.randint(1, 20)}A",
+            "weight": f"{rng.randint(50, 5000)}g",
+            "length_mm": str(rng.randint(20, 600)),
+            "width_mm": str(rng.randint(20, 400)),
+            "height_mm": str(rng.randint(5, 300)),
+            "power_ports": str(rng.randint(0, 3)),
+            "signal_lines": str(rng.randint(0, 8)),
+            "software_name": rng.choice([None, "Firmware", "Control App"]),
+            "software_version": f"{rng.randint(1, 5)}.{rng.randint(0, 9)}.{rng.randint(0, 20)}",
+            "industry": industry,
+            "industry_other": None,
+            "preferred_date": (self.now + timedelta(days=rng.randint(7, 120))).date().isoformat(),
+            "notes": rng.choice([None, None, "Urgent testing required for product launch", "Samples ship next week"]),
+        }
+
+    def batch(self, service, first_id, count):
+        """{table: rows} for `count` requests with ids from `first_id`"""
+        rng = self.rng
+        models = service.models
+        fk = service.fk
+        tables = {model.__table__: [] for model in (
+            models.root, models.product, models.requirements, models.standards,
+            models.lab, models.document, models.confirmation, models.approval,
+            ServiceRequestIndex
+        ) if model is not None}
+        blob_refs = {}
+
+        for request_id in range(first_id, first_id + count):
+            created_at = self.now - timedelta(seconds=rng.randrange(self.span))
+            # Saved up to three days later, but not after now
+            updated_at = min(created_at + timedelta(seconds=rng.randrange(3 * 24 * 3600)), self.now)
+            draft = rng.random() < DRAFT_SHARE
+            status = "draft" if draft else "submitted"
+            # Drafts stop somewhere after the product step
+            steps = rng.randint(1, 4) if draft else 5
+
+            tables[models.root.__table__].append({
+                "id": request_id, "status": status, "created_at": created_at, "updated_at": updated_at
+            })
+            product = self.product()
+            tables[models.product.__table__].append({fk: request_id, **product})
+            tables[ServiceRequestIndex.__table__].append({
+                "service_type": service.key,
+                "request_id": request_id,
+                "status": status,
+                "eut_name": product["eut_name"],
+                "manufacturer": product["manufacturer"],
+                "model_no": product["model_no"],
+                "created_at": created_at,
+                "updated_at": updated_at,
+            })
+
+            if steps >= 2:
+                for n in range(rng.randint(0, 2 * self.documents)):
+                    doc_type = rng.choice(DOC_TYPES)
+                    row = {
+                        fk: request_id,
+                        "doc_type": doc_type,
+                        "file_name": f"{product['model_no']}_{doc_type}_{n + 1}.pdf",
+                        "file_path": None,
+                        "file_size": rng.randint(10_000, 5_000_000),
+                        "checksum": None,
+                        "uploaded_at": created_at,
+                    }
+                    if self.blobs:
+                        blob = rng.choice(self.blobs)
+                        row.update(file_path=blob["file_path"], file_size=blob["size"], checksum=blob["sha256"])
+                        blob_refs[blob["sha256"]] = blob_refs.get(blob["sha256"], 0) + 1
+                    tables[models.document.__table__].append(row)
+            if steps >= 3:
+                tables[models.requirements.__table__].append({
+                    fk: request_id,
+                    "test_type": rng.choice(["pre-compliance", "final"]),
+                    "selected_tests": rng.sample(TESTS, rng.randint(1, 3)),
+                })
+            if steps >= 4:
+                tables[models.standards.__table__].append({
+                    fk: request_id,
+                    "regions": rng.sample(REGIONS, rng.randint(1, 3)),
+                    "standards": rng.sample(STANDARDS, rng.randint(1, 5)),
+                })
+                if models.confirmation is not None:
+                    tables[models.confirmation.__table__].append({
+                        fk: request_id, "approve_plan": "true", "understand_tests": "true", "created_at": updated_at
+                    })
+            if steps >= 5:
+                tables[models.lab.__table__].append({
+                    fk: request_id,
+                    "selected_labs": rng.sample(LABS, rng.randint(1, 2)),
+                    "region": rng.choice(LOCATIONS),
+                    "remarks": None,
+                })
+                if models.approval is not None:
+                    tables[models.approval.__table__].append({
+                        fk: request_id, "confirm_accurate": "true", "confirm_approve": "true",
+                        "confirm_understand": "true", "created_at": updated_at
+                    })
+
+        return tables, blob_refs
+
+
+def sync_id_sequence(connection, table):
+    """
+    Move a Postgres id sequence past the explicit ids inserted into
+    `table`, or the app's next INSERT would reuse one of them. SQLite
+    picks MAX(id) + 1 by itself.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(select(func.setval(
+        func.pg_get_serial_sequence(table.name, "id"),
+        select(func.max(table.c.id)).scalar_subquery()
+    )))
+
+
+def generate(service, count, generator, batch_size):
+    root = service.models.root.__table__
+    blobs = DocumentBlob.__table__
+    bump_refs = update(blobs).where(blobs.c.sha256 == bindparam("b_sha256")).values(
+        ref_count=blobs.c.ref_count + bindparam("b_refs")
+    )
+    with engine.connect() as connection:
+        first_id = (connection.execute(select(func.max(root.c.id))).scalar() or 0) + 1
+
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        tables, blob_refs = generator.batch(service, first_id + start, size)
+        with engine.begin() as connection:
+            for table, rows in tables.items():
+                if rows:
+                    connection.execute(insert(table), rows)
+            sync_id_sequence(connection, root)
+            if blob_refs:
+                connection.execute(bump_refs, [
+                    {"b_sha256": sha256, "b_refs": refs} for sha256, refs in blob_refs.items()
+                ])
+        yield size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, required=True, help="requests per service")
+    parser.add_argument("--services", default=",".join(SERVICE_TYPES), help="comma separated")
+    parser.add_argument("--documents", type=int, default=2, help="average documents per request")
+    parser.add_argument("--files", type=int, default=0, help="dummy files written to the blob store")
+    parser.add_argument("--file-kb", type=int, default=64, help="size of each dummy file")
+    parser.add_argument("--days", type=int, default=730, help="spread created_at over this many days")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--seed", type=int, help="for a reproducible data set")
+    args = parser.parse_args()
+
+    keys = [key.strip() for key in args.services.split(",")]
+    for key in keys:
+        if key not in SERVICE_TYPES:
+            parser.error(f"unknown service {key!r}; choose from {', '.join(SERVICE_TYPES)}")
+
+    from migrations import ensure_schema
+    ensure_schema(engine)
+
+    blobs = []
+    if args.files:
+        blobs = write_blobs(args.files, args.file_kb * 1024)
+        with engine.begin() as connection:
+            connection.execute(insert(DocumentBlob.__table__), blobs)
+        print(f"Wrote {len(blobs)} files of {args.file_kb} KB to the blob store")
+
+    generator = Generator(random.Random(args.seed), args.days, args.documents, blobs)
+    total_start = time.perf_counter()
+    for key in keys:
+        start = time.perf_counter()
+        done = 0
+        for size in generate(get_service(key), args.requests, generator, args.batch_size):
+            done += size
+            elapsed = time.perf_counter() - start
+            print(f"\r{key}: {done:,}/{args.requests:,} requests ({done / elapsed:,.0f}/s)", end="", flush=True)
+        print()
+
+    elapsed = time.perf_counter() - total_start
+    print(f"Generated {args.requests * len(keys):,} requests in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Bulk import requests of one service from a CSV or JSONL file.
+See modules/service_engine/bulk_import.py for the file layout.
+
+Usage (from backend/):
+    python import_requests.py testing customers.csv
+    python import_requests.py calibration meters.jsonl --batch-size 2000
+"""
+import argparse
+import json
+import sys
+import time
+from core.database import engine, SessionLocal
+from modules.service_engine import SERVICE_TYPES, get_service
+from modules.service_engine.bulk_import import IMPORT_BATCH_SIZE, detect_format, import_requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("service", choices=SERVICE_TYPES)
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--errors", help="write the per-row errors to this JSONL file")
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(args.file)
+
+    from migrations import ensure_schema
+    ensure_schema(engine)
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        with open(args.file, "rb") as stream:
+            result = import_requests(db, get_service(args.service), stream, fmt, args.batch_size)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    rate = result["imported"] / elapsed * 60 if elapsed else 0
+    print(f"Imported {result['imported']} {args.service} requests in {elapsed:.1f}s ({rate:,.0f} rows/min)")
+
+    if result["errors"]:
+        print(f"{result['failed']} rows failed")
+        if args.errors:
+            with open(args.errors, "w") as out:
+                for error in result["errors"]:
+                    out.write(json.dumps(error) + "\n")
+            print(f"Errors written to {args.errors}")
+        else:
+            for error in result["errors"][:20]:
+                print(f"  line {error['row']}: {'; '.join(error['errors'])}")
+            if result["failed"] > 20:
+                print(f"  ... use --errors FILE to see all {result['failed']}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Add the region column to lab_selection (was migrate_add_region_column.py)"""
+from migrations import add_column
+
+
+def upgrade(connection):
+    # JSON column (TEXT in SQLite)
+    add_column(connection, "lab_selection", "region", "TEXT")
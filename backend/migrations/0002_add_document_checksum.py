@@ -0,0 +1,16 @@
+"""Add the checksum column to every technical documents table (was migrate_add_document_checksum.py)"""
+from migrations import add_column
+
+TABLES = [
+    "technical_documents",
+    "calibration_technical_documents",
+    "design_technical_documents",
+    "certification_technical_documents",
+    "debugging_technical_documents",
+    "simulation_technical_documents",
+]
+
+
+def upgrade(connection):
+    for table in TABLES:
+        add_column(connection, table, "checksum", "TEXT")
@@ -0,0 +1,59 @@
+"""
+Index the <service>_request_id column of every child table.
+
+Tables the services treat as one row per request get a unique index; any
+duplicate rows left by concurrent saves are removed first, keeping the
+oldest row (the one `.first()` has been reading and updating).
+"""
+from sqlalchemy import text
+from migrations import create_index, table_columns
+
+# Index builds run CONCURRENTLY on Postgres, which cannot be inside a transaction
+TRANSACTIONAL = False
+
+SERVICES = ["testing", "calibration", "design", "certification", "debugging", "simulation"]
+
+# Testing's child tables predate the <service>_ table prefix
+TESTING_TABLES = {
+    "product_details": "product_details",
+    "technical_documents": "technical_documents",
+    "lab_selection": "lab_selection",
+}
+
+ONE_PER_REQUEST = ["product_details", "requirements", "standards", "lab_selection"]
+
+
+def child_tables():
+    """[(table, foreign key column, unique)]"""
+    tables = []
+    for service in SERVICES:
+        fk = f"{service}_request_id"
+        for suffix in ONE_PER_REQUEST + ["technical_documents"]:
+            if service == "testing":
+                table = TESTING_TABLES.get(suffix, f"testing_{suffix}")
+            else:
+                table = f"{service}_{suffix}"
+            tables.append((table, fk, suffix != "technical_documents"))
+    tables += [
+        ("calibration_confirmations", "calibration_request_id", True),
+        ("calibration_approvals", "calibration_request_id", True),
+    ]
+    return tables
+
+
+def upgrade(connection):
+    for table, fk, unique in child_tables():
+        if table_columns(connection, table) is None:
+            # Not in this database; nothing to index
+            continue
+
+        if unique:
+            result = connection.execute(text(
+                f"DELETE FROM {table} WHERE {fk} IS NOT NULL AND id NOT IN "
+                f"(SELECT MIN(id) FROM {table} WHERE {fk} IS NOT NULL GROUP BY {fk})"
+            ))
+            if result.rowcount:
+                print(f"Removed {result.rowcount} duplicate rows from {table}")
+
+        create_index(connection, f"ix_{table}_{fk}", table, [fk], unique=unique)
+        print(f"✓ Indexed {table}.{fk}")
@@ -0,0 +1,19 @@
+"""
+Create service_requests_index and document_blobs on databases that predate
+them, and fill the new request index from every service's tables.
+"""
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from modules.document_store.models import DocumentBlob
+from modules.request_index.models import ServiceRequestIndex
+
+
+def upgrade(connection):
+    DocumentBlob.__table__.create(connection, checkfirst=True)
+
+    if not inspect(connection).has_table(ServiceRequestIndex.__tablename__):
+        ServiceRequestIndex.__table__.create(connection)
+
+        from rebuild_request_index import rebuild
+        # Joins the migration's transaction; rebuild()'s commit does not end it
+        rebuild(Session(bind=connection))
@@ -0,0 +1,7 @@
+"""Create the product_search FTS5 table and its triggers on SQLite databases that predate it"""
+from modules.product_search.search_index import install_product_search
+
+
+def upgrade(connection):
+    if connection.dialect.name == "sqlite":
+        install_product_search(connection)
@@ -0,0 +1,23 @@
+"""
+Index the columns the keyset-paginated list endpoint filters and orders by
+on every service root table: (status, created_at, id) and (created_at, id).
+The models declare them, but create_all never adds indexes to existing tables.
+"""
+from migrations import create_index, table_columns
+
+# Index builds run CONCURRENTLY on Postgres, which cannot be inside a transaction
+TRANSACTIONAL = False
+
+SERVICES = ["testing", "calibration", "design", "certification", "debugging", "simulation"]
+
+
+def upgrade(connection):
+    for service in SERVICES:
+        table = f"{service}_requests"
+        if table_columns(connection, table) is None:
+            # Not in this database; nothing to index
+            continue
+
+        create_index(connection, f"ix_{table}_status_created_at_id", table, ["status", "created_at", "id"])
+        create_index(connection, f"ix_{table}_created_at_id", table, ["created_at", "id"])
+        print(f"✓ Indexed {table} for the list endpoint")
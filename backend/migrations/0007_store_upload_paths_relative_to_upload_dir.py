@@ -0,0 +1,32 @@
+"""
+Store document file paths relative to UPLOAD_DIR instead of backend/:
+database/upload/blobs/ab/cd/... becomes blobs/ab/cd/..., and uploads from
+before the blob store (database/upload/testing_requests/1/...) become
+testing_requests/1/..., so they resolve under whatever UPLOAD_DIR is set to.
+"""
+from sqlalchemy import text
+from migrations import table_columns
+
+TABLES = [
+    "document_blobs",
+    "technical_documents",
+    "calibration_technical_documents",
+    "design_technical_documents",
+    "certification_technical_documents",
+    "debugging_technical_documents",
+    "simulation_technical_documents",
+]
+
+# The fixed upload directory under backend/ that paths used to start with
+OLD_PREFIX = "database/upload/"
+
+
+def upgrade(connection):
+    for table in TABLES:
+        if table_columns(connection, table) is None:
+            continue
+        result = connection.execute(text(
+            f"UPDATE {table} SET file_path = substr(file_path, :start) WHERE file_path LIKE :prefix"
+        ), {"start": len(OLD_PREFIX) + 1, "prefix": OLD_PREFIX + "%"})
+        if result.rowcount:
+            print(f"✓ Made {result.rowcount} file paths in {table} relative to UPLOAD_DIR")
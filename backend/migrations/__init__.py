@@ -0,0 +1,234 @@
+"""
+Versioned schema migrations.
+
+Each migration is a module in this package named NNNN_description.py with
+an `upgrade(connection)` function. Applied versions are recorded in the
+schema_migrations table; `python -m migrations` applies the pending ones
+in order, each in its own transaction. A migration that sets
+TRANSACTIONAL = False runs in autocommit mode instead, which Postgres
+needs for CREATE INDEX CONCURRENTLY.
+
+A new, empty database is created from the models and stamped with every
+version (like `alembic stamp head`), so migrations only ever run against
+databases that already have tables. They must be safe on databases that
+already have the change (older databases were created by create_all), so
+check before altering; the helpers below do.
+
+Workers starting together would race to create the tables or apply the
+same migration, so ensure_schema does its work under migration_lock()
+and looks again at what is pending once it holds it.
+"""
+import importlib
+import pkgutil
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from sqlalchemy import Column, DateTime, MetaData, String, Table, insert, inspect, select, text
+from sqlalchemy.sql import func
+
+MIGRATIONS_DIR = Path(__file__).parent
+
+# Rows per statement for backfill(); keeps each write lock short
+BACKFILL_BATCH_SIZE = 5000
+
+# Seconds a process waits for another one's migrations before giving up (SQLite)
+MIGRATION_LOCK_TIMEOUT = 600
+# pg_advisory_lock key; any constant shared by every process of this app
+ADVISORY_LOCK_KEY = 0x6D696772
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String, primary_key=True),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def available_migrations():
+    """[(version, module name)] sorted by version"""
+    found = []
+    for module in pkgutil.iter_modules([str(MIGRATIONS_DIR)]):
+        version, _, _ = module.name.partition("_")
+        if version.isdigit():
+            found.append((version, module.name))
+    return sorted(found)
+
+
+def applied_versions(connection):
+    schema_migrations.create(connection, checkfirst=True)
+    return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def pending_migrations(engine):
+    with engine.begin() as connection:
+        applied = applied_versions(connection)
+    return [(version, name) for version, name in available_migrations() if version not in applied]
+
+
+def upgrade(engine, log=print):
+    """Apply every pending migration; returns the versions applied"""
+    done = []
+    for version, name in pending_migrations(engine):
+        module = importlib.import_module(f"{__name__}.{name}")
+        log(f"Applying {name}...")
+        if getattr(module, "TRANSACTIONAL", True):
+            with engine.begin() as connection:
+                module.upgrade(connection)
+                connection.execute(insert(schema_migrations).values(version=version))
+        else:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+                module.upgrade(connection)
+                connection.execute(insert(schema_migrations).values(version=version))
+        done.append(version)
+    return done
+
+
+def create_schema(engine):
+    """Create every table of a new database from the models and mark all migrations applied"""
+    from core.database import Base
+    import modules.service_engine  # noqa: F401 (declares the service tables)
+    import modules.request_index.models  # noqa: F401
+    import modules.document_store.models  # noqa: F401
+    import modules.product_search.search_index  # noqa: F401 (FTS table on SQLite)
+
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        schema_migrations.create(connection, checkfirst=True)
+        versions = [version for version, _ in available_migrations()]
+        if versions:
+            connection.execute(insert(schema_migrations), [{"version": v} for v in versions])
+
+
+@contextmanager
+def migration_lock(engine):
+    """
+    Hold a lock across processes for the block: a session-level advisory
+    lock on Postgres; on SQLite a write transaction (BEGIN IMMEDIATE) on a
+    `<database>-migrate.lock` file next to the database (git-ignored, and on
+    the same volume for every worker that shares it), since one on the
+    database itself would block the migrations too. An in-memory SQLite
+    database belongs to one process and needs none.
+    """
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+    elif engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+        lock = sqlite3.connect(
+            f"{engine.url.database}-migrate.lock", timeout=MIGRATION_LOCK_TIMEOUT, isolation_level=None
+        )
+        try:
+            lock.execute("BEGIN IMMEDIATE")
+            yield
+        finally:
+            # Rolls the empty transaction back, releasing the lock
+            lock.close()
+    else:
+        yield
+
+
+def schema_status(engine):
+    """Names of the pending migrations, or None for a new, empty database"""
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        if inspector.has_table(schema_migrations.name):
+            applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+        elif not inspector.get_table_names():
+            return None
+        else:
+            applied = set()
+    return [name for version, name in available_migrations() if version not in applied]
+
+
+def ensure_schema(engine, auto_migrate=True, log=print):
+    """
+    Startup check: one query against schema_migrations instead of
+    inspecting every table. Creates a new database, then applies pending
+    migrations when `auto_migrate` is on, or raises SchemaOutOfDateError.
+    Returns the versions applied, or None when the database was created.
+    """
+    pending = schema_status(engine)
+    if pending == []:
+        return []
+    if pending and not auto_migrate:
+        raise SchemaOutOfDateError(
+            f"Database schema is out of date ({', '.join(pending)} pending); run `python -m migrations`"
+        )
+
+    with migration_lock(engine):
+        # Another process may have created or migrated the database while this one waited
+        pending = schema_status(engine)
+        if pending is None:
+            create_schema(engine)
+            return None
+        return upgrade(engine, log=log) if pending else []
+
+
+# --- helpers for migrations ----------------------------------------------
+
+
+def table_columns(connection, table):
+    """Column names of `table`, or None if the table does not exist"""
+    inspector = inspect(connection)
+    if not inspector.has_table(table):
+        return None
+    return [column["name"] for column in inspector.get_columns(table)]
+
+
+def add_column(connection, table, column, column_type):
+    """
+    ALTER TABLE ... ADD COLUMN if the table exists and lacks the column.
+    Add nullable columns without a default: both SQLite and Postgres do
+    that without rewriting the table. Fill values afterwards with backfill().
+    """
+    columns = table_columns(connection, table)
+    if columns is None or column in columns:
+        return False
+    connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+    print(f"✓ Added '{column}' column to {table}")
+    return True
+
+
+def create_index(connection, name, table, columns, unique=False):
+    """
+    CREATE INDEX IF NOT EXISTS, skipping missing tables. On Postgres the
+    index is built CONCURRENTLY (no write lock) when the migration runs
+    with TRANSACTIONAL = False.
+    """
+    if table_columns(connection, table) is None:
+        return False
+    concurrently = ""
+    autocommit = connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+    if connection.dialect.name == "postgresql" and autocommit:
+        concurrently = "CONCURRENTLY "
+    connection.execute(text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX {concurrently}IF NOT EXISTS "
+        f"{name} ON {table} ({', '.join(columns)})"
+    ))
+    return True
+
+
+def backfill(connection, table, assignments, where="1 = 1", batch_size=BACKFILL_BATCH_SIZE):
+    """
+    UPDATE `table` SET `assignments` WHERE `where`, in id ranges of
+    `batch_size` so no single statement holds the write lock for long.
+    In autocommit mode (TRANSACTIONAL = False) every batch commits on its own.
+    """
+    bounds = connection.execute(text(f"SELECT MIN(id), MAX(id) FROM {table}")).first()
+    if bounds is None or bounds[0] is None:
+        return 0
+    updated = 0
+    low, high = bounds
+    for start in range(low, high + 1, batch_size):
+        result = connection.execute(text(
+            f"UPDATE {table} SET {assignments} WHERE ({where}) AND id >= :start AND id < :stop"
+        ), {"start": start, "stop": start + batch_size})
+        updated += result.rowcount
+    return updated
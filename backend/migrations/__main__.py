@@ -0,0 +1,34 @@
+"""
+Apply pending schema migrations to DATABASE_URL.
+
+Usage (from backend/):
+    python -m migrations            # apply pending migrations
+    python -m migrations status     # list applied and pending migrations
+"""
+import sys
+from core.database import engine
+from migrations import available_migrations, pending_migrations, ensure_schema
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    print(f"Connecting to database: {engine.url.render_as_string(hide_password=True)}")
+
+    if command == "status":
+        pending = {version for version, _ in pending_migrations(engine)}
+        for version, name in available_migrations():
+            print(f"{'pending' if version in pending else 'applied':<9}{name}")
+    elif command == "upgrade":
+        applied = ensure_schema(engine)
+        if applied is None:
+            print("Created a new database at the latest schema version.")
+        elif not applied:
+            print("Database is up to date. No migration needed.")
+        print("Migration completed.")
+    else:
+        print(__doc__.strip())
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
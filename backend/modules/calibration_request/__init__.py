@@ -1,38 +0,0 @@
-# Calibration Request Module
-from .routes import router
-from .models import (
-    CalibrationRequest,
-    CalibrationProductDetails,
-    CalibrationTechnicalDocument,
-    CalibrationRequirements,
-    CalibrationStandards,
-    CalibrationLabSelection
-)
-from .services import (
-    create_calibration_request,
-    save_calibration_product_details,
-    save_calibration_technical_documents,
-    save_calibration_requirements,
-    save_calibration_standards,
-    save_calibration_lab_selection_draft,
-    submit_calibration_request,
-    get_full_calibration_request
-)
-
-__all__ = [
-    "router",
-    "CalibrationRequest",
-    "CalibrationProductDetails",
-    "CalibrationTechnicalDocument",
-    "CalibrationRequirements",
-    "CalibrationStandards",
-    "CalibrationLabSelection",
-    "create_calibration_request",
-    "save_calibration_product_details",
-    "save_calibration_technical_documents",
-    "save_calibration_requirements",
-    "save_calibration_standards",
-    "save_calibration_lab_selection_draft",
-    "submit_calibration_request",
-    "get_full_calibration_request",
-]
@@ -1,38 +0,0 @@
-# Certification Request Module
-from .routes import router
-from .models import (
-    CertificationRequest,
-    CertificationProductDetails,
-    CertificationTechnicalDocument,
-    CertificationRequirements,
-    CertificationStandards,
-    CertificationLabSelection
-)
-from .services import (
-    create_certification_request,
-    save_certification_product_details,
-    save_certification_technical_documents,
-    save_certification_requirements,
-    save_certification_standards,
-    save_certification_lab_selection_draft,
-    submit_certification_request,
-    get_full_certification_request
-)
-
-__all__ = [
-    "router",
-    "CertificationRequest",
-    "CertificationProductDetails",
-    "CertificationTechnicalDocument",
-    "CertificationRequirements",
-    "CertificationStandards",
-    "CertificationLabSelection",
-    "create_certification_request",
-    "save_certification_product_details",
-    "save_certification_technical_documents",
-    "save_certification_requirements",
-    "save_certification_standards",
-    "save_certification_lab_selection_draft",
-    "submit_certification_request",
-    "get_full_certification_request",
-]
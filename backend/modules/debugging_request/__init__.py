@@ -1,38 +0,0 @@
-# Debugging Request Module
-from .routes import router
-from .models import (
-    DebuggingRequest,
-    DebuggingProductDetails,
-    DebuggingTechnicalDocument,
-    DebuggingRequirements,
-    DebuggingStandards,
-    DebuggingLabSelection
-)
-from .services import (
-    create_debugging_request,
-    save_debugging_product_details,
-    save_debugging_technical_documents,
-    save_debugging_requirements,
-    save_debugging_standards,
-    save_debugging_lab_selection_draft,
-    submit_debugging_request,
-    get_full_debugging_request
-)
-
-__all__ = [
-    "router",
-    "DebuggingRequest",
-    "DebuggingProductDetails",
-    "DebuggingTechnicalDocument",
-    "DebuggingRequirements",
-    "DebuggingStandards",
-    "DebuggingLabSelection",
-    "create_debugging_request",
-    "save_debugging_product_details",
-    "save_debugging_technical_documents",
-    "save_debugging_requirements",
-    "save_debugging_standards",
-    "save_debugging_lab_selection_draft",
-    "submit_debugging_request",
-    "get_full_debugging_request",
-]
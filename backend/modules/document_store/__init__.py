@@ -0,0 +1,12 @@
+# Content-addressed Document Store Module
+from .models import DocumentBlob
+from .services import (
+    blob_path,
+    store_blob
+)
+
+__all__ = [
+    "DocumentBlob",
+    "blob_path",
+    "store_blob",
+]
@@ -0,0 +1,90 @@
+"""
+Serving stored documents.
+
+FileResponse already streams from disk (zero-copy through the ASGI pathsend
+extension when the server supports it) and answers Range / If-Range
+requests. On top of that, this module sets a content-based ETag from the
+stored SHA-256 and Last-Modified from uploaded_at, and answers
+If-None-Match / If-Modified-Since with 304 before touching the file.
+
+Only files the upload endpoints wrote are served: blob store files, found
+by their checksum, and uploads from before the blob store in the request's
+own legacy directory. A document's file_path alone is never trusted.
+"""
+import re
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse, Response
+from .services import blob_path, resolve_file_path
+
+SHA256_HEX = re.compile(r"[0-9a-f]{64}")
+
+
+def _last_modified(document):
+    if not document.uploaded_at:
+        return None
+    uploaded_at = document.uploaded_at
+    if uploaded_at.tzinfo is None:
+        # SQLite's CURRENT_TIMESTAMP is UTC but comes back naive
+        uploaded_at = uploaded_at.replace(tzinfo=timezone.utc)
+    return uploaded_at
+
+
+def _not_modified(request: Request, etag, last_modified):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag is None:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def _stored_file(document, legacy_dir):
+    """Path of the file store_blob or the old upload code wrote for `document`, or None"""
+    if document.checksum:
+        # Written by store_blob, which keeps the file at the content's own path
+        return blob_path(document.checksum) if SHA256_HEX.fullmatch(document.checksum) else None
+    path = resolve_file_path(document.file_path)
+    return path if legacy_dir in path.parents else None
+
+
+def document_response(request: Request, document, legacy_dir):
+    """
+    Serve a technical document. `legacy_dir` is the request's upload
+    directory from before the blob store (legacy_upload_dir()).
+    """
+    if not document.file_path and not document.checksum:
+        raise HTTPException(status_code=404, detail="Document has no stored file")
+
+    path = _stored_file(document, legacy_dir)
+    if path is None or not path.is_file():
+        raise HTTPException(status_code=404, detail="Document file not found")
+
+    headers = {}
+    etag = f'"{document.checksum}"' if document.checksum else None
+    if etag:
+        headers["etag"] = etag
+    last_modified = _last_modified(document)
+    if last_modified:
+        headers["last-modified"] = formatdate(last_modified.timestamp(), usegmt=True)
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        path,
+        filename=document.file_name,
+        content_disposition_type="inline",
+        headers=headers
+    )
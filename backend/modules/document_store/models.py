@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from core.database import Base
+
+class DocumentBlob(Base):
+    """A stored file, shared by every technical document with the same content"""
+    __tablename__ = "document_blobs"
+
+    sha256 = Column(String, primary_key=True)
+    size = Column(Integer)
+    file_path = Column(String)  # relative to UPLOAD_DIR
+    ref_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
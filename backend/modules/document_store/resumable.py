@@ -0,0 +1,232 @@
+"""
+Resumable chunked uploads.
+
+A session is a directory under UPLOAD_DIR/sessions/<upload_id>/ holding
+a manifest.json and one <index>.part file per received chunk. Chunks can
+arrive in any order and in parallel; each is written to a temporary file and
+renamed into place only once complete, so a dropped connection never leaves a
+half-written chunk behind. Completing the session streams the parts, in
+order, into the blob store.
+
+Sessions not completed within UPLOAD_SESSION_TTL_HOURS of their created_at
+count as not found, and are deleted by a sweep that runs (at most every
+SWEEP_INTERVAL seconds) whenever a new session starts.
+"""
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from core.config import get_settings
+from core.uploads import UploadTooLargeError
+from .schemas import ResumableUploadSchema
+from .services import UPLOAD_DIR, store_blob
+
+SESSION_DIR = UPLOAD_DIR / "sessions"
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+SWEEP_INTERVAL = 600
+
+_last_sweep = 0.0
+
+
+class UploadSessionNotFoundError(ValueError):
+    pass
+
+
+def _session_dir(upload_id: str):
+    # upload ids are generated by us as uuid4 hex; reject anything else
+    try:
+        return SESSION_DIR / uuid.UUID(hex=upload_id).hex
+    except ValueError:
+        raise UploadSessionNotFoundError("Upload session not found")
+
+
+def _load_manifest(service_type: str, request_id: int, upload_id: str):
+    manifest_path = _session_dir(upload_id) / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except FileNotFoundError:
+        raise UploadSessionNotFoundError("Upload session not found")
+
+    if manifest["service_type"] != service_type or manifest["request_id"] != request_id:
+        raise UploadSessionNotFoundError("Upload session not found")
+    # Sessions started before created_at was recorded are left to the sweep
+    created_at = manifest.get("created_at")
+    if created_at and _expired(datetime.fromisoformat(created_at)):
+        raise UploadSessionNotFoundError("Upload session has expired")
+    return manifest
+
+
+def _expired(created_at: datetime):
+    ttl = timedelta(hours=get_settings().UPLOAD_SESSION_TTL_HOURS)
+    return created_at + ttl < datetime.now(timezone.utc)
+
+
+def sweep_expired_sessions():
+    """Delete the directories of expired sessions; returns how many were removed"""
+    if not SESSION_DIR.is_dir():
+        return 0
+
+    removed = 0
+    for session_dir in SESSION_DIR.iterdir():
+        try:
+            created_at = datetime.fromisoformat(
+                json.loads((session_dir / "manifest.json").read_text())["created_at"]
+            )
+        except (OSError, ValueError, KeyError):
+            # No readable manifest (interrupted create): go by the directory's age
+            try:
+                created_at = datetime.fromtimestamp(session_dir.stat().st_mtime, timezone.utc)
+            except OSError:
+                continue
+        if _expired(created_at):
+            shutil.rmtree(session_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def _sweep_now_and_then():
+    global _last_sweep
+    now = time.monotonic()
+    if now - _last_sweep >= SWEEP_INTERVAL:
+        _last_sweep = now
+        sweep_expired_sessions()
+
+
+def _chunk_length(manifest: dict, index: int):
+    start = index * manifest["chunk_size"]
+    return min(manifest["chunk_size"], manifest["total_size"] - start)
+
+
+def create_upload_session(service_type: str, request_id: int, payload: ResumableUploadSchema, max_size: int):
+    if payload.total_size > max_size:
+        raise UploadTooLargeError(f"File exceeds the maximum upload size of {max_size} bytes")
+
+    chunk_size = payload.chunk_size or DEFAULT_CHUNK_SIZE
+    manifest = {
+        "upload_id": uuid.uuid4().hex,
+        "service_type": service_type,
+        "request_id": request_id,
+        "doc_type": payload.doc_type,
+        "file_name": payload.file_name,
+        "total_size": payload.total_size,
+        "chunk_size": chunk_size,
+        "chunk_count": -(-payload.total_size // chunk_size),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    _sweep_now_and_then()
+    session_dir = _session_dir(manifest["upload_id"])
+    session_dir.mkdir(parents=True)
+    (session_dir / "manifest.json").write_text(json.dumps(manifest))
+    return manifest
+
+
+async def write_chunk(service_type: str, request_id: int, upload_id: str, index: int, stream):
+    """Stream one chunk of the request body to its part file"""
+    manifest = await run_in_threadpool(_load_manifest, service_type, request_id, upload_id)
+    if not 0 <= index < manifest["chunk_count"]:
+        raise ValueError(f"Chunk index must be between 0 and {manifest['chunk_count'] - 1}")
+
+    expected = _chunk_length(manifest, index)
+    session_dir = _session_dir(upload_id)
+    tmp_path = session_dir / f"{index}.part.{uuid.uuid4().hex}"
+    received = 0
+
+    try:
+        with open(tmp_path, "wb") as buffer:
+            async for piece in stream:
+                received += len(piece)
+                if received > expected:
+                    raise ValueError(f"Chunk {index} must be exactly {expected} bytes")
+                await run_in_threadpool(buffer.write, piece)
+
+        if received != expected:
+            raise ValueError(f"Chunk {index} must be exactly {expected} bytes, got {received}")
+        os.replace(tmp_path, session_dir / f"{index}.part")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def upload_status(service_type: str, request_id: int, upload_id: str):
+    """Report which chunks and byte ranges have been received so far"""
+    manifest = _load_manifest(service_type, request_id, upload_id)
+    session_dir = _session_dir(upload_id)
+
+    received = sorted(
+        int(path.stem) for path in session_dir.glob("*.part")
+    )
+    received_set = set(received)
+
+    # Merge consecutive chunks into inclusive byte ranges
+    ranges = []
+    for index in received:
+        start = index * manifest["chunk_size"]
+        end = start + _chunk_length(manifest, index) - 1
+        if ranges and ranges[-1][1] == start - 1:
+            ranges[-1][1] = end
+        else:
+            ranges.append([start, end])
+
+    return {
+        **manifest,
+        "received_chunks": received,
+        "missing_chunks": [i for i in range(manifest["chunk_count"]) if i not in received_set],
+        "received_ranges": ranges,
+    }
+
+
+class _PartsReader:
+    """File-like reader over the session's part files, in chunk order"""
+
+    def __init__(self, paths):
+        self._paths = iter(paths)
+        self._current = None
+
+    def read(self, size=-1):
+        while True:
+            if self._current is None:
+                path = next(self._paths, None)
+                if path is None:
+                    return b""
+                self._current = open(path, "rb")
+
+            data = self._current.read(size)
+            if data:
+                return data
+            self._current.close()
+            self._current = None
+
+    def close(self):
+        if self._current is not None:
+            self._current.close()
+
+
+def assemble_upload(db: Session, service_type: str, request_id: int, upload_id: str, max_size: int):
+    """
+    Stream all parts into the blob store. Does not commit; call
+    discard_upload_session once the caller's transaction has committed.
+    Returns (session status, file_path, size, sha256).
+    """
+    status = upload_status(service_type, request_id, upload_id)
+    if status["missing_chunks"]:
+        raise ValueError(f"Upload incomplete, missing chunks: {status['missing_chunks']}")
+
+    session_dir = _session_dir(upload_id)
+    reader = _PartsReader(
+        session_dir / f"{index}.part" for index in range(status["chunk_count"])
+    )
+    try:
+        relative_path, size, sha256 = store_blob(db, reader, max_size)
+    finally:
+        reader.close()
+
+    return status, relative_path, size, sha256
+
+
+def discard_upload_session(upload_id: str):
+    shutil.rmtree(_session_dir(upload_id), ignore_errors=True)
@@ -0,0 +1,9 @@
+# schemas.py
+from pydantic import BaseModel, Field
+from typing import Optional
+
+class ResumableUploadSchema(BaseModel):
+    doc_type: str
+    file_name: str
+    total_size: int = Field(..., gt=0)
+    chunk_size: Optional[int] = Field(None, ge=256 * 1024, le=64 * 1024 * 1024)
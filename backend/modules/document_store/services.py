@@ -0,0 +1,76 @@
+# services.py
+import os
+import uuid
+from pathlib import Path
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from core.config import get_settings
+from core.uploads import write_upload
+from .models import DocumentBlob
+
+UPLOAD_DIR = Path(get_settings().UPLOAD_DIR).resolve()
+BLOB_DIR = UPLOAD_DIR / "blobs"
+BLOB_TMP_DIR = BLOB_DIR / "tmp"
+
+
+def blob_path(sha256: str) -> Path:
+    """Blobs are sharded by the first two byte pairs: blobs/ab/cd/abcd..."""
+    return BLOB_DIR / sha256[:2] / sha256[2:4] / sha256
+
+
+def legacy_upload_dir(service_key: str, request_id: int) -> Path:
+    """Where a request's uploads went before the blob store: UPLOAD_DIR/<service>_requests/<id>/"""
+    return UPLOAD_DIR / f"{service_key}_requests" / str(request_id)
+
+
+def stored_file_path(path: Path) -> str:
+    """
+    file_path column value: relative to UPLOAD_DIR (blobs/ab/cd/abcd...),
+    so the store keeps working when UPLOAD_DIR is moved
+    """
+    return path.relative_to(UPLOAD_DIR).as_posix()
+
+
+def resolve_file_path(file_path: str) -> Path:
+    """Absolute path of a stored file_path value under the current UPLOAD_DIR"""
+    return (UPLOAD_DIR / file_path).resolve()
+
+
+def store_blob(db: Session, source, max_size: int | None = None):
+    """
+    Stream `source` into the blob store and take a reference on it.
+
+    The file is hashed while it is written to a temporary file. If a blob with
+    the same SHA-256 already exists the temporary file is dropped and only the
+    reference count changes, so a repeat upload writes nothing new to disk.
+    Does not commit: callers run it inside their own transaction.
+    Returns (file_path, size_in_bytes, sha256_hex); see stored_file_path.
+    """
+    BLOB_TMP_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = BLOB_TMP_DIR / uuid.uuid4().hex
+    size, sha256 = write_upload(source, tmp_path, max_size)
+
+    final_path = blob_path(sha256)
+    if final_path.exists():
+        tmp_path.unlink()
+    else:
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, final_path)
+
+    relative_path = stored_file_path(final_path)
+
+    # Insert or bump the reference count in one atomic statement
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    table = DocumentBlob.__table__
+    stmt = dialect.insert(table).values(
+        sha256=sha256,
+        size=size,
+        file_path=relative_path,
+        ref_count=1
+    ).on_conflict_do_update(
+        index_elements=[table.c.sha256],
+        set_={"ref_count": table.c.ref_count + 1}
+    )
+    db.execute(stmt)
+
+    return relative_path, size, sha256
@@ -0,0 +1,9 @@
+# Bulk Export Module
+from .routes import router
+from .services import export_query, stream_export
+
+__all__ = [
+    "router",
+    "export_query",
+    "stream_export",
+]
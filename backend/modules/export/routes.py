@@ -0,0 +1,32 @@
+# routes.py
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Optional
+from modules.service_engine import SERVICE_TYPES, get_service
+from . import services
+
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+@router.get("/")
+def export_requests(
+    service: str,
+    format: str = Query("csv", pattern="^(csv|jsonl|parquet)$"),
+    since: Optional[datetime] = None
+):
+    """
+    Stream every request of a service as one flat row per request, oldest
+    first. `since` keeps requests created or saved at or after that time.
+    """
+    if service not in SERVICE_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unknown service '{service}'")
+    if format == "parquet" and not services.parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export needs pyarrow (pip install pyarrow)")
+
+    filename = f"{service}-requests.{format}"
+    return StreamingResponse(
+        services.stream_export(get_service(service), format, since),
+        media_type=services.MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,211 @@
+# services.py
+"""
+Streaming export of every request of a service, one flat row per request.
+
+Rows come from a single query joining the root table to its one-per-request
+child tables, read with yield_per so only EXPORT_BATCH_SIZE rows are in
+memory at a time; each batch is encoded and sent before the next is fetched.
+Documents are one-to-many, so rows carry a document_count instead.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import DateTime, Integer, JSON, func, select
+from core.database import read_session
+from modules.request_index.models import ServiceRequestIndex
+from modules.service_engine import RequestService
+
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Same separator bulk import reads list columns with
+LIST_SEPARATOR = ";"
+
+# Per-table bookkeeping columns left out of the export
+SKIPPED_COLUMNS = {"id", "created_at", "updated_at"}
+
+
+def export_columns(service: RequestService):
+    """The labeled columns of one export row, in output order"""
+    models = service.models
+    root = models.root
+    index = ServiceRequestIndex
+
+    columns = [
+        root.id.label("id"),
+        root.status.label("status"),
+        root.created_at.label("created_at"),
+        # Bumped by every save, unlike the root row's own updated_at
+        index.updated_at.label("updated_at"),
+    ]
+    children = [models.product, models.requirements, models.standards, models.lab]
+    if models.confirmation:
+        children += [models.confirmation, models.approval]
+    for model in children:
+        for column in model.__table__.columns:
+            if column.name not in SKIPPED_COLUMNS and column.name != service.fk:
+                columns.append(column.label(column.name))
+
+    document = models.document
+    columns.append(
+        select(func.count(document.id))
+        .where(getattr(document, service.fk) == root.id)
+        .scalar_subquery()
+        .label("document_count")
+    )
+    return columns
+
+
+def export_query(service: RequestService, since: datetime | None = None):
+    models = service.models
+    root = models.root
+    index = ServiceRequestIndex
+
+    query = select(*export_columns(service)).select_from(root).outerjoin(
+        index,
+        (index.service_type == service.key) & (index.request_id == root.id)
+    )
+    children = [models.product, models.requirements, models.standards, models.lab]
+    if models.confirmation:
+        children += [models.confirmation, models.approval]
+    # Each child is one row per request (unique foreign key), so no fan-out
+    for model in children:
+        query = query.outerjoin(model, getattr(model, service.fk) == root.id)
+
+    if since is not None:
+        query = query.where(func.coalesce(index.updated_at, root.created_at) >= since)
+    return query.order_by(root.id)
+
+
+def _text(value):
+    """A CSV cell or Parquet string for any exported value"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return str(value)
+
+
+def _csv_chunks(names, batches):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(names)
+    for rows in batches:
+        for row in rows:
+            writer.writerow(["" if value is None else _text(value) for value in row])
+        yield out.getvalue()
+        out.seek(0)
+        out.truncate()
+    # An export with no rows still has its header
+    if out.tell():
+        yield out.getvalue()
+
+
+def _jsonl_chunks(names, batches):
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(names, row)), default=_text) + "\n"
+            for row in rows
+        )
+
+
+class _ChunkSink:
+    """Write-only file that hands written bytes out in chunks but keeps tell() absolute"""
+    closed = False
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def take(self):
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _parquet_type(pa, column):
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    return pa.string()
+
+
+def _parquet_chunks(columns, batches):
+    """One row group per batch"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column.name, _parquet_type(pa, column)) for column in columns])
+    converters = [
+        (lambda v: v) if isinstance(column.type, (Integer, DateTime)) else
+        (lambda v: None if v is None else json.dumps(v)) if isinstance(column.type, JSON) else
+        _text
+        for column in columns
+    ]
+
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in batches:
+            values = [[] for _ in columns]
+            for row in rows:
+                for i, value in enumerate(row):
+                    values[i].append(converters[i](value))
+            writer.write_table(pa.Table.from_arrays(values, schema=schema))
+            yield sink.take()
+    yield sink.take()
+
+
+def parquet_available():
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def stream_export(service: RequestService, fmt: str, since: datetime | None = None):
+    """
+    Yield the export file piece by piece. Opens its own read session: the
+    response body is produced after the route (and its dependencies) returned.
+    """
+    query = export_query(service, since)
+    columns = list(query.selected_columns)
+    names = [column.name for column in columns]
+
+    db = read_session()
+    try:
+        result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        batches = result.partitions()
+        if fmt == "csv":
+            yield from _csv_chunks(names, batches)
+        elif fmt == "jsonl":
+            yield from _jsonl_chunks(names, batches)
+        else:
+            yield from _parquet_chunks(columns, batches)
+    finally:
+        db.close()
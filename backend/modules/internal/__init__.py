@@ -0,0 +1,6 @@
+# Internal Metrics Module
+from .routes import router
+
+__all__ = [
+    "router",
+]
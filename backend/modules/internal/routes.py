@@ -0,0 +1,37 @@
+# routes.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.cache import full_cache
+from core.database import engine, async_engine, read_engine, async_read_engine
+from core.metrics import registry
+from core.pool import pool_metrics
+
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+# Served at the root, where Prometheus scrapes by default
+metrics_router = APIRouter(tags=["Internal"])
+
+@router.get("/db-pool")
+def get_db_pool_metrics():
+    """Connection pool gauges and checkout wait times, per engine"""
+    metrics = {
+        "sync": pool_metrics(engine),
+        "async": pool_metrics(async_engine.sync_engine)
+    }
+    if read_engine is not engine:
+        metrics["read_sync"] = pool_metrics(read_engine)
+        metrics["read_async"] = pool_metrics(async_read_engine.sync_engine)
+    return metrics
+
+@router.get("/cache")
+def get_cache_metrics():
+    """Hit/miss counters of the /full response cache"""
+    if full_cache is None:
+        return {"backend": "off"}
+    return full_cache.stats()
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Per-route request metrics in Prometheus text format"""
+    # async: read on the event loop thread, where the middleware writes them
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,11 @@
+# Product Full-Text Search Module
+from .routes import router
+from .search_index import install_product_search, rebuild_product_search
+from .services import search_products
+
+__all__ = [
+    "router",
+    "install_product_search",
+    "rebuild_product_search",
+    "search_products",
+]
@@ -0,0 +1,23 @@
+# routes.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from core.database import get_read_db
+from . import services
+from .search_index import PRODUCT_TABLES
+
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+@router.get("/")
+def search(
+    q: str = Query(..., min_length=1),
+    service_type: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    """Prefix search over EUT name, manufacturer, model and serial number, best match first"""
+    if service_type and service_type not in PRODUCT_TABLES:
+        raise HTTPException(status_code=400, detail=f"Unknown service_type '{service_type}'")
+
+    return services.search_products(db, q, service_type=service_type, limit=limit)
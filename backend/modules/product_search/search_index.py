@@ -0,0 +1,90 @@
+"""
+SQLite FTS5 index over the product details of every service.
+
+The product_search virtual table is kept in sync by triggers on each
+*_product_details table, so any writer (services, scripts, bulk imports)
+updates it without extra code. Each FTS row id is derived from the product
+row id and a per-service code, which lets triggers update and delete by
+rowid instead of scanning the index.
+"""
+from sqlalchemy import event, text
+from core.database import Base
+from modules.service_engine import services as engine_services
+
+FTS_TABLE = "product_search"
+SEARCH_COLUMNS = ("eut_name", "manufacturer", "model_no", "serial_no")
+
+# FTS rowid = product row id * ROWID_STRIDE + the service's code
+ROWID_STRIDE = 8
+
+# service_type -> (product model, service code used in the FTS rowid)
+PRODUCT_TABLES = {
+    key: (service.models.product, service.code)
+    for key, service in engine_services.items()
+}
+
+
+def _rowid(ref, code):
+    return f"{ref}.id * {ROWID_STRIDE} + {code}"
+
+
+def _values(service_type, ref, code):
+    columns = ", ".join(f"{ref}.{column}" for column in SEARCH_COLUMNS)
+    return f"{_rowid(ref, code)}, '{service_type}', {ref}.{service_type}_request_id, {columns}"
+
+
+def _statements():
+    columns = ", ".join(SEARCH_COLUMNS)
+    yield (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"service_type UNINDEXED, request_id UNINDEXED, {columns}, "
+        f"tokenize = 'unicode61', prefix = '2 3')"
+    )
+
+    insert = f"INSERT INTO {FTS_TABLE}(rowid, service_type, request_id, {columns})"
+    for service_type, (model, code) in PRODUCT_TABLES.items():
+        table = model.__tablename__
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN "
+            f"{insert} VALUES ({_values(service_type, 'new', code)}); END"
+        )
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE ON {table} BEGIN "
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = {_rowid('old', code)}; "
+            f"{insert} VALUES ({_values(service_type, 'new', code)}); END"
+        )
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM {FTS_TABLE} WHERE rowid = {_rowid('old', code)}; END"
+        )
+
+
+def install_product_search(connection):
+    """Create the FTS table and triggers if missing; backfill a new table"""
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE}
+    ).first()
+
+    for statement in _statements():
+        connection.execute(text(statement))
+
+    if not exists:
+        rebuild_product_search(connection)
+
+
+def rebuild_product_search(connection):
+    """Repopulate product_search from the product tables"""
+    columns = ", ".join(SEARCH_COLUMNS)
+    connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    for service_type, (model, code) in PRODUCT_TABLES.items():
+        connection.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, service_type, request_id, {columns}) "
+            f"SELECT {_values(service_type, 'p', code)} FROM {model.__tablename__} AS p"
+        ))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_on_create_all(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        install_product_search(connection)
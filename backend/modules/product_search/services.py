@@ -0,0 +1,81 @@
+# services.py
+import re
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+from modules.request_index.models import ServiceRequestIndex
+from .search_index import FTS_TABLE, PRODUCT_TABLES, ROWID_STRIDE
+
+# bm25 weights in column order: service_type, request_id, eut_name,
+# manufacturer, model_no, serial_no
+BM25_WEIGHTS = "0, 0, 10.0, 5.0, 5.0, 5.0"
+
+# Escapes %, _ and itself in LIKE patterns built from search terms
+LIKE_ESCAPE = "\\"
+
+
+def build_match_query(q: str):
+    """Turn free text into an FTS5 query: every term must match as a prefix"""
+    terms = [term.replace('"', "") for term in q.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+def search_products(db: Session, q: str, service_type: str | None = None, limit: int = 20):
+    match = build_match_query(q)
+    if not match:
+        return {"items": []}
+
+    if db.get_bind().dialect.name != "sqlite":
+        return _search_request_index(db, q, service_type, limit)
+
+    # The service code is part of the rowid
+    service_filter = ""
+    params = {"match": match, "limit": limit}
+    if service_type:
+        service_filter = f" AND rowid % {ROWID_STRIDE} = :code"
+        params["code"] = PRODUCT_TABLES[service_type][1]
+
+    # Every match is ranked; FTS5 keeps only the best `limit` while sorting by rank
+    sql = (
+        f"SELECT service_type, request_id, eut_name, manufacturer, model_no, serial_no, "
+        f"rank AS score "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match "
+        f"AND rank MATCH 'bm25({BM25_WEIGHTS})'{service_filter} "
+        f"ORDER BY rank LIMIT :limit"
+    )
+
+    rows = db.execute(text(sql), params).mappings().all()
+    return {"items": [dict(row) for row in rows]}
+
+
+def _search_request_index(db: Session, q: str, service_type: str | None, limit: int):
+    """Fallback for databases without FTS5: prefix match on the request index"""
+    query = db.query(ServiceRequestIndex)
+    if service_type:
+        query = query.filter(ServiceRequestIndex.service_type == service_type)
+
+    for term in re.split(r"\s+", q.strip()):
+        # Match the term literally, so "50%" or "a_b" are not wildcards
+        for char in (LIKE_ESCAPE, "%", "_"):
+            term = term.replace(char, LIKE_ESCAPE + char)
+        pattern = f"{term}%"
+        query = query.filter(or_(
+            ServiceRequestIndex.eut_name.ilike(pattern, escape=LIKE_ESCAPE),
+            ServiceRequestIndex.manufacturer.ilike(pattern, escape=LIKE_ESCAPE),
+            ServiceRequestIndex.model_no.ilike(pattern, escape=LIKE_ESCAPE)
+        ))
+
+    rows = query.order_by(ServiceRequestIndex.id.desc()).limit(limit).all()
+    return {
+        "items": [
+            {
+                "service_type": entry.service_type,
+                "request_id": entry.request_id,
+                "eut_name": entry.eut_name,
+                "manufacturer": entry.manufacturer,
+                "model_no": entry.model_no,
+                "serial_no": None,
+                "score": None
+            }
+            for entry in rows
+        ]
+    }
@@ -0,0 +1,14 @@
+# Cross-service Request Index Module
+from .routes import router
+from .models import ServiceRequestIndex
+from .services import (
+    update_request_index,
+    search_requests
+)
+
+__all__ = [
+    "router",
+    "ServiceRequestIndex",
+    "update_request_index",
+    "search_requests",
+]
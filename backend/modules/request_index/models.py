@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from core.database import Base
+
+class ServiceRequestIndex(Base):
+    """One row per request of any service, kept in sync by each module's services"""
+    __tablename__ = "service_requests_index"
+    __table_args__ = (
+        UniqueConstraint("service_type", "request_id", name="uq_service_requests_index_service_request"),
+        Index("ix_service_requests_index_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_service_requests_index_service_status_created_at_id", "service_type", "status", "created_at", "id"),
+        Index("ix_service_requests_index_created_at_id", "created_at", "id"),
+        Index("ix_service_requests_index_updated_at_id", "updated_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    service_type = Column(String, nullable=False)  # testing, calibration, design, ...
+    request_id = Column(Integer, nullable=False)
+    status = Column(String)
+
+    eut_name = Column(String)
+    manufacturer = Column(Text)
+    model_no = Column(String)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
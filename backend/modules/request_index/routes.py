@@ -0,0 +1,41 @@
+# routes.py
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from core.database import get_read_db
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from modules.service_engine import SERVICE_TYPES
+from . import services
+
+
+router = APIRouter(prefix="/requests", tags=["Requests"])
+
+@router.get("/")
+def search_requests(
+    service_type: Optional[str] = None,
+    status: Optional[str] = None,
+    eut_name: Optional[str] = None,
+    manufacturer: Optional[str] = None,
+    model_no: Optional[str] = None,
+    sort: str = "created_at",
+    after_id: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db)
+):
+    """List requests across all services, newest first, from the shared index table"""
+    if service_type and service_type not in SERVICE_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unknown service_type '{service_type}'")
+    if sort not in services.SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(services.SORT_FIELDS)}")
+
+    return services.search_requests(
+        db,
+        service_type=service_type,
+        status=status,
+        eut_name=eut_name,
+        manufacturer=manufacturer,
+        model_no=model_no,
+        sort=sort,
+        after_id=after_id,
+        limit=limit
+    )
@@ -0,0 +1,89 @@
+# services.py
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from core.cache import mark_written
+from core.database import primary_pins
+from core.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from .models import ServiceRequestIndex
+
+SORT_FIELDS = ("created_at", "updated_at")
+
+
+def update_request_index(db: Session, service_type: str, request_id: int, **fields):
+    """
+    Create or update the index row for a request.
+    Does not commit: callers run it inside their own transaction.
+
+    Every write to a request goes through here, so this is also where the
+    request is pinned to the primary for read-your-writes and its cached
+    /full response is marked for invalidation on commit.
+    """
+    primary_pins.pin((service_type, request_id))
+    mark_written(db, (service_type, request_id))
+
+    entry = db.query(ServiceRequestIndex).filter(
+        ServiceRequestIndex.service_type == service_type,
+        ServiceRequestIndex.request_id == request_id
+    ).first()
+
+    if not entry:
+        entry = ServiceRequestIndex(service_type=service_type, request_id=request_id)
+        db.add(entry)
+
+    for name, value in fields.items():
+        setattr(entry, name, value)
+
+    # Always bump, even when no indexed field changed (e.g. a standards save)
+    entry.updated_at = func.now()
+    return entry
+
+
+def search_requests(
+    db: Session,
+    service_type: str | None = None,
+    status: str | None = None,
+    eut_name: str | None = None,
+    manufacturer: str | None = None,
+    model_no: str | None = None,
+    sort: str = "created_at",
+    after_id: int | None = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    query = db.query(ServiceRequestIndex)
+
+    if service_type:
+        query = query.filter(ServiceRequestIndex.service_type == service_type)
+    if status:
+        query = query.filter(ServiceRequestIndex.status == status)
+    # Prefix matches only; full-text search lives elsewhere
+    if eut_name:
+        query = query.filter(ServiceRequestIndex.eut_name.startswith(eut_name, autoescape=True))
+    if manufacturer:
+        query = query.filter(ServiceRequestIndex.manufacturer.startswith(manufacturer, autoescape=True))
+    if model_no:
+        query = query.filter(ServiceRequestIndex.model_no.startswith(model_no, autoescape=True))
+
+    rows, next_after_id = keyset_page(
+        query,
+        ServiceRequestIndex,
+        after_id,
+        limit,
+        sort_column=getattr(ServiceRequestIndex, sort)
+    )
+
+    return {
+        "items": [
+            {
+                "service_type": entry.service_type,
+                "request_id": entry.request_id,
+                "status": entry.status,
+                "eut_name": entry.eut_name,
+                "manufacturer": entry.manufacturer,
+                "model_no": entry.model_no,
+                "created_at": entry.created_at.isoformat() if entry.created_at else None,
+                "updated_at": entry.updated_at.isoformat() if entry.updated_at else None
+            }
+            for entry in rows
+        ],
+        "next_after_id": next_after_id
+    }
@@ -0,0 +1,32 @@
+# Service Engine Module
+#
+# Builds the models, services and router of every service listed in
+# config.SERVICES. Importing this package declares all service tables.
+from .config import SERVICES, SERVICE_TYPES
+from .models import ServiceModels, build_models
+from .services import RequestService, RequestNotFoundError
+from .routes import build_router
+
+services = {
+    key: RequestService(key, config, build_models(key, config))
+    for key, config in SERVICES.items()
+}
+
+routers = [build_router(service) for service in services.values()]
+
+
+def get_service(key: str) -> RequestService:
+    """Return the engine service for a service type (e.g. "testing")"""
+    return services[key]
+
+
+__all__ = [
+    "SERVICES",
+    "SERVICE_TYPES",
+    "ServiceModels",
+    "RequestService",
+    "RequestNotFoundError",
+    "services",
+    "routers",
+    "get_service",
+]
@@ -0,0 +1,158 @@
+"""
+Bulk import of requests from CSV or JSONL.
+
+The file is read as a stream, one row at a time. Each row is validated
+with ImportRowSchema (the wizard's own step schemas), and valid rows are
+inserted IMPORT_BATCH_SIZE at a time with one multi-row INSERT per table
+and one commit per batch. Invalid rows are skipped and reported with
+their line number; they do not stop the import.
+
+JSONL: one object per line, shaped like ImportRowSchema
+    {"product_details": {...}, "requirements": {...}, "standards": {...}, "lab_selection": {...}}
+
+CSV: one column per ProductDetailsSchema field, with the dimensions in
+length, width and height columns (or length_mm, width_mm and height_mm,
+as GET /export writes them), plus the optional test_type,
+selected_tests, regions, standards, selected_labs and remarks columns.
+List columns (industry, selected_tests, regions, standards,
+selected_labs) separate their items with ";". Empty cells are null.
+"""
+import csv
+import io
+import json
+from pathlib import Path
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from .schemas import ImportRowSchema, ProductDetailsSchema
+from .services import RequestService
+
+IMPORT_BATCH_SIZE = 1000
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+LIST_SEPARATOR = ";"
+PRODUCT_COLUMNS = [name for name in ProductDetailsSchema.model_fields if name != "dimensions"]
+# Dimension -> the product table's column, which is what an export has
+DIMENSION_COLUMNS = {"length": "length_mm", "width": "width_mm", "height": "height_mm"}
+
+
+def detect_format(filename: str) -> str:
+    try:
+        return FORMATS[Path(filename).suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Cannot tell the format of '{filename}'; use a .csv or .jsonl file or pass format")
+
+
+def _split(value):
+    if not value:
+        return []
+    return [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+
+
+def _csv_row(record: dict) -> dict:
+    """Reshape a flat CSV record into the ImportRowSchema layout"""
+    cells = {
+        key.strip(): value.strip() or None
+        for key, value in record.items()
+        if key and isinstance(value, str)
+    }
+
+    product = {name: cells.get(name) for name in PRODUCT_COLUMNS}
+    product["industry"] = _split(cells.get("industry"))
+    product["dimensions"] = {
+        name: cells.get(name) or cells.get(column)
+        for name, column in DIMENSION_COLUMNS.items()
+    }
+    row = {"product_details": product}
+
+    if cells.get("test_type") or cells.get("selected_tests"):
+        row["requirements"] = {
+            "test_type": cells.get("test_type"),
+            "selected_tests": _split(cells.get("selected_tests")),
+        }
+    if cells.get("regions") or cells.get("standards"):
+        row["standards"] = {
+            "regions": _split(cells.get("regions")),
+            "standards": _split(cells.get("standards")),
+        }
+    if cells.get("selected_labs"):
+        row["lab_selection"] = {
+            "selected_labs": _split(cells.get("selected_labs")),
+            "remarks": cells.get("remarks"),
+        }
+    return row
+
+
+def read_rows(stream, fmt: str):
+    """
+    Yield (line number, row dict or error message) for each row of a
+    binary stream, without reading the whole file.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, _csv_row(record)
+    elif fmt == "jsonl":
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, f"Invalid JSON: {e.msg}"
+    else:
+        raise ValueError(f"Unknown import format '{fmt}'; use csv or jsonl")
+
+
+def _validation_messages(error: ValidationError):
+    return [
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+def import_requests(
+    db: Session,
+    service: RequestService,
+    stream,
+    fmt: str,
+    batch_size: int = IMPORT_BATCH_SIZE
+):
+    """
+    Import every valid row of `stream` as a new submitted request.
+    Returns {"imported", "failed", "errors": [{"row", "errors"}]}.
+    """
+    imported = 0
+    errors = []
+    batch = []  # [(line number, ImportRowSchema)]
+
+    def flush():
+        nonlocal imported
+        try:
+            service.import_batch(db, [row for _, row in batch])
+            db.commit()
+            imported += len(batch)
+        except SQLAlchemyError as e:
+            db.rollback()
+            message = f"Batch not saved: {e.__class__.__name__}: {e.orig if hasattr(e, 'orig') else e}"
+            errors.extend({"row": line_no, "errors": [message]} for line_no, _ in batch)
+        batch.clear()
+
+    for line_no, data in read_rows(stream, fmt):
+        if isinstance(data, str):
+            errors.append({"row": line_no, "errors": [data]})
+            continue
+        try:
+            batch.append((line_no, ImportRowSchema.model_validate(data)))
+        except ValidationError as e:
+            errors.append({"row": line_no, "errors": _validation_messages(e)})
+            continue
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    return {"imported": imported, "failed": len(errors), "errors": errors}
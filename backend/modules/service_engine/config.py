@@ -0,0 +1,42 @@
+# Service configurations
+#
+# Every service gets the same tables, services and routes, built by the
+# engine from this dict. Table and class names follow
+# "{key}_requests" / "{name}Request", "{key}_product_details" /
+# "{name}ProductDetails", and so on.
+#
+# "code" identifies the service inside shared indexes (the product search
+# rowid): unique, below 8, and never renumbered once in use.
+SERVICES = {
+    "testing": {
+        "code": 0,
+        "name": "Testing",
+        # Testing was the first module; these child tables predate the
+        # naming convention and keep their original, unprefixed names
+        "unprefixed": ("product", "document", "lab"),
+    },
+    "calibration": {
+        "code": 1,
+        "name": "Calibration",
+        # Confirmation (details page) and approval (review page) checkboxes
+        "confirmations": True,
+    },
+    "design": {
+        "code": 2,
+        "name": "Design",
+    },
+    "certification": {
+        "code": 3,
+        "name": "Certification",
+    },
+    "debugging": {
+        "code": 4,
+        "name": "Debugging",
+    },
+    "simulation": {
+        "code": 5,
+        "name": "Simulation",
+    },
+}
+
+SERVICE_TYPES = tuple(SERVICES)
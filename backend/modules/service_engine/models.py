@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+@dataclass
+class ServiceModels:
+    root: type
+    product: type
+    document: type
+    requirements: type
+    standards: type
+    lab: type
+    confirmation: type | None = None
+    approval: type | None = None
+
+
+# (class suffix, table suffix) of each child table
+CHILD_TABLES = {
+    "product": ("ProductDetails", "product_details"),
+    "document": ("TechnicalDocument", "technical_documents"),
+    "requirements": ("Requirements", "requirements"),
+    "standards": ("Standards", "standards"),
+    "lab": ("LabSelection", "lab_selection"),
+    "confirmation": ("Confirmation", "confirmations"),
+    "approval": ("Approval", "approvals"),
+}
+
+
+def _product_columns():
+    return {
+        "eut_name": Column(String),
+        "eut_quantity": Column(String),
+        "manufacturer": Column(Text),
+        "model_no": Column(String),
+        "serial_no": Column(String),
+
+        "supply_voltage": Column(String),
+        "operating_frequency": Column(String),
+        "current": Column(String),
+        "weight": Column(String),
+
+        "length_mm": Column(String),
+        "width_mm": Column(String),
+        "height_mm": Column(String),
+
+        "power_ports": Column(String),
+        "signal_lines": Column(String),
+
+        "software_name": Column(String),
+        "software_version": Column(String),
+
+        "industry": Column(JSON),
+        "industry_other": Column(String),
+
+        "preferred_date": Column(String),
+        "notes": Column(Text),
+    }
+
+
+def _document_columns():
+    return {
+        "doc_type": Column(String),
+        "file_name": Column(String),
+        "file_path": Column(String),
+        "file_size": Column(Integer),
+        "checksum": Column(String),  # SHA-256 hex of the stored file
+        "uploaded_at": Column(DateTime(timezone=True), server_default=func.now()),
+    }
+
+
+def _requirements_columns():
+    return {
+        "test_type": Column(String),
+        "selected_tests": Column(JSON),
+    }
+
+
+def _standards_columns():
+    return {
+        "regions": Column(JSON),
+        "standards": Column(JSON),
+    }
+
+
+def _lab_columns():
+    return {
+        "selected_labs": Column(JSON),
+        "region": Column(JSON),  # Store as {country, state, city}
+        "remarks": Column(Text),
+    }
+
+
+def _confirmation_columns():
+    # Booleans stored as strings: "true" or "false"
+    return {
+        "approve_plan": Column(String),
+        "understand_tests": Column(String),
+        "created_at": Column(DateTime(timezone=True), server_default=func.now()),
+        "updated_at": Column(DateTime(timezone=True), onupdate=func.now()),
+    }
+
+
+def _approval_columns():
+    # Booleans stored as strings: "true" or "false"
+    return {
+        "confirm_accurate": Column(String),
+        "confirm_approve": Column(String),
+        "confirm_understand": Column(String),
+        "created_at": Column(DateTime(timezone=True), server_default=func.now()),
+        "updated_at": Column(DateTime(timezone=True), onupdate=func.now()),
+    }
+
+
+COLUMNS = {
+    "product": _product_columns,
+    "document": _document_columns,
+    "requirements": _requirements_columns,
+    "standards": _standards_columns,
+    "lab": _lab_columns,
+    "confirmation": _confirmation_columns,
+    "approval": _approval_columns,
+}
+
+
+def _declare(class_name, table_name, attrs):
+    attrs = {"__tablename__": table_name, "__qualname__": class_name, **attrs}
+    return type(class_name, (Base,), attrs)
+
+
+def build_models(key: str, config: dict) -> ServiceModels:
+    """Declare the root and child tables of one service"""
+    name = config["name"]
+    root_table = f"{key}_requests"
+    unprefixed = config.get("unprefixed", ())
+
+    parts = ["product", "document", "requirements", "standards", "lab"]
+    if config.get("confirmations"):
+        parts += ["confirmation", "approval"]
+
+    children = {}
+    for part in parts:
+        class_suffix, table_suffix = CHILD_TABLES[part]
+        if part in unprefixed:
+            class_name, table_name = class_suffix, table_suffix
+        else:
+            class_name, table_name = f"{name}{class_suffix}", f"{key}_{table_suffix}"
+
+        # Indexed for the per-request lookups and /full joins; every child
+        # except documents is one row per request, so that index is unique
+        children[part] = _declare(class_name, table_name, {
+            "id": Column(Integer, primary_key=True),
+            f"{key}_request_id": Column(
+                Integer,
+                ForeignKey(f"{root_table}.id"),
+                index=True,
+                unique=part != "document"
+            ),
+            **COLUMNS[part](),
+        })
+
+    relationships = {
+        "product": relationship(children["product"], uselist=False),
+        "documents": relationship(children["document"], order_by=children["document"].id),
+        "requirements": relationship(children["requirements"], uselist=False),
+        "standards": relationship(children["standards"], uselist=False),
+        "lab": relationship(children["lab"], uselist=False),
+    }
+    if config.get("confirmations"):
+        relationships["confirmation"] = relationship(children["confirmation"], uselist=False)
+        relationships["approval"] = relationship(children["approval"], uselist=False)
+
+    root = _declare(f"{name}Request", root_table, {
+        "__table_args__": (
+            # Keyset pagination for the list endpoint, with and without a status filter
+            Index(f"ix_{root_table}_status_created_at_id", "status", "created_at", "id"),
+            Index(f"ix_{root_table}_created_at_id", "created_at", "id"),
+        ),
+        "id": Column(Integer, primary_key=True, index=True),
+        "status": Column(String, default="submitted"),
+        "created_at": Column(DateTime(timezone=True), server_default=func.now()),
+        "updated_at": Column(DateTime(timezone=True), onupdate=func.now()),
+        **relationships,
+    })
+
+    return ServiceModels(root=root, **children)
@@ -0,0 +1,345 @@
+# routes.py
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, UploadFile, File, Form, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Annotated, List, Optional
+from datetime import datetime
+from core.database import get_db, get_async_db, get_async_read_db, read_session, async_read_session
+from core.batch import BatchIdsSchema, batch_results
+from core.query_budget import query_budget
+from core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from core.uploads import UploadTooLargeError
+from modules.document_store import resumable
+from modules.document_store.downloads import document_response
+from modules.document_store.services import legacy_upload_dir
+from modules.document_store.schemas import ResumableUploadSchema
+from . import bulk_import, schemas
+from .services import RequestService, RequestNotFoundError
+
+
+def build_router(service: RequestService) -> APIRouter:
+    """
+    Build the /{key}-request router for one service.
+    JSON wizard routes are async and use get_async_db; file upload and
+    download routes stay sync (threadpool) because they do blocking file I/O.
+    GET routes use read sessions (DATABASE_READ_URL), writes the primary.
+    """
+    key = service.key
+    name = service.name
+    rid = f"{key}_request_id"
+    # Path parameters keep their per-service names ({testing_request_id}, ...)
+    RequestId = Annotated[int, Path(alias=rid)]
+
+    # GET routes read from the replica, except for requests written moments ago
+    def get_request_read_db(request_id: RequestId):
+        db = read_session((key, request_id))
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_request_read_db(request_id: RequestId):
+        async with async_read_session((key, request_id)) as db:
+            yield db
+
+    router = APIRouter(prefix=f"/{key}-request", tags=[f"{name} Request"])
+
+    @router.get(f"/{{{rid}}}")
+    async def get_request(request_id: RequestId, db: AsyncSession = Depends(get_async_request_read_db)):
+        req = await service.get_request_async(db, request_id)
+
+        if not req:
+            raise HTTPException(status_code=404, detail="Not found")
+
+        return {"id": req.id, "status": req.status}
+
+    @router.get("/")
+    async def list_requests(
+        status: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_async_read_db)
+    ):
+        """List requests newest first; pass next_after_id back as after_id for the next page"""
+        return await service.list_requests_async(
+            db,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+            after_id=after_id,
+            limit=limit
+        )
+
+    @router.post("/")
+    async def start_request(db: AsyncSession = Depends(get_async_db)):
+        return await service.create_async(db)
+
+    @router.post("/import")
+    @query_budget(None)  # a few statements per batch of rows
+    def import_requests(
+        file: UploadFile = File(...),
+        format: Optional[str] = Query(None, pattern="^(csv|jsonl)$"),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Create many requests from a CSV or JSONL file (see bulk_import for
+        the layout). Valid rows are imported in batches; invalid rows are
+        skipped and listed in errors with their line number.
+        """
+        try:
+            fmt = format or bulk_import.detect_format(file.filename or "")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return bulk_import.import_requests(db, service, file.file, fmt)
+
+    @router.post(f"/{{{rid}}}/product")
+    async def save_product(
+        request_id: RequestId,
+        payload: schemas.ProductDetailsSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        try:
+            await service.save_product_details_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "saved"}
+
+    @router.post(f"/{{{rid}}}/upload-documents")
+    def upload_documents(
+        request_id: RequestId,
+        files: List[UploadFile] = File(...),
+        doc_types: List[str] = Form(...),
+        db: Session = Depends(get_db)
+    ):
+        """
+        Upload technical documents for a request.
+        Files are stored once per content in the blob store (UPLOAD_DIR/blobs/).
+        Runs in the threadpool; each file is streamed to disk in fixed-size chunks.
+        """
+        try:
+            saved_files = service.save_uploaded_files(
+                db,
+                request_id,
+                files,
+                doc_types
+            )
+            return {"status": "success", "files": saved_files}
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to upload files: {str(e)}")
+
+    @router.post(f"/{{{rid}}}/documents")
+    async def save_documents(
+        request_id: RequestId,
+        payload: schemas.TechnicalDocumentsSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        try:
+            await service.save_technical_documents_async(
+                db,
+                request_id,
+                payload.documents
+            )
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "documents saved"}
+
+    @router.get(f"/{{{rid}}}/documents/{{document_id}}")
+    def download_document(
+        request_id: RequestId,
+        document_id: int,
+        request: Request,
+        db: Session = Depends(get_request_read_db)
+    ):
+        """Serve an uploaded document; supports Range, If-None-Match and If-Modified-Since"""
+        document = service.get_technical_document(db, request_id, document_id)
+
+        if not document:
+            raise HTTPException(status_code=404, detail="Document not found")
+
+        return document_response(request, document, legacy_upload_dir(key, request_id))
+
+    @router.post(f"/{{{rid}}}/requirements")
+    async def save_requirements(
+        request_id: RequestId,
+        payload: schemas.RequirementsSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        try:
+            await service.save_requirements_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "saved"}
+
+    @router.post(f"/{{{rid}}}/standards")
+    async def save_standards(
+        request_id: RequestId,
+        payload: schemas.StandardsSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        try:
+            await service.save_standards_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "saved"}
+
+    if service.models.confirmation:
+        @router.post(f"/{{{rid}}}/confirmation")
+        async def save_confirmation(
+            request_id: RequestId,
+            payload: schemas.ConfirmationSchema,
+            db: AsyncSession = Depends(get_async_db)
+        ):
+            """Save confirmation checkboxes from details page"""
+            try:
+                await service.save_confirmation_async(db, request_id, payload)
+            except RequestNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            return {"status": "confirmation saved"}
+
+        @router.post(f"/{{{rid}}}/approval")
+        async def save_approval(
+            request_id: RequestId,
+            payload: schemas.ApprovalSchema,
+            db: AsyncSession = Depends(get_async_db)
+        ):
+            """Save approval checkboxes from review page"""
+            try:
+                await service.save_approval_async(db, request_id, payload)
+            except RequestNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            return {"status": "approval saved"}
+
+    @router.post(f"/{{{rid}}}/lab-selection/draft")
+    async def save_lab_selection_draft(
+        request_id: RequestId,
+        payload: schemas.LabSelectionSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Save lab selection as draft"""
+        try:
+            await service.save_lab_selection_draft_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "draft saved"}
+
+    @router.post(f"/{{{rid}}}/submit")
+    async def submit(
+        request_id: RequestId,
+        payload: schemas.LabSelectionSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        try:
+            await service.submit_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "submitted"}
+
+    @router.post(f"/{{{rid}}}/bundle")
+    async def save_bundle(
+        request_id: RequestId,
+        payload: schemas.RequestBundleSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """
+        Save all wizard steps (and submit unless submit is false) in one
+        transaction. Files are uploaded first through upload-documents or
+        the resumable uploads; pass technical_documents only for metadata.
+        """
+        if (payload.confirmation or payload.approval) and not service.models.confirmation:
+            raise HTTPException(status_code=400, detail=f"{name} requests have no confirmation or approval step")
+        try:
+            await service.save_bundle_async(db, request_id, payload)
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        return {"status": "submitted" if payload.submit else "saved"}
+
+    @router.get(f"/{{{rid}}}/full")
+    async def get_full_request(
+        request_id: RequestId,
+        db: AsyncSession = Depends(get_async_request_read_db)
+    ):
+        data = await service.get_full_cached_async(db, request_id)
+
+        if not data:
+            raise HTTPException(status_code=404, detail=f"{name} request not found")
+
+        return data
+
+    @router.post("/full:batch")
+    async def get_full_requests_batch(
+        payload: BatchIdsSchema,
+        db: AsyncSession = Depends(get_async_db)
+    ):
+        """Fetch many full requests in one call; unknown ids are listed in not_found"""
+        results = await service.get_full_many_async(db, payload.ids)
+        return batch_results(payload.ids, results)
+
+    @router.post(f"/{{{rid}}}/uploads")
+    def start_resumable_upload(
+        request_id: RequestId,
+        payload: ResumableUploadSchema,
+        db: Session = Depends(get_db)
+    ):
+        """
+        Start a resumable upload. Send each chunk with
+        PUT /uploads/{upload_id}/chunks/{index}, then POST /uploads/{upload_id}/complete.
+        Sessions expire UPLOAD_SESSION_TTL_HOURS after they start.
+        """
+        try:
+            return service.start_chunked_upload(db, request_id, payload)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except RequestNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    @router.put(f"/{{{rid}}}/uploads/{{upload_id}}/chunks/{{index}}")
+    async def upload_chunk(
+        request_id: RequestId,
+        upload_id: str,
+        index: int,
+        request: Request
+    ):
+        """Store one chunk (raw request body); chunks may be sent in any order or in parallel"""
+        try:
+            await resumable.write_chunk(key, request_id, upload_id, index, request.stream())
+        except resumable.UploadSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"status": "received", "index": index}
+
+    @router.get(f"/{{{rid}}}/uploads/{{upload_id}}")
+    def get_resumable_upload(
+        request_id: RequestId,
+        upload_id: str
+    ):
+        """Report received chunks and byte ranges so an interrupted upload can resume"""
+        try:
+            return resumable.upload_status(key, request_id, upload_id)
+        except resumable.UploadSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+
+    @router.post(f"/{{{rid}}}/uploads/{{upload_id}}/complete")
+    def complete_resumable_upload(
+        request_id: RequestId,
+        upload_id: str,
+        db: Session = Depends(get_db)
+    ):
+        """Assemble the chunks and create the technical document"""
+        try:
+            saved_file = service.save_chunked_upload(db, request_id, upload_id)
+        except (RequestNotFoundError, resumable.UploadSessionNotFoundError) as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"status": "success", "file": saved_file}
+
+    return router
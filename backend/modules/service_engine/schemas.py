@@ -0,0 +1,90 @@
+# schemas.py
+# Request payloads shared by every service
+from pydantic import BaseModel
+from typing import List, Optional, Dict
+
+class DimensionsSchema(BaseModel):
+    length: str
+    width: str
+    height: str
+
+class ProductDetailsSchema(BaseModel):
+    eut_name: str
+    eut_quantity: str
+    manufacturer: str
+    model_no: str
+    serial_no: str
+
+    supply_voltage: str
+    operating_frequency: Optional[str]
+    current: str
+    weight: str
+
+    dimensions: DimensionsSchema
+
+    power_ports: str
+    signal_lines: str
+    software_name: Optional[str]
+    software_version: Optional[str]
+
+    industry: List[str]
+    industry_other: Optional[str]
+
+    preferred_date: Optional[str]
+    notes: Optional[str]
+
+class TechnicalDocumentItemSchema(BaseModel):
+    # Metadata only; stored files come from the upload endpoints, never a client path
+    doc_type: str
+    file_name: str
+    file_size: int | None = 0
+
+
+class TechnicalDocumentsSchema(BaseModel):
+    documents: List[TechnicalDocumentItemSchema]
+
+class RequirementsSchema(BaseModel):
+    test_type: str
+    selected_tests: List[str]
+
+
+class StandardsSchema(BaseModel):
+    regions: List[str]
+    standards: List[str]
+
+
+class LabSelectionSchema(BaseModel):
+    selected_labs: List[str]
+    region: Optional[Dict[str, Optional[str]]] = None  # {country, state, city}
+    remarks: Optional[str] = None
+
+
+class ConfirmationSchema(BaseModel):
+    approve_plan: bool
+    understand_tests: bool
+
+
+class ApprovalSchema(BaseModel):
+    confirm_accurate: bool
+    confirm_approve: bool
+    confirm_understand: bool
+
+
+class RequestBundleSchema(BaseModel):
+    """Every wizard step in one payload; steps left out are not touched"""
+    product_details: Optional[ProductDetailsSchema] = None
+    technical_documents: Optional[List[TechnicalDocumentItemSchema]] = None
+    requirements: Optional[RequirementsSchema] = None
+    standards: Optional[StandardsSchema] = None
+    confirmation: Optional[ConfirmationSchema] = None
+    approval: Optional[ApprovalSchema] = None
+    lab_selection: Optional[LabSelectionSchema] = None
+    submit: bool = True
+
+
+class ImportRowSchema(BaseModel):
+    """One request of a bulk import file"""
+    product_details: ProductDetailsSchema
+    requirements: Optional[RequirementsSchema] = None
+    standards: Optional[StandardsSchema] = None
+    lab_selection: Optional[LabSelectionSchema] = None
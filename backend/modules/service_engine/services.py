@@ -0,0 +1,632 @@
+# services.py
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from core.cache import full_cache
+from core.config import get_settings
+from core.pagination import keyset_page, DEFAULT_PAGE_SIZE
+from modules.document_store.services import store_blob
+from modules.document_store.resumable import assemble_upload, create_upload_session, discard_upload_session
+from modules.document_store.schemas import ResumableUploadSchema
+from modules.request_index.models import ServiceRequestIndex
+from modules.request_index.services import update_request_index
+from .models import ServiceModels
+from .schemas import (
+    ProductDetailsSchema,
+    RequirementsSchema,
+    StandardsSchema,
+    LabSelectionSchema,
+    ConfirmationSchema,
+    ApprovalSchema,
+    RequestBundleSchema
+)
+
+
+class RequestNotFoundError(ValueError):
+    pass
+
+
+class RequestService:
+    """
+    Create/save/submit/fetch operations for one service's request tables.
+    One instance exists per entry in config.SERVICES.
+
+    The *_async methods run the same code on an AsyncSession: run_sync
+    executes it in a greenlet whose database I/O goes through the async
+    driver, so an async route never blocks the event loop or a thread.
+    """
+
+    def __init__(self, key: str, config: dict, models: ServiceModels):
+        self.key = key
+        self.name = config["name"]
+        self.code = config["code"]
+        self.models = models
+        self.fk = f"{key}_request_id"
+
+    # --- helpers -----------------------------------------------------------
+
+    def _child(self, db: Session, model, request_id: int):
+        return db.query(model).filter(
+            getattr(model, self.fk) == request_id
+        ).first()
+
+    def _upsert_child(self, db: Session, model, request_id: int, values: dict, update=None):
+        """
+        Insert the request's row of a one-per-request child table or update
+        it, in one INSERT ... ON CONFLICT (<fk>) DO UPDATE, so two first saves
+        of the same step running at once both succeed instead of one of them
+        hitting the unique index. `update` limits the columns an existing row
+        gets (default: all of `values`). Returns the row.
+        """
+        dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(model).values(**{self.fk: request_id}, **values)
+        set_ = {name: stmt.excluded[name] for name in (values if update is None else update)}
+        if "updated_at" in model.__table__.c:
+            set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=[self.fk], set_=set_).returning(model)
+        return db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+    def _get_root(self, db: Session, request_id: int):
+        root = self.models.root
+        req = db.query(root).filter(root.id == request_id).first()
+
+        if not req:
+            raise RequestNotFoundError(f"{self.name}Request not found")
+        return req
+
+    def _eager_options(self, loader):
+        root = self.models.root
+        options = [
+            loader(root.product),
+            loader(root.documents),
+            loader(root.requirements),
+            loader(root.standards),
+            loader(root.lab)
+        ]
+        if self.models.confirmation:
+            options += [loader(root.confirmation), loader(root.approval)]
+        return options
+
+    # --- writes ------------------------------------------------------------
+
+    def create(self, db: Session):
+        req = self.models.root(status="submitted")
+        db.add(req)
+        db.flush()
+        update_request_index(db, self.key, req.id, status=req.status)
+        db.commit()
+        db.refresh(req)
+        return req
+
+    def save_draft(self, db: Session, request_id: int):
+        req = self._get_root(db, request_id)
+        req.status = "draft"
+        update_request_index(db, self.key, request_id, status="draft")
+        db.commit()
+
+    def _product_values(self, payload: ProductDetailsSchema):
+        """Column values of a product details row"""
+        return {
+            "eut_name": payload.eut_name,
+            "eut_quantity": payload.eut_quantity,
+            "manufacturer": payload.manufacturer,
+            "model_no": payload.model_no,
+            "serial_no": payload.serial_no,
+            "supply_voltage": payload.supply_voltage,
+            "operating_frequency": payload.operating_frequency,
+            "current": payload.current,
+            "weight": payload.weight,
+
+            "length_mm": payload.dimensions.length,
+            "width_mm": payload.dimensions.width,
+            "height_mm": payload.dimensions.height,
+
+            "power_ports": payload.power_ports,
+            "signal_lines": payload.signal_lines,
+            "software_name": payload.software_name,
+            "software_version": payload.software_version,
+
+            "industry": payload.industry,
+            "industry_other": payload.industry_other,
+            "preferred_date": payload.preferred_date,
+            "notes": payload.notes,
+        }
+
+    def _apply_product_details(self, db: Session, request_id: int, payload: ProductDetailsSchema):
+        self._upsert_child(db, self.models.product, request_id, self._product_values(payload))
+
+    def _product_index_fields(self, payload: ProductDetailsSchema):
+        return {
+            "eut_name": payload.eut_name,
+            "manufacturer": payload.manufacturer,
+            "model_no": payload.model_no
+        }
+
+    def save_product_details(self, db: Session, request_id: int, payload: ProductDetailsSchema):
+        self._get_root(db, request_id)
+        self._apply_product_details(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id, **self._product_index_fields(payload))
+        db.commit()
+
+    def _apply_technical_documents(self, db: Session, request_id: int, documents: list):
+        for doc in documents:
+            td = self.models.document(
+                **{self.fk: request_id},
+                doc_type=doc.doc_type,
+                file_name=doc.file_name,
+                file_size=doc.file_size or 0
+            )
+            db.add(td)
+
+    def save_technical_documents(self, db: Session, request_id: int, documents: list):
+        self._get_root(db, request_id)
+        self._apply_technical_documents(db, request_id, documents)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+
+    def save_uploaded_files(self, db: Session, request_id: int, files: list, doc_types: list):
+        """
+        Save uploaded files to the shared content-addressed blob store
+        (UPLOAD_DIR/blobs/) and store file metadata in database.
+        Identical files uploaded again, by any request or service, reuse the stored blob.
+        """
+        # Before any file is written to the blob store
+        self._get_root(db, request_id)
+        saved_files = []
+
+        for file, doc_type in zip(files, doc_types):
+            original_filename = file.filename
+
+            # Streamed in chunks and hashed; duplicates only bump a reference count
+            relative_path, file_size, checksum = store_blob(
+                db,
+                file.file,
+                get_settings().MAX_UPLOAD_SIZE
+            )
+
+            # Create database record
+            td = self.models.document(
+                **{self.fk: request_id},
+                doc_type=doc_type,
+                file_name=original_filename,
+                file_path=relative_path,
+                file_size=file_size,
+                checksum=checksum
+            )
+            db.add(td)
+            saved_files.append({
+                "doc_type": doc_type,
+                "file_name": original_filename,
+                "file_path": relative_path,
+                "file_size": file_size,
+                "checksum": checksum
+            })
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+        return saved_files
+
+    def start_chunked_upload(self, db: Session, request_id: int, payload: ResumableUploadSchema):
+        """Start a resumable upload session for an existing request"""
+        self._get_root(db, request_id)
+        return create_upload_session(self.key, request_id, payload, get_settings().MAX_UPLOAD_SIZE)
+
+    def save_chunked_upload(self, db: Session, request_id: int, upload_id: str):
+        """Turn a fully received resumable upload into a technical document"""
+        self._get_root(db, request_id)
+        session, relative_path, file_size, checksum = assemble_upload(
+            db,
+            self.key,
+            request_id,
+            upload_id,
+            get_settings().MAX_UPLOAD_SIZE
+        )
+
+        td = self.models.document(
+            **{self.fk: request_id},
+            doc_type=session["doc_type"],
+            file_name=session["file_name"],
+            file_path=relative_path,
+            file_size=file_size,
+            checksum=checksum
+        )
+        db.add(td)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+        discard_upload_session(upload_id)
+
+        return {
+            "doc_type": td.doc_type,
+            "file_name": td.file_name,
+            "file_path": relative_path,
+            "file_size": file_size,
+            "checksum": checksum
+        }
+
+    def _apply_requirements(self, db: Session, request_id: int, payload: RequirementsSchema):
+        self._upsert_child(db, self.models.requirements, request_id, {
+            "test_type": payload.test_type,
+            "selected_tests": payload.selected_tests,
+        })
+
+    def save_requirements(self, db: Session, request_id: int, payload: RequirementsSchema):
+        self._get_root(db, request_id)
+        self._apply_requirements(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+
+    def _apply_standards(self, db: Session, request_id: int, payload: StandardsSchema):
+        self._upsert_child(db, self.models.standards, request_id, {
+            "regions": payload.regions,
+            "standards": payload.standards,
+        })
+
+    def save_standards(self, db: Session, request_id: int, payload: StandardsSchema):
+        self._get_root(db, request_id)
+        self._apply_standards(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+
+    def _apply_confirmation(self, db: Session, request_id: int, payload: ConfirmationSchema):
+        return self._upsert_child(db, self.models.confirmation, request_id, {
+            "approve_plan": str(payload.approve_plan).lower(),
+            "understand_tests": str(payload.understand_tests).lower(),
+        })
+
+    def save_confirmation(self, db: Session, request_id: int, payload: ConfirmationSchema):
+        """Save confirmation checkboxes from details page"""
+        self._get_root(db, request_id)
+        conf = self._apply_confirmation(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+        db.refresh(conf)
+        return conf
+
+    def _apply_approval(self, db: Session, request_id: int, payload: ApprovalSchema):
+        return self._upsert_child(db, self.models.approval, request_id, {
+            "confirm_accurate": str(payload.confirm_accurate).lower(),
+            "confirm_approve": str(payload.confirm_approve).lower(),
+            "confirm_understand": str(payload.confirm_understand).lower(),
+        })
+
+    def save_approval(self, db: Session, request_id: int, payload: ApprovalSchema):
+        """Save approval checkboxes from review page"""
+        self._get_root(db, request_id)
+        approval = self._apply_approval(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+        db.refresh(approval)
+        return approval
+
+    def _apply_lab_selection(self, db: Session, request_id: int, payload: LabSelectionSchema):
+        values = {
+            "selected_labs": payload.selected_labs,
+            "region": payload.region if payload.region else None,
+            "remarks": payload.remarks,
+        }
+        # Only update region if it's provided and not empty
+        update = list(values) if payload.region else ["selected_labs", "remarks"]
+        return self._upsert_child(db, self.models.lab, request_id, values, update)
+
+    def save_lab_selection_draft(self, db: Session, request_id: int, payload: LabSelectionSchema):
+        """Save lab selection as draft without changing request status"""
+        self._get_root(db, request_id)
+        lab = self._apply_lab_selection(db, request_id, payload)
+
+        update_request_index(db, self.key, request_id)
+        db.commit()
+        db.refresh(lab)
+        return lab
+
+    def submit(self, db: Session, request_id: int, payload: LabSelectionSchema):
+        req = self._get_root(db, request_id)
+        self._apply_lab_selection(db, request_id, payload)
+
+        req.status = "submitted"
+        update_request_index(db, self.key, request_id, status="submitted")
+        db.commit()
+
+    def save_bundle(self, db: Session, request_id: int, payload: RequestBundleSchema):
+        """
+        Save every wizard step in the payload, and submit if asked, in one
+        transaction: either the whole request is saved or none of it is.
+        """
+        req = self._get_root(db, request_id)
+
+        index_fields = {}
+        if payload.product_details:
+            self._apply_product_details(db, request_id, payload.product_details)
+            index_fields.update(self._product_index_fields(payload.product_details))
+        if payload.technical_documents:
+            self._apply_technical_documents(db, request_id, payload.technical_documents)
+        if payload.requirements:
+            self._apply_requirements(db, request_id, payload.requirements)
+        if payload.standards:
+            self._apply_standards(db, request_id, payload.standards)
+        if payload.confirmation:
+            self._apply_confirmation(db, request_id, payload.confirmation)
+        if payload.approval:
+            self._apply_approval(db, request_id, payload.approval)
+        if payload.lab_selection:
+            self._apply_lab_selection(db, request_id, payload.lab_selection)
+        if payload.submit:
+            req.status = "submitted"
+            index_fields["status"] = "submitted"
+
+        update_request_index(db, self.key, request_id, **index_fields)
+        db.commit()
+
+    def import_batch(self, db: Session, rows: list):
+        """
+        Insert validated ImportRowSchema rows as new submitted requests with
+        one multi-row INSERT per table. Does not commit. Returns the new ids.
+        """
+        models = self.models
+        ids = db.execute(
+            insert(models.root).returning(models.root.id, sort_by_parameter_order=True),
+            [{"status": "submitted"} for _ in rows]
+        ).scalars().all()
+
+        children = {models.product: [], models.requirements: [], models.standards: [], models.lab: []}
+        index_rows = []
+        for request_id, row in zip(ids, rows):
+            product = row.product_details
+            children[models.product].append({self.fk: request_id, **self._product_values(product)})
+            if row.requirements:
+                children[models.requirements].append({self.fk: request_id, **row.requirements.model_dump()})
+            if row.standards:
+                children[models.standards].append({self.fk: request_id, **row.standards.model_dump()})
+            if row.lab_selection:
+                children[models.lab].append({self.fk: request_id, **row.lab_selection.model_dump()})
+            index_rows.append({
+                "service_type": self.key,
+                "request_id": request_id,
+                "status": "submitted",
+                **self._product_index_fields(product)
+            })
+
+        for model, values in children.items():
+            if values:
+                db.execute(insert(model), values)
+        db.execute(insert(ServiceRequestIndex), index_rows)
+        return ids
+
+    async def create_async(self, db: AsyncSession):
+        return await db.run_sync(self.create)
+
+    async def save_product_details_async(self, db: AsyncSession, request_id: int, payload: ProductDetailsSchema):
+        await db.run_sync(self.save_product_details, request_id, payload)
+
+    async def save_technical_documents_async(self, db: AsyncSession, request_id: int, documents: list):
+        await db.run_sync(self.save_technical_documents, request_id, documents)
+
+    async def save_requirements_async(self, db: AsyncSession, request_id: int, payload: RequirementsSchema):
+        await db.run_sync(self.save_requirements, request_id, payload)
+
+    async def save_standards_async(self, db: AsyncSession, request_id: int, payload: StandardsSchema):
+        await db.run_sync(self.save_standards, request_id, payload)
+
+    async def save_confirmation_async(self, db: AsyncSession, request_id: int, payload: ConfirmationSchema):
+        return await db.run_sync(self.save_confirmation, request_id, payload)
+
+    async def save_approval_async(self, db: AsyncSession, request_id: int, payload: ApprovalSchema):
+        return await db.run_sync(self.save_approval, request_id, payload)
+
+    async def save_lab_selection_draft_async(self, db: AsyncSession, request_id: int, payload: LabSelectionSchema):
+        return await db.run_sync(self.save_lab_selection_draft, request_id, payload)
+
+    async def submit_async(self, db: AsyncSession, request_id: int, payload: LabSelectionSchema):
+        await db.run_sync(self.submit, request_id, payload)
+
+    async def save_bundle_async(self, db: AsyncSession, request_id: int, payload: RequestBundleSchema):
+        await db.run_sync(self.save_bundle, request_id, payload)
+
+    # --- reads -------------------------------------------------------------
+
+    def get_technical_document(self, db: Session, request_id: int, document_id: int):
+        document = self.models.document
+        return db.query(document).filter(
+            document.id == document_id,
+            getattr(document, self.fk) == request_id
+        ).first()
+
+    def list_requests(
+        self,
+        db: Session,
+        status: str | None = None,
+        created_from=None,
+        created_to=None,
+        after_id: int | None = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ):
+        root = self.models.root
+        query = db.query(root)
+
+        if status:
+            query = query.filter(root.status == status)
+        if created_from:
+            query = query.filter(root.created_at >= created_from)
+        if created_to:
+            query = query.filter(root.created_at < created_to)
+
+        rows, next_after_id = keyset_page(query, root, after_id, limit)
+
+        return {
+            "items": [
+                {
+                    "id": req.id,
+                    "status": req.status,
+                    "created_at": req.created_at.isoformat() if req.created_at else None,
+                    "updated_at": req.updated_at.isoformat() if req.updated_at else None
+                }
+                for req in rows
+            ],
+            "next_after_id": next_after_id
+        }
+
+    def get_full(self, db: Session, request_id: int):
+        # Root row and every child table in a single LEFT OUTER JOIN query
+        root = self.models.root
+        req = db.query(root).options(
+            *self._eager_options(joinedload)
+        ).filter(
+            root.id == request_id
+        ).first()
+
+        if not req:
+            return None
+
+        return self._full_request_dict(req)
+
+    def get_full_many(self, db: Session, request_ids: list):
+        # One SELECT for the roots plus one IN-list SELECT per child table,
+        # independent of how many ids are requested
+        root = self.models.root
+        rows = db.query(root).options(
+            *self._eager_options(selectinload)
+        ).filter(
+            root.id.in_(request_ids)
+        ).all()
+
+        return {req.id: self._full_request_dict(req) for req in rows}
+
+    async def get_request_async(self, db: AsyncSession, request_id: int):
+        return await db.get(self.models.root, request_id)
+
+    async def list_requests_async(self, db: AsyncSession, **filters):
+        return await db.run_sync(self.list_requests, **filters)
+
+    async def get_full_async(self, db: AsyncSession, request_id: int):
+        return await db.run_sync(self.get_full, request_id)
+
+    async def get_full_cached_async(self, db: AsyncSession, request_id: int):
+        """get_full_async through the /full cache (core/cache.py)"""
+        if full_cache is None:
+            return await self.get_full_async(db, request_id)
+
+        key = (self.key, request_id)
+        data = full_cache.get(key)
+        if data is None:
+            token = full_cache.fill_token(key)
+            data = await self.get_full_async(db, request_id)
+            if data is not None:
+                full_cache.set(key, data, token)
+        return data
+
+    async def get_full_many_async(self, db: AsyncSession, request_ids: list):
+        return await db.run_sync(self.get_full_many, request_ids)
+
+    def _full_request_dict(self, req):
+        product = req.product
+        requirements = req.requirements
+        standards = req.standards
+        lab = req.lab
+
+        # Convert SQLAlchemy objects to dictionaries for proper JSON serialization
+        product_dict = None
+        if product:
+            product_dict = {
+                "id": product.id,
+                "eut_name": product.eut_name,
+                "eut_quantity": product.eut_quantity,
+                "manufacturer": product.manufacturer,
+                "model_no": product.model_no,
+                "serial_no": product.serial_no,
+                "supply_voltage": product.supply_voltage,
+                "operating_frequency": product.operating_frequency,
+                "current": product.current,
+                "weight": product.weight,
+                "length_mm": product.length_mm,
+                "width_mm": product.width_mm,
+                "height_mm": product.height_mm,
+                "power_ports": product.power_ports,
+                "signal_lines": product.signal_lines,
+                "software_name": product.software_name,
+                "software_version": product.software_version,
+                "industry": product.industry,
+                "industry_other": product.industry_other,
+                "preferred_date": product.preferred_date,
+                "notes": product.notes
+            }
+
+        requirements_dict = None
+        if requirements:
+            requirements_dict = {
+                "id": requirements.id,
+                "test_type": requirements.test_type,
+                "selected_tests": requirements.selected_tests or []
+            }
+
+        standards_dict = None
+        if standards:
+            standards_dict = {
+                "id": standards.id,
+                "regions": standards.regions or [],
+                "standards": standards.standards or []
+            }
+
+        lab_dict = None
+        if lab:
+            lab_dict = {
+                "id": lab.id,
+                "selected_labs": lab.selected_labs or [],
+                "region": lab.region,
+                "remarks": lab.remarks
+            }
+
+        documents_list = [
+            {
+                "id": doc.id,
+                "doc_type": doc.doc_type,
+                "file_name": doc.file_name,
+                "file_path": doc.file_path,
+                "file_size": doc.file_size,
+                "checksum": doc.checksum,
+                "uploaded_at": doc.uploaded_at.isoformat() if doc.uploaded_at else None
+            }
+            for doc in req.documents
+        ]
+
+        data = {
+            f"{self.key}_request": {
+                "id": req.id,
+                "status": req.status,
+                "created_at": req.created_at.isoformat() if req.created_at else None
+            },
+            "product": product_dict,
+            "requirements": requirements_dict,
+            "standards": standards_dict,
+            "lab": lab_dict,
+            "documents": documents_list
+        }
+
+        if self.models.confirmation:
+            confirmation = req.confirmation
+            approval = req.approval
+
+            data["confirmation"] = None
+            if confirmation:
+                data["confirmation"] = {
+                    "id": confirmation.id,
+                    "approve_plan": confirmation.approve_plan == "true",
+                    "understand_tests": confirmation.understand_tests == "true"
+                }
+
+            data["approval"] = None
+            if approval:
+                data["approval"] = {
+                    "id": approval.id,
+                    "confirm_accurate": approval.confirm_accurate == "true",
+                    "confirm_approve": approval.confirm_approve == "true",
+                    "confirm_understand": approval.confirm_understand == "true"
+                }
+
+        return data
@@ -1,38 +0,0 @@
-# Simulation Request Module
-from .routes import router
-from .models import (
-    SimulationRequest,
-    SimulationProductDetails,
-    SimulationTechnicalDocument,
-    SimulationRequirements,
-    SimulationStandards,
-    SimulationLabSelection
-)
-from .services import (
-    create_simulation_request,
-    save_simulation_product_details,
-    save_simulation_technical_documents,
-    save_simulation_requirements,
-    save_simulation_standards,
-    save_simulation_lab_selection_draft,
-    submit_simulation_request,
-    get_full_simulation_request
-)
-
-__all__ = [
-    "router",
-    "SimulationRequest",
-    "SimulationProductDetails",
-    "SimulationTechnicalDocument",
-    "SimulationRequirements",
-    "SimulationStandards",
-    "SimulationLabSelection",
-    "create_simulation_request",
-    "save_simulation_product_details",
-    "save_simulation_technical_documents",
-    "save_simulation_requirements",
-    "save_simulation_standards",
-    "save_simulation_lab_selection_draft",
-    "submit_simulation_request",
-    "get_full_simulation_request",
-]
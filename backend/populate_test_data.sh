@@ -1,12 +1,20 @@
 #!/bin/bash
-# Script to populate test data for testing_request_id 137
+# Script to populate test data for one testing request through the API.
+# Usage: ./populate_test_data.sh [testing_request_id]
+# Without an id a new request is created. For production-sized data sets
+# use generate_test_data.py instead.
 
-echo "Populating test data for testing_request_id 137..."
+ID=$1
+if [ -z "$ID" ]; then
+  ID=$(curl -s -X POST http://localhost:8000/testing-request/ | python3 -c "import json, sys; print(json.load(sys.stdin)['id'])")
+fi
+
+echo "Populating test data for testing_request_id $ID..."
 echo "=================================================="
 
 # 1. Save Product Details
 echo -e "\n1. Saving Product Details..."
-curl -X POST http://localhost:8000/testing-request/137/product \
+curl -X POST http://localhost:8000/testing-request/$ID/product \
   -H "Content-Type: application/json" \
   -d '{
     "eut_name": "Smart IoT Device",
@@ -34,7 +42,7 @@ curl -X POST http://localhost:8000/testing-request/137/product \
   }'
 
 echo -e "\n\n2. Saving Testing Requirements..."
-curl -X POST http://localhost:8000/testing-request/137/requirements \
+curl -X POST http://localhost:8000/testing-request/$ID/requirements \
   -H "Content-Type: application/json" \
   -d '{
     "test_type": "final",
@@ -47,7 +55,7 @@ curl -X POST http://localhost:8000/testing-request/137/requirements \
   }'
 
 echo -e "\n\n3. Saving Testing Standards..."
-curl -X POST http://localhost:8000/testing-request/137/standards \
+curl -X POST http://localhost:8000/testing-request/$ID/standards \
   -H "Content-Type: application/json" \
   -d '{
     "regions": ["India", "Europe", "USA"],
@@ -61,7 +69,7 @@ curl -X POST http://localhost:8000/testing-request/137/standards \
   }'
 
 echo -e "\n\n4. Fetching full request data..."
-curl -s http://localhost:8000/testing-request/137/full | python3 -m json.tool
+curl -s http://localhost:8000/testing-request/$ID/full | python3 -m json.tool
 
 echo -e "\n\n=================================================="
 echo "Test data population complete!"
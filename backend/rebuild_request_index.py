@@ -0,0 +1,46 @@
+"""
+Rebuild the service_requests_index table from every service's own tables.
+Run this once after upgrading an existing database, or whenever the index
+is suspected to be out of sync.
+"""
+from sqlalchemy import func, insert, literal, select
+from core.database import engine, SessionLocal
+from modules.request_index.models import ServiceRequestIndex
+from modules.service_engine import services as engine_services
+
+SERVICES = {
+    key: (service.models.root, service.models.product)
+    for key, service in engine_services.items()
+}
+
+
+def rebuild(db):
+    db.query(ServiceRequestIndex).delete()
+
+    for service_type, (root, product) in SERVICES.items():
+        fk = getattr(product, f"{service_type}_request_id")
+        # INSERT ... SELECT keeps the work inside the database
+        source = select(
+            literal(service_type), root.id, root.status,
+            product.eut_name, product.manufacturer, product.model_no,
+            root.created_at, func.coalesce(root.updated_at, root.created_at)
+        ).outerjoin(product, fk == root.id)
+
+        result = db.execute(insert(ServiceRequestIndex).from_select(
+            ["service_type", "request_id", "status", "eut_name", "manufacturer",
+             "model_no", "created_at", "updated_at"],
+            source
+        ))
+        print(f"{service_type}: {result.rowcount} requests indexed")
+
+    db.commit()
+
+if __name__ == "__main__":
+    from migrations import ensure_schema
+    ensure_schema(engine)
+    db = SessionLocal()
+    try:
+        rebuild(db)
+    finally:
+        db.close()
+    print("Rebuild completed.")
@@ -0,0 +1,53 @@
+"""POST /{service}-request/{id}/bundle saves every step in one transaction, or none of them"""
+import pytest
+from conftest import APPROVAL, CONFIRMATION, LAB_SELECTION, PRODUCT, REQUIREMENTS, STANDARDS
+from modules.service_engine import get_service
+
+BUNDLE = {
+    "product_details": PRODUCT,
+    "technical_documents": [{"doc_type": "manual", "file_name": "manual.pdf"}],
+    "requirements": REQUIREMENTS,
+    "standards": STANDARDS,
+    "confirmation": CONFIRMATION,
+    "approval": APPROVAL,
+    "lab_selection": LAB_SELECTION,
+}
+
+
+def new_request(client):
+    return f"/calibration-request/{client.post('/calibration-request/').json()['id']}"
+
+
+def test_bundle_saves_every_step(client):
+    url = new_request(client)
+    assert client.post(f"{url}/bundle", json=BUNDLE).json() == {"status": "submitted"}
+
+    full = client.get(f"{url}/full").json()
+    assert full["product"]["eut_name"] == PRODUCT["eut_name"]
+    assert [document["file_name"] for document in full["documents"]] == ["manual.pdf"]
+    assert full["requirements"]["selected_tests"] == REQUIREMENTS["selected_tests"]
+    assert full["standards"]["standards"] == STANDARDS["standards"]
+    assert full["confirmation"]["approve_plan"] is True
+    assert full["approval"]["confirm_accurate"] is True
+    assert full["lab"]["selected_labs"] == LAB_SELECTION["selected_labs"]
+
+
+def test_failing_step_saves_nothing(client, monkeypatch):
+    url = new_request(client)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("lab selection failed")
+
+    # The last step fails after every earlier one has been written in the transaction
+    monkeypatch.setattr(get_service("calibration"), "_apply_lab_selection", fail)
+    with pytest.raises(RuntimeError, match="lab selection failed"):
+        client.post(f"{url}/bundle", json=BUNDLE)
+
+    full = client.get(f"{url}/full").json()
+    assert full["documents"] == []
+    for step in ["product", "requirements", "standards", "confirmation", "approval", "lab"]:
+        assert full[step] is None, step
+    # Nor did the request index pick up the product
+    items = client.get("/requests/", params={"service_type": "calibration"}).json()["items"]
+    [entry] = [item for item in items if url.endswith(f"/{item['request_id']}")]
+    assert entry["eut_name"] is None
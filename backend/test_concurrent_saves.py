@@ -0,0 +1,34 @@
+"""Concurrent first saves of a one-per-request wizard step all succeed"""
+import asyncio
+import httpx
+import pytest
+from conftest import CONFIRMATION, LAB_SELECTION, REQUIREMENTS
+
+
+async def save_concurrently(app, service, path, body, requests=5, saves=4):
+    from core.database import async_engine
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            ids = [(await client.post(f"/{service}-request/")).json()["id"] for _ in range(requests)]
+            responses = await asyncio.gather(*(
+                client.post(f"/{service}-request/{request_id}/{path}", json=body)
+                for request_id in ids for _ in range(saves)
+            ))
+    finally:
+        # aiosqlite connections belong to this event loop
+        await async_engine.dispose()
+    return ids, [response.status_code for response in responses]
+
+
+@pytest.mark.parametrize("service, path, body, section", [
+    ("testing", "requirements", REQUIREMENTS, "requirements"),
+    ("testing", "lab-selection/draft", LAB_SELECTION, "lab"),
+    ("calibration", "confirmation", CONFIRMATION, "confirmation"),
+])
+def test_concurrent_first_saves(client, service, path, body, section):
+    ids, statuses = asyncio.run(save_concurrently(client.app, service, path, body))
+    assert statuses == [200] * len(statuses)
+    for request_id in ids:
+        assert client.get(f"/{service}-request/{request_id}/full").json()[section] is not None
@@ -0,0 +1,53 @@
+"""A CSV export imports back as the same requests"""
+import csv
+import io
+import conftest
+from conftest import STANDARDS
+
+PRODUCT = {
+    **conftest.PRODUCT, "model_no": "RT-200", "operating_frequency": "50Hz", "industry": ["Electronics", "IoT"]
+}
+REQUIREMENTS = {**conftest.REQUIREMENTS, "selected_tests": ["EMC Testing", "Safety Testing"]}
+LAB_SELECTION = {**conftest.LAB_SELECTION, "remarks": "Ship by road"}
+
+# Columns a re-import reproduces; ids, status and timestamps are new
+COMPARED = [
+    "eut_name", "eut_quantity", "manufacturer", "model_no", "serial_no",
+    "supply_voltage", "operating_frequency", "current", "weight",
+    "length_mm", "width_mm", "height_mm", "power_ports", "signal_lines",
+    "industry", "test_type", "selected_tests", "regions", "standards",
+    "selected_labs", "remarks",
+]
+
+
+def exported_rows(client, model_no):
+    """The export's header and the rows of this model (other tests add requests too)"""
+    response = client.get("/export/", params={"service": "design", "format": "csv"})
+    assert response.status_code == 200
+    reader = csv.DictReader(io.StringIO(response.text))
+    return reader.fieldnames, [row for row in reader if row["model_no"] == model_no]
+
+
+def test_exported_csv_imports_back(client):
+    url = f"/design-request/{client.post('/design-request/').json()['id']}"
+    for path, body in [
+        ("product", PRODUCT), ("requirements", REQUIREMENTS),
+        ("standards", STANDARDS), ("submit", LAB_SELECTION),
+    ]:
+        assert client.post(f"{url}/{path}", json=body).status_code == 200
+
+    header, [original] = exported_rows(client, PRODUCT["model_no"])
+    out = io.StringIO()
+    writer = csv.DictWriter(out, header)
+    writer.writeheader()
+    writer.writerow(original)
+    response = client.post(
+        "/design-request/import",
+        files={"file": ("design-requests.csv", out.getvalue().encode(), "text/csv")}
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1, response.json()["errors"]
+
+    _, [first, imported] = exported_rows(client, PRODUCT["model_no"])
+    assert first == original
+    assert {name: imported[name] for name in COMPARED} == {name: original[name] for name in COMPARED}
@@ -0,0 +1,113 @@
+"""GET /{service}-request/{id}/documents/{document_id}: what is served, ranges and caching"""
+import hashlib
+from email.utils import formatdate
+from core.database import SessionLocal
+from modules.document_store.services import legacy_upload_dir
+from modules.service_engine import get_service
+
+CONTENT = b"0123456789" * 10
+
+
+def uploaded_document(client, url, content=CONTENT):
+    response = client.post(
+        f"{url}/upload-documents",
+        files=[("files", ("manual.pdf", content))],
+        data={"doc_types": ["manual"]}
+    )
+    assert response.status_code == 200
+    [document] = client.get(f"{url}/full").json()["documents"]
+    return f"{url}/documents/{document['id']}"
+
+
+def add_document(request_id, **values):
+    """A technical document row written straight to the database, as old code left them"""
+    service = get_service("testing")
+    db = SessionLocal()
+    try:
+        document = service.models.document(**{service.fk: request_id}, doc_type="manual", **values)
+        db.add(document)
+        db.commit()
+        return document.id
+    finally:
+        db.close()
+
+
+def new_request(client):
+    request_id = client.post("/testing-request/").json()["id"]
+    return request_id, f"/testing-request/{request_id}"
+
+
+def test_download(client):
+    _, url = new_request(client)
+    response = client.get(uploaded_document(client, url))
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["etag"] == f'"{hashlib.sha256(CONTENT).hexdigest()}"'
+
+
+def test_range(client):
+    _, url = new_request(client)
+    response = client.get(uploaded_document(client, url), headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[10:20]
+    assert response.headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+
+
+def test_if_none_match(client):
+    _, url = new_request(client)
+    document_url = uploaded_document(client, url, b"etag test")
+    etag = client.get(document_url).headers["etag"]
+
+    assert client.get(document_url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(document_url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_if_modified_since(client):
+    _, url = new_request(client)
+    document_url = uploaded_document(client, url, b"last modified test")
+    last_modified = client.get(document_url).headers["last-modified"]
+
+    assert client.get(document_url, headers={"If-Modified-Since": last_modified}).status_code == 304
+    earlier = formatdate(0, usegmt=True)
+    assert client.get(document_url, headers={"If-Modified-Since": earlier}).status_code == 200
+
+
+def test_client_file_path_is_not_served(client):
+    _, url = new_request(client)
+    response = client.post(f"{url}/documents", json={"documents": [
+        {"doc_type": "manual", "file_name": "config.py", "file_path": "core/config.py"}
+    ]})
+    assert response.status_code == 200
+    [document] = client.get(f"{url}/full").json()["documents"]
+    assert document["file_path"] is None
+    assert client.get(f"{url}/documents/{document['id']}").status_code == 404
+
+
+def test_path_outside_the_request_upload_dir_is_not_served(client):
+    request_id, url = new_request(client)
+    for file_path in ["../../core/config.py", "../../database/app.db", "blobs/../../conftest.py"]:
+        document_id = add_document(request_id, file_name="x", file_path=file_path)
+        assert client.get(f"{url}/documents/{document_id}").status_code == 404
+    # A checksum that is not a SHA-256 never becomes a path either
+    document_id = add_document(request_id, file_name="x", file_path="x", checksum="../../core/config")
+    assert client.get(f"{url}/documents/{document_id}").status_code == 404
+
+
+def test_upload_from_before_the_blob_store(client):
+    request_id, url = new_request(client)
+    path = legacy_upload_dir("testing", request_id) / "manual_old.pdf"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"old upload")
+    document_id = add_document(
+        request_id, file_name="old.pdf", file_path=f"testing_requests/{request_id}/manual_old.pdf"
+    )
+
+    response = client.get(f"{url}/documents/{document_id}")
+    assert response.status_code == 200
+    assert response.content == b"old upload"
+    # Another request's old uploads stay out of reach
+    other_id, other_url = new_request(client)
+    document_id = add_document(
+        other_id, file_name="old.pdf", file_path=f"testing_requests/{request_id}/manual_old.pdf"
+    )
+    assert client.get(f"{other_url}/documents/{document_id}").status_code == 404
@@ -0,0 +1,25 @@
+"""A saved wizard step shows up in the next GET /full despite the response cache"""
+from conftest import LAB_SELECTION, PRODUCT, REQUIREMENTS
+from core.cache import full_cache
+
+# (step, body, what the next /full shows)
+STEPS = [
+    ("product", {**PRODUCT, "eut_name": "Smart Meter Pro"},
+     lambda full: full["product"]["eut_name"] == "Smart Meter Pro"),
+    ("requirements", REQUIREMENTS, lambda full: full["requirements"]["selected_tests"] == ["EMC Testing"]),
+    ("submit", LAB_SELECTION, lambda full: full["lab"]["selected_labs"] == ["TUV INDIA"]),
+]
+
+
+def test_save_invalidates_full(client):
+    url = f"/testing-request/{client.post('/testing-request/').json()['id']}"
+    assert client.post(f"{url}/product", json=PRODUCT).status_code == 200
+    client.get(f"{url}/full")
+
+    hits = full_cache.stats()["hits"]
+    assert client.get(f"{url}/full").json()["product"]["eut_name"] == "Smart Meter"
+    assert full_cache.stats()["hits"] == hits + 1
+
+    for path, body, saved in STEPS:
+        assert client.post(f"{url}/{path}", json=body).status_code == 200
+        assert saved(client.get(f"{url}/full").json()), path
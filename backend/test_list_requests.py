@@ -0,0 +1,85 @@
+"""Keyset paging of GET /{service}-request/: every matching request exactly once, newest first"""
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert, select
+from core.database import SessionLocal
+from modules.service_engine import get_service
+
+SERVICE = "simulation"
+# Seeded requests live in 2001, away from the ones other tests create today
+CREATED_FROM = datetime(2001, 1, 1)
+CREATED_TO = datetime(2002, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    """{id: (created_at, status)} of 25 requests; several share a created_at"""
+    root = get_service(SERVICE).models.root
+    rows = [
+        {"status": "draft" if n % 3 == 0 else "submitted", "created_at": CREATED_FROM + timedelta(days=n // 2)}
+        for n in range(25)
+    ]
+    db = SessionLocal()
+    try:
+        ids = db.execute(insert(root).returning(root.id, sort_by_parameter_order=True), rows).scalars().all()
+        db.commit()
+    finally:
+        db.close()
+    return {request_id: (row["created_at"], row["status"]) for request_id, row in zip(ids, rows)}
+
+
+def walk(client, limit=7, **params):
+    """Ids of every page in order, following next_after_id to the end"""
+    ids, after_id = [], None
+    for _ in range(100):
+        page = client.get(f"/{SERVICE}-request/", params={
+            **params, "limit": limit, **({"after_id": after_id} if after_id else {})
+        }).json()
+        assert len(page["items"]) <= limit
+        ids += [item["id"] for item in page["items"]]
+        after_id = page["next_after_id"]
+        if after_id is None:
+            return ids
+        assert after_id == ids[-1]
+    pytest.fail("next_after_id never became null")
+
+
+def newest_first(seeded, ids):
+    return sorted(ids, key=lambda request_id: (seeded[request_id][0], request_id), reverse=True)
+
+
+@pytest.mark.parametrize("status", [None, "draft", "submitted"])
+def test_pages_in_a_date_range(client, seeded, status):
+    params = {"created_from": CREATED_FROM.isoformat(), "created_to": CREATED_TO.isoformat()}
+    if status:
+        params["status"] = status
+    expected = [request_id for request_id in seeded if status in (None, seeded[request_id][1])]
+
+    assert walk(client, **params) == newest_first(seeded, expected)
+
+
+@pytest.mark.parametrize("status", [None, "draft"])
+def test_pages_without_a_date_range(client, seeded, status):
+    root = get_service(SERVICE).models.root
+    db = SessionLocal()
+    try:
+        query = select(root.id)
+        if status:
+            query = query.where(root.status == status)
+        expected = set(db.execute(query).scalars())
+    finally:
+        db.close()
+
+    ids = walk(client, limit=10, **({"status": status} if status else {}))
+    assert len(ids) == len(set(ids))
+    assert set(ids) == expected
+
+
+def test_last_page_exactly_full(client, seeded):
+    drafts = [request_id for request_id in seeded if seeded[request_id][1] == "draft"]
+    page = client.get(f"/{SERVICE}-request/", params={
+        "status": "draft", "limit": len(drafts),
+        "created_from": CREATED_FROM.isoformat(), "created_to": CREATED_TO.isoformat(),
+    }).json()
+    assert [item["id"] for item in page["items"]] == newest_first(seeded, drafts)
+    assert page["next_after_id"] is None
@@ -0,0 +1,40 @@
+"""
+Writes to a request id that does not exist return 404 and store nothing,
+with SQLite foreign keys enforced.
+"""
+import pytest
+from conftest import APPROVAL, CONFIRMATION, LAB_SELECTION, PRODUCT, REQUIREMENTS, STANDARDS
+from modules.document_store.services import BLOB_DIR
+from modules.service_engine import get_service
+
+MISSING = "/calibration-request/999999"
+
+STEPS = [
+    ("product", PRODUCT),
+    ("documents", {"documents": [{"doc_type": "manual", "file_name": "manual.pdf"}]}),
+    ("requirements", REQUIREMENTS),
+    ("standards", STANDARDS),
+    ("confirmation", CONFIRMATION),
+    ("approval", APPROVAL),
+    ("lab-selection/draft", LAB_SELECTION),
+    ("submit", LAB_SELECTION),
+    ("bundle", {"product_details": PRODUCT}),
+]
+
+
+@pytest.mark.parametrize("path, body", STEPS, ids=[step[0] for step in STEPS])
+def test_wizard_step(client, path, body):
+    response = client.post(f"{MISSING}/{path}", json=body)
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"{get_service('calibration').name}Request not found"
+
+
+def test_upload_documents_stores_no_file(client):
+    before = set(BLOB_DIR.rglob("*"))
+    response = client.post(
+        f"{MISSING}/upload-documents",
+        files=[("files", ("orphan.txt", b"no request for this file"))],
+        data={"doc_types": ["manual"]}
+    )
+    assert response.status_code == 404
+    assert set(BLOB_DIR.rglob("*")) == before
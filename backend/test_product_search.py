@@ -0,0 +1,59 @@
+"""Product search over the FTS5 index"""
+from conftest import PRODUCT
+from core.database import SessionLocal
+from modules.product_search.services import _search_request_index
+from modules.service_engine import get_service
+from modules.service_engine.schemas import ImportRowSchema
+
+
+def add_products(service, eut_name, count, **fields):
+    row = ImportRowSchema.model_validate({"product_details": {**PRODUCT, "eut_name": eut_name, **fields}})
+    db = SessionLocal()
+    try:
+        ids = get_service(service).import_batch(db, [row] * count)
+        db.commit()
+    finally:
+        db.close()
+    return ids
+
+
+def test_search_finds_product(client):
+    [request_id] = add_products("design", "Quokkascope", 1)
+    items = client.get("/search/", params={"q": "quokka"}).json()["items"]
+    assert [(item["service_type"], item["request_id"]) for item in items] == [("design", request_id)]
+
+
+def test_service_filter_looks_past_other_services_matches(client):
+    # Older calibration matches, then more newer testing matches than the search window
+    calibration_ids = add_products("calibration", "Zephyr Meter", 3)
+    add_products("testing", "Zephyr Meter", 1100)
+
+    response = client.get("/search/", params={"q": "zephyr", "service_type": "calibration"})
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert sorted(item["request_id"] for item in items) == sorted(calibration_ids)
+    assert {item["service_type"] for item in items} == {"calibration"}
+
+
+def test_best_match_is_found_among_many_newer_matches(client):
+    # An EUT name match outranks manufacturer matches, however many newer ones there are
+    [best] = add_products("design", "Gryphon Scope", 1)
+    add_products("design", "Smart Meter", 1100, manufacturer="Gryphon Labs")
+
+    items = client.get("/search/", params={"q": "gryphon", "limit": 1}).json()["items"]
+    assert [(item["service_type"], item["request_id"]) for item in items] == [("design", best)]
+
+
+def test_fallback_matches_wildcards_literally(client):
+    [percent] = add_products("testing", "50% Duty Cycle Meter", 1)
+    add_products("testing", "500 Series Meter", 1)
+    db = SessionLocal()
+    try:
+        items = _search_request_index(db, "50%", None, 20)["items"]
+    finally:
+        db.close()
+    assert [item["request_id"] for item in items] == [percent]
+
+
+def test_unknown_service_type(client):
+    assert client.get("/search/", params={"q": "meter", "service_type": "nope"}).status_code == 400
@@ -0,0 +1,102 @@
+"""
+SQL statement budgets of the service endpoints, so N+1 regressions fail
+here instead of in production.
+"""
+import pytest
+from conftest import LAB_SELECTION, PRODUCT, REQUIREMENTS, STANDARDS
+from modules.service_engine import SERVICE_TYPES
+
+DOCUMENTS = [{"doc_type": "manual", "file_name": f"manual_{i}.pdf"} for i in range(3)]
+
+# (path under /{service}-request/{id}, JSON body, max statements); each
+# write starts by checking that the request exists
+WIZARD_STEPS = [
+    ("product", PRODUCT, 5),
+    ("requirements", REQUIREMENTS, 5),
+    ("standards", STANDARDS, 5),
+    ("documents", {"documents": DOCUMENTS}, 6),
+    ("lab-selection/draft", LAB_SELECTION, 6),
+    ("submit", LAB_SELECTION, 6),
+]
+
+
+@pytest.fixture
+def request_url(client, service):
+    response = client.post(f"/{service}-request/")
+    assert response.status_code == 200
+    return f"/{service}-request/{response.json()['id']}"
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_create(client, max_queries, service):
+    with max_queries(4):
+        assert client.post(f"/{service}-request/").status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+@pytest.mark.parametrize("path, body, limit", WIZARD_STEPS, ids=[step[0] for step in WIZARD_STEPS])
+def test_wizard_step(client, max_queries, request_url, path, body, limit):
+    with max_queries(limit):
+        assert client.post(f"{request_url}/{path}", json=body).status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_bundle(client, max_queries, request_url):
+    payload = {
+        "product_details": PRODUCT,
+        "technical_documents": DOCUMENTS,
+        "requirements": REQUIREMENTS,
+        "standards": STANDARDS,
+        "lab_selection": LAB_SELECTION,
+    }
+    # Checks for and inserts each child row; one multi-row INSERT for the documents
+    with max_queries(14):
+        assert client.post(f"{request_url}/bundle", json=payload).status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_upload_documents(client, max_queries, request_url):
+    files = [("files", (f"doc_{i}.txt", f"{request_url} {i}".encode())) for i in range(3)]
+    # Two statements per file (blob, document row) plus the request lookup and index
+    with max_queries(3 + 2 * len(files)):
+        response = client.post(
+            f"{request_url}/upload-documents",
+            files=files,
+            data={"doc_types": ["manual"] * len(files)}
+        )
+        assert response.status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_full_is_one_query(client, max_queries, request_url):
+    client.post(f"{request_url}/bundle", json={"product_details": PRODUCT, "technical_documents": DOCUMENTS})
+    with max_queries(1):
+        assert client.get(f"{request_url}/full").status_code == 200
+    # Served from the cache until the next save
+    with max_queries(0):
+        assert client.get(f"{request_url}/full").status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_list(client, max_queries, service):
+    for _ in range(3):
+        client.post(f"/{service}-request/")
+    with max_queries(1):
+        assert client.get(f"/{service}-request/").status_code == 200
+
+
+@pytest.mark.parametrize("service", SERVICE_TYPES)
+def test_full_batch(client, max_queries, service):
+    ids = [client.post(f"/{service}-request/").json()["id"] for _ in range(5)]
+    # One SELECT per table, however many ids
+    with max_queries(8):
+        assert client.post(f"/{service}-request/full:batch", json={"ids": ids}).status_code == 200
+
+
+def test_cross_service_endpoints(client, max_queries):
+    with max_queries(1):
+        assert client.get("/requests/").status_code == 200
+    with max_queries(1):
+        assert client.get("/search/", params={"q": "Smart"}).status_code == 200
+    with max_queries(1):
+        assert client.get("/export/", params={"service": "testing"}).status_code == 200
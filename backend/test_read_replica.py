@@ -0,0 +1,78 @@
+"""GET routes read from DATABASE_READ_URL, except for requests written in the last READ_YOUR_WRITES_SECONDS"""
+import importlib
+import sqlite3
+import time
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from conftest import PRODUCT, TEST_DIR
+import core.database
+from core.database import build_engines
+
+PIN_SECONDS = 0.5
+REPLICA_PATH = TEST_DIR / "replica.db"
+# The module; modules.service_engine.services is also the name of its registry dict
+service_engine = importlib.import_module("modules.service_engine.services")
+
+
+def copy_to_replica():
+    """Bring the replica up to date with the primary, as replication would"""
+    primary = sqlite3.connect(core.database.engine.url.database)
+    replica = sqlite3.connect(REPLICA_PATH)
+    try:
+        primary.backup(replica)
+    finally:
+        primary.close()
+        replica.close()
+
+
+@pytest.fixture
+def replica(client, monkeypatch):
+    """A replica database that only changes when copy_to_replica() is called"""
+    copy_to_replica()
+    read_engine, async_read_engine = build_engines(f"sqlite:///{REPLICA_PATH}")
+    monkeypatch.setattr(core.database, "ReadSessionLocal", sessionmaker(
+        bind=read_engine, autoflush=False, autocommit=False
+    ))
+    monkeypatch.setattr(core.database, "AsyncReadSessionLocal", async_sessionmaker(
+        bind=async_read_engine, autoflush=False, expire_on_commit=False
+    ))
+    monkeypatch.setattr(core.database.primary_pins, "seconds", PIN_SECONDS)
+    # A cached /full would hide which database answered
+    monkeypatch.setattr(service_engine, "full_cache", None)
+    yield
+    read_engine.dispose()
+    # aiosqlite connections belong to the TestClient's event loop
+    client.portal.call(async_read_engine.dispose)
+
+
+def test_new_request_is_read_from_the_primary_until_the_pin_expires(client, replica):
+    request_id = client.post("/testing-request/").json()["id"]
+    assert client.get(f"/testing-request/{request_id}").status_code == 200
+
+    time.sleep(PIN_SECONDS)
+    # Not copied to the replica yet
+    assert client.get(f"/testing-request/{request_id}").status_code == 404
+    copy_to_replica()
+    assert client.get(f"/testing-request/{request_id}").status_code == 200
+
+
+def test_read_after_save_goes_to_the_primary(client, replica):
+    request_id = client.post("/testing-request/").json()["id"]
+    copy_to_replica()
+    time.sleep(PIN_SECONDS)
+    assert client.get(f"/testing-request/{request_id}/full").json()["product"] is None
+
+    assert client.post(f"/testing-request/{request_id}/product", json=PRODUCT).status_code == 200
+    product = client.get(f"/testing-request/{request_id}/full").json()["product"]
+    assert product["eut_name"] == PRODUCT["eut_name"]
+
+    time.sleep(PIN_SECONDS)
+    # Back on the replica, which has not seen the save
+    assert client.get(f"/testing-request/{request_id}/full").json()["product"] is None
+
+
+def test_list_reads_the_replica(client, replica):
+    request_id = client.post("/testing-request/").json()["id"]
+    ids = [item["id"] for item in client.get("/testing-request/", params={"limit": 100}).json()["items"]]
+    assert request_id not in ids
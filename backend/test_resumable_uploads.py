@@ -0,0 +1,34 @@
+"""Resumable chunked uploads"""
+import json
+from datetime import datetime, timedelta, timezone
+from modules.document_store import resumable
+
+UPLOAD = {"doc_type": "manual", "file_name": "manual.pdf", "total_size": 5}
+
+
+def test_chunked_upload(client):
+    url = f"/testing-request/{client.post('/testing-request/').json()['id']}"
+    upload_id = client.post(f"{url}/uploads", json=UPLOAD).json()["upload_id"]
+
+    assert client.put(f"{url}/uploads/{upload_id}/chunks/0", content=b"hello").status_code == 200
+    response = client.post(f"{url}/uploads/{upload_id}/complete")
+    assert response.status_code == 200
+    assert response.json()["file"]["file_size"] == 5
+
+
+def test_unknown_request(client):
+    assert client.post("/testing-request/999999/uploads", json=UPLOAD).status_code == 404
+
+
+def test_expired_session(client):
+    url = f"/testing-request/{client.post('/testing-request/').json()['id']}"
+    upload_id = client.post(f"{url}/uploads", json=UPLOAD).json()["upload_id"]
+
+    manifest_path = resumable.SESSION_DIR / upload_id / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["created_at"] = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
+    manifest_path.write_text(json.dumps(manifest))
+
+    assert client.get(f"{url}/uploads/{upload_id}").status_code == 404
+    assert resumable.sweep_expired_sessions() == 1
+    assert not manifest_path.parent.exists()
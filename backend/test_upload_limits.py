@@ -0,0 +1,66 @@
+"""Request bodies over MAX_REQUEST_SIZE get a 413 before they are parsed or stored"""
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from core.uploads import RequestSizeLimitMiddleware
+from modules.document_store import resumable
+
+LIMIT = 64 * 1024
+
+
+@pytest.fixture
+def limited(client):
+    """The app behind a RequestSizeLimitMiddleware with a small limit"""
+    return TestClient(RequestSizeLimitMiddleware(client.app, max_size=LIMIT))
+
+
+def new_request(client):
+    return f"/testing-request/{client.post('/testing-request/').json()['id']}"
+
+
+def multipart(url, size):
+    """Headers and body of an upload-documents request with one `size`-byte file"""
+    request = httpx.Request(
+        "POST", f"http://testserver{url}/upload-documents",
+        files=[("files", ("manual.pdf", b"x" * size))], data={"doc_types": ["manual"]}
+    )
+    return {"content-type": request.headers["content-type"]}, request.read()
+
+
+def streamed(body, piece=4096):
+    """A body sent without Content-Length"""
+    return (body[start:start + piece] for start in range(0, len(body), piece))
+
+
+def test_upload_within_the_limit(client, limited):
+    url = new_request(client)
+    headers, body = multipart(url, 1000)
+    assert limited.post(f"{url}/upload-documents", headers=headers, content=body).status_code == 200
+    assert len(client.get(f"{url}/full").json()["documents"]) == 1
+
+
+def test_content_length_over_the_limit(client, limited):
+    url = new_request(client)
+    headers, body = multipart(url, LIMIT)
+    response = limited.post(f"{url}/upload-documents", headers=headers, content=body)
+    assert response.status_code == 413
+    assert client.get(f"{url}/full").json()["documents"] == []
+
+
+def test_streamed_body_over_the_limit(client, limited):
+    url = new_request(client)
+    headers, body = multipart(url, LIMIT)
+    response = limited.post(f"{url}/upload-documents", headers=headers, content=streamed(body))
+    assert response.status_code == 413
+    assert client.get(f"{url}/full").json()["documents"] == []
+
+
+def test_streamed_chunk_over_the_limit(client, limited):
+    url = new_request(client)
+    upload = {"doc_type": "manual", "file_name": "manual.pdf", "total_size": 2 * LIMIT, "chunk_size": 256 * 1024}
+    upload_id = client.post(f"{url}/uploads", json=upload).json()["upload_id"]
+
+    response = limited.put(f"{url}/uploads/{upload_id}/chunks/0", content=streamed(b"x" * 2 * LIMIT))
+    assert response.status_code == 413
+    assert client.get(f"{url}/uploads/{upload_id}").json()["received_chunks"] == []
+    assert list((resumable.SESSION_DIR / upload_id).glob("0.part*")) == []
@@ -38,6 +38,10 @@ export const saveCalibrationLabSelectionDraft = (id, data) =>
 export const submitCalibrationRequest = (id, data) =>
   api.post(`/calibration-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitCalibrationBundle = (id, data) =>
+  api.post(`/calibration-request/${id}/bundle`, data)
+
 export const fetchFullCalibrationRequest = (id) =>
   api.get(`/calibration-request/${id}/full`).then(res => res.data)
 
@@ -30,5 +30,9 @@ export const saveCertificationLabSelectionDraft = (id, data) =>
 export const submitCertificationRequest = (id, data) =>
   api.post(`/certification-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitCertificationBundle = (id, data) =>
+  api.post(`/certification-request/${id}/bundle`, data)
+
 export const fetchFullCertificationRequest = (id) =>
   api.get(`/certification-request/${id}/full`).then(res => res.data)
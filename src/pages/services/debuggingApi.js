@@ -30,5 +30,9 @@ export const saveDebuggingLabSelectionDraft = (id, data) =>
 export const submitDebuggingRequest = (id, data) =>
   api.post(`/debugging-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitDebuggingBundle = (id, data) =>
+  api.post(`/debugging-request/${id}/bundle`, data)
+
 export const fetchFullDebuggingRequest = (id) =>
   api.get(`/debugging-request/${id}/full`).then(res => res.data)
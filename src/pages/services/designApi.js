@@ -30,5 +30,9 @@ export const saveDesignLabSelectionDraft = (id, data) =>
 export const submitDesignRequest = (id, data) =>
     api.post(`/design-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitDesignBundle = (id, data) =>
+    api.post(`/design-request/${id}/bundle`, data)
+
 export const fetchFullDesignRequest = (id) =>
     api.get(`/design-request/${id}/full`).then(res => res.data)
@@ -30,5 +30,9 @@ export const saveSimulationLabSelectionDraft = (id, data) =>
 export const submitSimulationRequest = (id, data) =>
   api.post(`/simulation-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitSimulationBundle = (id, data) =>
+  api.post(`/simulation-request/${id}/bundle`, data)
+
 export const fetchFullSimulationRequest = (id) =>
   api.get(`/simulation-request/${id}/full`).then(res => res.data)
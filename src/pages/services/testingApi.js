@@ -30,5 +30,9 @@ export const saveLabSelectionDraft = (id, data) =>
 export const submitTestingRequest = (id, data) =>
   api.post(`/testing-request/${id}/submit`, data)
 
+// Save every step and submit in one transaction
+export const submitTestingBundle = (id, data) =>
+  api.post(`/testing-request/${id}/bundle`, data)
+
 export const fetchFullTestingRequest = (id) =>
   api.get(`/testing-request/${id}/full`).then(res => res.data)